@@ -4,7 +4,8 @@ from renglo.files.files_controller import FilesController
 from renglo.chat.chat_controller import ChatController
 from renglo.schd.schd_controller import SchdController
 
-from renglo.agent.agent_utilities import AgentUtilities
+from renglo.agent.agent_utilities import AgentUtilities, _build_tool_schema, _fast_loads, _fast_dumps_decimal, _PRE_PROCESS_SYSTEM_PROMPT, _PRE_PROCESS_RESPONSE_FORMAT
+from renglo.logger import get_logger
 
 
 from openai import OpenAI
@@ -21,6 +22,10 @@ from dataclasses import dataclass, field
 import time
 import uuid
 
+# Loop diagnostics go through the stdlib logger: %s formatting is lazy,
+# so large payload/workspace reprs are only built when DEBUG is on.
+logger = get_logger()
+
 @dataclass
 class RequestContext:
     """Request-scoped context for agent operations."""
@@ -145,142 +150,67 @@ class AgentCore:
                     'slots': a.get('slots', '')
                 }
             
-            # Get current workspace
+            # Get current workspace; resolve state once instead of
+            # re-chaining workspace.get('state', {}) per field
             workspace = self.AGU.get_active_workspace()
-            current_action = workspace.get('state', {}).get('action', '') if workspace else ''
-            last_belief = workspace.get('state', {}).get('belief', {}) if workspace else {}
-            belief_history = workspace.get('state', {}).get('history', []) if workspace else []
-                    
-            # Clean and prepare belief history if provided
-            cleaned_belief_history = self.AGU.sanitize(belief_history) if belief_history else []
-            pruned_belief_history = self.AGU.prune_history(cleaned_belief_history) if cleaned_belief_history else []
-            prompt_text = f"""
-            You are a comprehensive message processing module for a BDI agent. Your task is to process a user message through multiple stages in a single pass.
-
-            STAGE 1 - PERCEPTION AND INTERPRETATION:
-            Extract structured information from the raw message:
-            - Identify the user's intent
-            - Extract key entities mentioned
-            - Note any tools that might be needed
-            - For each entity detected, create a belief history entry with:
-            * type: "belief"
-            * key: entity name
-            * val: entity value
-            * time: current timestamp
-
-            STAGE 2 - INFORMATION PROCESSING:
-            Enrich and normalize the extracted information:
-            - Normalize values (e.g., convert "tomorrow" to full date)
-            - Add derived information
-            - Validate and standardize formats
-            - Compare available beliefs with the slots required by the matched action
-            - Identify missing beliefs by:
-            * Checking each required slot from the matched action
-            * Verifying if we have corresponding values in current beliefs
-            * Considering both exact matches and semantic equivalents
-            * Including slots that are required but not yet provided
-            - Track missing beliefs that are essential for completing the current task
-
-            STAGE 3 - FACT EXTRACTION:
-            From the belief history, extract the most up-to-date facts:
-            - Use the most recent value for each key
-            - Combine with newly extracted information
-            - Maintain chronological order
-
-            STAGE 4 - DESIRE DETECTION:
-            Analyze the combined information to determine the user's goal:
-            - Consider the current action: {current_action}
-            - Review the entire belief history to understand the ongoing conversation context
-            - Consider the chronological progression of user's statements and preferences
-            - Only change the previously detected desire if:
-            * The new message explicitly states a different intention
-            * The new message provides critical information that fundamentally changes the goal
-            * The user explicitly requests to change their previous intention
-            - If the new message only adds facts without changing intent, maintain the previous desire
-            - Summarize the user's desire in a natural language sentence
-            - Focus on the primary objective that has been consistent throughout the conversation
-
-            STAGE 5 - ACTION MATCHING:
-            Match the processed information with available actions:
-            - Consider the current action: {current_action}
-            - Only change the current action if:
-            * The new message explicitly requests a different action
-            * The new message's intent clearly conflicts with the current action
-            * The user explicitly states they want to do something else
-            - If the new message only adds information without changing intent:
-            * Keep the current action
-            * Use the message to fill missing slots
-            * Update any relevant beliefs
-            - Compare intent and beliefs with action descriptions
-            - Consider the full belief history when matching
-            - Select the most appropriate action
-            - Provide confidence score
-
-            Today's date is {current_time}
-
-            ### Available Actions:
-            {json.dumps(dict_actions, indent=2)}
-
-            ### Current Belief:
-            {json.dumps(last_belief, indent=2) if last_belief else "{}"}
-
-            ### Belief History:
-            {json.dumps(pruned_belief_history, indent=2) if pruned_belief_history else "[]"}
-
-            ### User Message:
-            {message}
-
-            Return a JSON object with the following structure:
-            {{
-                "perception": {{
-                    "intent": "string",
-                    "entities": {{}},
-                    "raw_text": "string",
-                    "needs_tools": []
-                }},
-                "processed_info": {{
-                    "enriched_entities": {{}},
-                    "missing_beliefs": [],
-                    "normalized_values": {{}}
-                }},
-                "facts": {{
-                    // Key-value pairs of extracted facts
-                }},
-                "desire": "string",
-                "action_match": {{
-                    "confidence": 0-100,
-                    "action": "string" // Use the key of the action,
-                    "reasoning": "string",
-                    "action_changed": boolean,
-                    "change_reason": "string"
-                }},
-                "belief_history_updates": [
-                    {{
-                        "type": "belief",
-                        "key": "string",
-                        "val": "any",
-                        "time": "ISO timestamp"
-                    }}
-                ]
-            }}
-
-            IMPORTANT RULES:
-            1. Always use the most recent value for each fact
-            2. Maintain all original information while enriching it
-            3. Provide clear reasoning for action matching
-            3b. Use the action key to indicate what action has been selected.
-            4. Return valid JSON with all strings properly quoted
-            5. For each new entity detected, create a belief history entry
-            6. Use the belief history to inform action matching
-            7. Include timestamps in ISO format for belief history entries
-            8. Consider historical context when matching actions
-            9. Only change the current action when explicitly requested or necessary
-            10. Use new information to fill missing slots in the current action
-            """
+            workspace_state = (workspace or {}).get('state') or {}
+            current_action = workspace_state.get('action', '')
+            last_belief = workspace_state.get('belief', {})
+
+            # Prefer the pruned view _mutate_belief_history maintains
+            # incrementally; documents that predate it fall back to the
+            # full sanitize+prune pass over the history.
+            pruned_belief_history = workspace_state.get('history_pruned')
+            if pruned_belief_history is not None:
+                pruned_belief_history = self.AGU.sanitize(pruned_belief_history)
+            else:
+                belief_history = workspace_state.get('history', [])
+                cleaned_belief_history = self.AGU.sanitize(belief_history) if belief_history else []
+                pruned_belief_history = self.AGU.prune_history(cleaned_belief_history) if cleaned_belief_history else []
+
+            # Sealed-prefix/recent-tail split maintained by
+            # _mutate_belief_history: only the tail block changes between
+            # turns, so the provider prompt cache keeps everything up to
+            # it. Documents without the split render an empty stable
+            # block and the whole pruned view as recent.
+            history_prefix = workspace_state.get('history_prefix')
+            history_tail = workspace_state.get('history_tail')
+            if history_prefix is None and history_tail is None:
+                history_prefix = []
+                history_tail = pruned_belief_history
+            else:
+                history_prefix = self.AGU.sanitize(history_prefix or [])
+                history_tail = self.AGU.sanitize(history_tail or [])
+            # The instruction scaffolding is the static module-level system
+            # prompt (built once at import); only the volatile context below
+            # is assembled per call.
+            user_content = f"""### Available Actions:
+{_fast_dumps_decimal(dict_actions)}
+
+Today's date is {current_time}
+
+### Current Action:
+{current_action}
+
+### Current Belief:
+{_fast_dumps_decimal(last_belief) if last_belief else "{}"}
+
+### Belief History (stable):
+{_fast_dumps_decimal(history_prefix) if history_prefix else "[]"}
+
+### Belief History (recent):
+{_fast_dumps_decimal(history_tail) if history_tail else "[]"}
+
+### User Message:
+{message}"""
             prompt = {
-                "model": self.AGU.AI_1_MODEL,
-                "messages": [{ "role": "user", "content": prompt_text}],
-                "temperature":0
+                "model": self.AGU.AI_SMALL_MODEL,
+                "messages": [
+                    { "role": "system", "content": _PRE_PROCESS_SYSTEM_PROMPT},
+                    { "role": "user", "content": user_content}
+                ],
+                "temperature":0,
+                "response_format": _PRE_PROCESS_RESPONSE_FORMAT
             }
             response = self.AGU.llm(prompt)
             
@@ -289,8 +219,9 @@ class AgentCore:
                 
             
             #print(f'PROCESS MESSAGE PROMPT >> {prompt}')
-            result = self.AGU.clean_json_response(response.content)
-            sanitized_result = self.AGU.sanitize(result)
+            # sanitized=True stringifies floats at decode time, so the
+            # parsed tree is clean without a second walk
+            sanitized_result = self.AGU.clean_json_response(response.content, sanitized=True)
             
             # Update workspace with the results
             if 'facts' in sanitized_result:
@@ -318,7 +249,7 @@ class AgentCore:
             }
             
         except Exception as e:
-            print(f"Error Pre-Processing message: {e}")
+            logger.error("Error Pre-Processing message: %s", e)
             # Only print raw response if it exists
             
             return {
@@ -334,7 +265,7 @@ class AgentCore:
         
         action = 'interpret'
         self.AGU.print_chat('Interpreting message...', 'text', connection_id=self._get_context().connection_id)
-        print('interpret')
+        logger.debug("interpret")
         
         try:
             # We get the message history directly from the source of truth to avoid missing tool id calls. 
@@ -358,33 +289,37 @@ class AgentCore:
             # Workspace
             workspace = self.AGU.get_active_workspace()
             
-            # Action  
-            current_action = workspace.get('state', {}).get('action', '') if workspace else ''
-            print(f'Current Action:{current_action}')
+            # Resolve state once instead of re-chaining
+            # workspace.get('state', {}) per field
+            workspace_state = (workspace or {}).get('state') or {}
+
+            # Action
+            current_action = workspace_state.get('action', '')
+            logger.debug("Current Action:%s", current_action)
             
-            action_instructions = '' 
+            action_instructions = ''
             action_tools = ''
             list_actions = self._get_context().list_actions
-            
-            for a in list_actions:
-                if a['key'] == current_action:
-                    action_instructions = a['prompt_3_reasoning_and_planning']
-                    if 'tools_reference' in a and a['tools_reference'] and a['tools_reference'] not in ['_','-','.']: 
-                        action_tools = a['tools_reference']
-                    break
+
+            matched_action = self.AGU.actions_by_key(list_actions).get(current_action)
+            if matched_action is not None:
+                action_instructions = matched_action['prompt_3_reasoning_and_planning']
+                tools_reference = matched_action.get('tools_reference')
+                if tools_reference and tools_reference not in ('_', '-', '.'):
+                    action_tools = tools_reference
 
             # Belief  
-            current_beliefs = workspace.get('state', {}).get('beliefs', {}) if workspace else {}
+            current_beliefs = workspace_state.get('beliefs', {})
             belief_str = 'Current beliefs: ' + self.AGU.string_from_object(current_beliefs)
-            print(f'Current Belief:{belief_str}')
+            logger.debug("Current Belief:%s", belief_str)
                 
             #belief_history = workspace.get('state', {}).get('history', []) if workspace else []             
             #cleaned_belief_history = self.sanitize(belief_history) if belief_history else []
             #pruned_belief_history = self.prune_history(cleaned_belief_history) if cleaned_belief_history else []
 
             # Desire
-            current_desire = workspace.get('state', {}).get('desire', '') if workspace else ''
-            print(f'Current Desire:{current_desire}')
+            current_desire = workspace_state.get('desire', '')
+            logger.debug("Current Desire:%s", current_desire)
             
             # Meta Instructions
             meta_instructions = {}
@@ -408,14 +343,15 @@ class AgentCore:
             for msg in message_list:      
                 messages.append(msg)       
                 
-            # Initialize approved_tools with default empty list
-            approved_tools = []
+            # Initialize approved_tools with default empty set
+            approved_tools = frozenset()
                 
             # Request asking the recommended tools for this action
             if action_tools and not no_tools:
                 messages.append({ "role": "system", "content":f'In case you need them, the following tools are recommended to execute this action: {json.dumps(action_tools)}'})  
                 
-                approved_tools = [tool.strip() for tool in action_tools.split(',')]
+                # Frozenset so the per-tool membership check below is O(1)
+                approved_tools = frozenset(tool.strip() for tool in action_tools.split(',') if tool.strip())
                     
             # Tools           
             '''   
@@ -436,66 +372,21 @@ class AgentCore:
             '''
             
             
-            if no_tools:                
-                list_tools = None      
-                   
-            else:         
+            if no_tools:
+                list_tools = None
+
+            else:
                 list_tools_raw = self._get_context().list_tools
-                
-                print(f'List Tools:{list_tools_raw}')
-                
-                list_tools = [] 
-                for t in list_tools_raw:
-                    
-                    if t.get('key') in approved_tools:
-                        # Parse the escaped JSON string into a Python object
-                        try:
-                            tool_input = json.loads(t.get('input', '[]'))
-                        except json.JSONDecodeError:
-                            print(f"Invalid JSON in tool input for tool {t.get('key', 'unknown')}. Using empty array.")
-                            tool_input = []
-                        
-                        dict_params = {}
-                        required_params = []
-                        
-                        # Handle new format: array of objects with name, hint, required
-                        if isinstance(tool_input, list):
-                            for param in tool_input:
-                                if isinstance(param, dict) and 'name' in param and 'hint' in param:
-                                    param_name = param['name']
-                                    param_hint = param['hint']
-                                    param_required = param.get('required', False)
-                                    
-                                    dict_params[param_name] = {
-                                        'type': 'string',
-                                        'description': param_hint
-                                    }
-                                    
-                                    if param_required:
-                                        required_params.append(param_name)
-                        # Handle old format for backward compatibility
-                        elif isinstance(tool_input, dict):
-                            for key, val in tool_input.items():
-                                dict_params[key] = {'type': 'string', 'description': val}
-                                required_params.append(key)
-                                
-                        print(f'Required parameters:{required_params}')
-                            
-                        tool = {
-                            'type': 'function',
-                            'function': {
-                                'name': t.get('key', ''),
-                                'description': t.get('goal', ''),
-                                'parameters': {
-                                    'type': 'object',
-                                    'properties': dict_params,
-                                    'required': required_params
-                                }
-                            }    
-                        }
-                        
-                        #print(f'Tool:{tool}')       
-                        list_tools.append(tool)          
+
+                logger.debug("List Tools:%s", list_tools_raw)
+
+                # Schemas are memoized per (key, goal, input) triple, so an
+                # unchanged tool definition skips the parse/assembly work.
+                list_tools = [
+                    _build_tool_schema(t.get('key', ''), t.get('goal', ''), t.get('input', '[]'))
+                    for t in list_tools_raw
+                    if t.get('key') in approved_tools
+                ]
                         #print(f'List Tools:{list_tools}')
                     
                     
@@ -550,7 +441,7 @@ class AgentCore:
             }
             
         except Exception as e:
-            print(f"Error in interpret() message: {e}")
+            logger.error("Error in interpret() message: %s", e)
             return {
                 'success': False,
                 'action': action,
@@ -578,29 +469,29 @@ class AgentCore:
             tool_name = plan['tool_calls'][0]['function']['name']
             params = plan['tool_calls'][0]['function']['arguments']
             if isinstance(params, str):
-                params = json.loads(params)
+                params = _fast_loads(params)
             tid = plan['tool_calls'][0]['id']
             
-            print(f'tid:{tid}')
+            logger.debug("tid:%s", tid)
 
             if not tool_name:
                 raise ValueError("❌ No tool name provided in tool selection")
                 
-            print(f"Selected tool: {tool_name}")
+            logger.debug("Selected tool: %s", tool_name)
             self.AGU.print_chat(f'Calling tool {tool_name} with parameters {params} ', 'text', connection_id=self._get_context().connection_id)
-            print(f"Parameters: {params}")
+            logger.debug("Parameters: %s", params)
 
             # Check if handler exists
             if tool_name not in list_handlers:
                 error_msg = f"❌ No handler found for tool '{tool_name}'"
-                print(error_msg)
+                logger.error("%s", error_msg)
                 self.AGU.print_chat(error_msg, 'text', connection_id=self._get_context().connection_id)
                 raise ValueError(error_msg)
             
             # Check if handler is an empty string
             if list_handlers[tool_name] == '':
                 error_msg = f"❌ Handler is empty"
-                print(error_msg)
+                logger.error("%s", error_msg)
                 self.AGU.print_chat(error_msg, 'text', connection_id=self._get_context().connection_id)
                 raise ValueError(error_msg)
                 
@@ -609,32 +500,37 @@ class AgentCore:
             parts = handler_route.split('/')
             if len(parts) != 2:
                 error_msg = f"❌ {tool_name} is not a valid tool."
-                print(error_msg)
+                logger.error("%s", error_msg)
                 self.AGU.print_chat(error_msg, 'text', connection_id=self._get_context().connection_id)
                 raise ValueError(error_msg)
             
 
             portfolio = self._get_context().portfolio
             org = self._get_context().org
-            
+
+            # Snapshot the parsed arguments before the context keys are
+            # added below; the workspace cache stores this instead of
+            # re-parsing the same JSON string a second time.
+            tool_input_obj = dict(params) if isinstance(params, dict) else params
+
             params['_portfolio'] = self._get_context().portfolio
             params['_org'] = self._get_context().org
             params['_entity_type'] = self._get_context().entity_type
             params['_entity_id'] = self._get_context().entity_id
             params['_thread'] = self._get_context().thread
             
-            print(f'Calling {handler_route} ') 
+            logger.debug("Calling %s", handler_route)
             
             response = self.SHC.handler_call(portfolio,org,parts[0],parts[1],params)
             
-            print(f'Handler response:{response}')
+            logger.debug("Handler response:%s", response)
 
             if not response['success']:
                 return {'success':False,'action':action,'input':params,'output':response}
 
             # The response of every handler always comes nested 
             clean_output = response['output']
-            clean_output_str = json.dumps(clean_output, cls=DecimalEncoder)
+            clean_output_str = _fast_dumps_decimal(clean_output)
             
             interface = None
             
@@ -663,12 +559,12 @@ class AgentCore:
                 
                 
             
-            print(f'flag3')
+            logger.debug("flag3")
             
             # Results coming from the handler
             self._update_context(execute_intention_results=tool_out)
             
-            print(f'flag4')
+            logger.debug("flag4")
             
             # Save handler result to workspace
             
@@ -676,17 +572,16 @@ class AgentCore:
             # Into a string like this one: "4/16:00/2026-06-04"
             # If the value of each key is not a string just output an empty space in its place
             #params_str = self.format_object_to_slash_string(params)
-            index = f'irn:tool_rs:{handler_route}' 
-            tool_input = plan['tool_calls'][0]['function']['arguments'] 
-            #input is a serialize json, you need to turn it into a python object before inserting it into the value dictionary
-            tool_input_obj = json.loads(tool_input) if isinstance(tool_input, str) else tool_input
+            index = f'irn:tool_rs:{handler_route}'
+            # tool_input_obj was captured above from the already-parsed
+            # arguments, so the payload is not decoded twice.
             value = {'input': tool_input_obj, 'output': clean_output}
             self.AGU.mutate_workspace({'cache': {index:value}}, public_user=self._get_context().public_user, workspace_id=self._get_context().workspace_id)
             
-            print(f'flag5')
+            logger.debug("flag5")
             
             #print(f'message output: {tool_out}')
-            print("✅ Tool execution complete.")
+            logger.debug("Tool execution complete.")
             
             return {"success": True, "action": action, "input": plan, "output": tool_out}
                     
@@ -694,7 +589,7 @@ class AgentCore:
 
             error_msg = f"❌ Execute Intention failed. @act trying to run tool:'{tool_name}': {str(e)}"
             self.AGU.print_chat(error_msg,'text', connection_id=self._get_context().connection_id) 
-            print(error_msg)
+            logger.error("%s", error_msg)
             self._update_context(execute_intention_error=error_msg)
             
             error_result = {
@@ -768,8 +663,8 @@ class AgentCore:
     def run(self,payload):
         # Initialize a new request context
         action = 'run > agent_core'
-        print(f'Running: {action}')
-        print(f'Payload: {payload}')  
+        logger.debug("Running: %s", action)
+        logger.debug("Payload: %s", payload)
         
         context = RequestContext()
         
@@ -858,7 +753,7 @@ class AgentCore:
             loop_limit = 6
             while loops < loop_limit:
                 loops = loops + 1
-                print(f'Loop iteration {loops}/{loop_limit}')
+                logger.debug("Loop iteration %s/%s", loops, loop_limit)
                 
                 # Step 1: Interpret. We receive the message from the user and we issue a tool command or another message       
                 response_1 = self.interpret()
@@ -901,7 +796,7 @@ class AgentCore:
             
             
             # If we reach here, we hit the loop limit
-            print(f'Warning: Reached maximum loop limit ({loop_limit})')
+            logger.warning("Reached maximum loop limit (%s)", loop_limit)
             #self.print_chat(f'🤖⚠️  Can you re-formulate your request please?','text')
             return {'success':True,'action':action,'input':payload,'output':results}
                     
@@ -3,11 +3,35 @@ from renglo.files.files_controller import FilesController
 from renglo.chat.chat_controller import ChatController
 from renglo.schd.schd_controller import SchdController
 from renglo.agent.websocket_client import WebSocketClient
+from renglo.logger import get_logger
 
+import httpx
 from openai import OpenAI
 
+# Optional Rust JSON encoder (install with the 'speed' extra); the
+# library works identically without it, just on the stdlib encoder.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# HTTP/2 support is optional too (httpx needs the h2 package, also in
+# the 'speed' extra); without it the client stays on HTTP/1.1.
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+import hashlib
+import logging
 import random
 import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime
 from typing import List, Dict, Any, Callable
 import re
@@ -22,27 +46,350 @@ class DecimalEncoder(json.JSONEncoder):
         return super(DecimalEncoder, self).default(obj)
 
 
-class AgentUtilities:
-    _MUTATE_WORKSPACE_HANDLED_KEYS = {
-        'belief',
-        'desire',
-        'intent',
-        'belief_history',
-        'cache',
-        'is_active',
-        'action',
-        'follow_up',
-        'slots',
-        'plan',
-        'change_review',
-        'plan_commit_pending',
-        'agent_quotes_protocol_state',
-        'new_state_machine',
-        'replace_state_machine',
-        'step_state',
-        'plan_state',
-        'action_log',
+# Message types that are OK to show to the LLM
+_LLM_VISIBLE_TYPES = frozenset({'user', 'consent', 'system', 'text', 'tool_rq', 'tool_rs'})
+
+# Hot paths log through the stdlib logger so diagnostics can be silenced
+# with a level change instead of paying for string interpolation per call.
+logger = get_logger()
+
+# Shared decoder for the hot tool_rs content path
+_JSON_DECODER = json.JSONDecoder()
+
+# Decoder that stringifies floats at parse time — the same conversion
+# sanitize() applies — so trees parsed with it are clean by construction
+# and need no second walk.
+_SANITIZED_DECODER = json.JSONDecoder(parse_float=str)
+
+# One LLM pool per process, shared by every AgentUtilities instance: under
+# multi-user load the concurrent requests coalesce onto a single bounded set
+# of workers (and warm connections) instead of each request spinning up its
+# own, which is what caps in-flight completions the way a batching queue would.
+_LLM_EXECUTOR = None
+_LLM_EXECUTOR_LOCK = threading.Lock()
+
+# One OpenAI client (and HTTP connection pool) per API key per process.
+# The client is thread safe, so concurrent users share its keep-alive
+# connections instead of each paying TCP+TLS setup on a private pool.
+_OPENAI_CLIENTS = {}
+_OPENAI_CLIENTS_LOCK = threading.Lock()
+
+
+def _shared_llm_executor():
+    global _LLM_EXECUTOR
+    if _LLM_EXECUTOR is None:
+        with _LLM_EXECUTOR_LOCK:
+            if _LLM_EXECUTOR is None:
+                _LLM_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix='agent-llm')
+    return _LLM_EXECUTOR
+
+# Leaf types that never need sanitizing; whole branches of these are skipped.
+# Exact-type membership (not isinstance) so the check is one set lookup.
+_SANITIZE_CLEAN_TYPES = frozenset({str, int, bool, type(None)})
+
+
+def _sanitize_decimal(value):
+    """Decimal to int when whole, float otherwise (DynamoDB convention)."""
+    return int(value) if value % 1 == 0 else float(value)
+
+
+# Exact-type dispatch for the scalars sanitize actually converts
+_SANITIZE_SCALARS = {Decimal: _sanitize_decimal, float: str}
+
+
+def _sanitize_scalar_list(values):
+    """
+    Convert a flat (container-free) list of scalars in one tight pass —
+    the common shape for numeric arrays like belief metrics, where the
+    generic walk's stack/copy machinery is pure overhead.
+    """
+    out = []
+    append = out.append
+    for value in values:
+        converter = _SANITIZE_SCALARS.get(type(value))
+        if converter is not None:
+            append(converter(value))
+        elif isinstance(value, Decimal):
+            append(_sanitize_decimal(value))
+        elif isinstance(value, float):
+            append(str(value))
+        else:
+            append(value)
+    return out
+
+# Fixup patterns for clean_json_response, compiled once at import. The
+# unquoted-key variants (object start / after comma / after newline) are
+# folded into one alternation so the string is scanned once per fixup.
+_JSON_COMMENT_RE = re.compile(r'//.*?$|/\*.*?\*/', re.MULTILINE | re.DOTALL)
+_UNQUOTED_KEY_RE = re.compile(r'(^\s*{\s*|[,\n]\s*)(\w+)(\s*:)')
+_SINGLE_QUOTE_KEY_RE = re.compile(r"([{,]\s*)'(\w+)'(\s*:)")
+_SINGLE_QUOTE_VAL_RE = re.compile(r":\s*'([^']*)'")
+_BOOL_SPACE_RE = re.compile(r':\s+(true|false|True|False)')
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+_BRACKET_TS_RE = re.compile(r'\[\d+\]\s*')
+_RAW_FIELD_RE = re.compile(r'"raw":\s*({[^}]+})')
+
+
+def _fast_dumps(obj):
+    """
+    Serialize already-sanitized data with orjson when it is installed,
+    falling back to stdlib json. Only safe for JSON-native trees (run
+    sanitize first); orjson has no hook for Decimal.
+    """
+    if _orjson is not None:
+        return _orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _fast_loads(text):
+    """
+    Parse JSON with orjson when installed, stdlib json otherwise.
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing
+    except clauses keep working either way.
+    """
+    if _orjson is not None:
+        return _orjson.loads(text)
+    return json.loads(text)
+
+
+def _decimal_default(obj):
+    """orjson hook mirroring DecimalEncoder's Decimal handling."""
+    if isinstance(obj, Decimal):
+        return int(obj) if obj % 1 == 0 else float(obj)
+    raise TypeError
+
+
+def _fast_dumps_decimal(obj):
+    """Like _fast_dumps but tolerates Decimals (DynamoDB numbers)."""
+    if _orjson is not None:
+        return _orjson.dumps(obj, default=_decimal_default).decode()
+    return json.dumps(obj, cls=DecimalEncoder)
+
+
+def _normalize_tool_content(content):
+    """
+    Parse a tool_rs content string the way ChatController.update_turn does:
+    a dict becomes a single-element list, a list of dicts stays as-is, and
+    anything else (including unparseable strings) keeps the original value.
+
+    Returns the original string unchanged when no normalization applies, so
+    callers can use an identity check to skip copying.
+    """
+    try:
+        parsed = _JSON_DECODER.decode(content)
+    except (json.JSONDecodeError, TypeError):
+        return content
+    if isinstance(parsed, dict):
+        return [parsed]
+    if isinstance(parsed, list) and all(isinstance(item, dict) for item in parsed):
+        return parsed
+    return content
+
+
+@lru_cache(maxsize=256)
+def _build_tool_schema(key, goal, input_json):
+    """
+    Assemble the OpenAI function-calling schema for one tool. Pure in its
+    three string arguments, so the result is memoized: tool definitions
+    rarely change between turns, and repeat calls skip the JSON parse and
+    parameter assembly entirely. Callers must treat the returned dict as
+    read-only (sanitize is copy-on-change, so the LLM path already does).
+    """
+    try:
+        tool_input = _fast_loads(input_json)
+    except json.JSONDecodeError:
+        logger.error("Invalid JSON in tool input for tool %s. Using empty array.", key or 'unknown')
+        tool_input = []
+
+    dict_params = {}
+    required_params = []
+
+    # Handle new format: array of objects with name, hint, required
+    if isinstance(tool_input, list):
+        for param in tool_input:
+            if isinstance(param, dict) and 'name' in param and 'hint' in param:
+                dict_params[param['name']] = {
+                    'type': 'string',
+                    'description': param['hint']
+                }
+                if param.get('required', False):
+                    required_params.append(param['name'])
+    # Handle old format for backward compatibility
+    elif isinstance(tool_input, dict):
+        for param_key, val in tool_input.items():
+            dict_params[param_key] = {'type': 'string', 'description': val}
+            required_params.append(param_key)
+
+    return {
+        'type': 'function',
+        'function': {
+            'name': key,
+            'description': goal,
+            'parameters': {
+                'type': 'object',
+                'properties': dict_params,
+                'required': required_params
+            }
+        }
+    }
+
+
+# Sentinel distinguishing "key absent" from "value is None"
+_MISSING = object()
+
+# Static scaffolding for pre_process_message, defined once at import.
+# Keeping every volatile value (time, action, beliefs, message) out of
+# this block gives the provider a byte-identical prompt prefix each
+# turn, so server-side prompt caching can hit on the multi-KB prose.
+_PRE_PROCESS_SYSTEM_PROMPT = """You are a comprehensive message processing module for a BDI agent. Your task is to process a user message through multiple stages in a single pass. The current action, beliefs, belief history and user message are provided in the user content.
+
+STAGE 1 - PERCEPTION AND INTERPRETATION:
+Extract structured information from the raw message:
+- Identify the user's intent
+- Extract key entities mentioned
+- Note any tools that might be needed
+- For each entity detected, create a belief history entry with:
+* type: "belief"
+* key: entity name
+* val: entity value
+* time: current timestamp
+
+STAGE 2 - INFORMATION PROCESSING:
+Enrich and normalize the extracted information:
+- Normalize values (e.g., convert "tomorrow" to full date)
+- Add derived information
+- Validate and standardize formats
+- Compare available beliefs with the slots required by the matched action
+- Identify missing beliefs by:
+* Checking each required slot from the matched action
+* Verifying if we have corresponding values in current beliefs
+* Considering both exact matches and semantic equivalents
+* Including slots that are required but not yet provided
+- Track missing beliefs that are essential for completing the current task
+
+STAGE 3 - FACT EXTRACTION:
+From the belief history, extract the most up-to-date facts:
+- Use the most recent value for each key
+- Combine with newly extracted information
+- Maintain chronological order
+
+STAGE 4 - DESIRE DETECTION:
+Analyze the combined information to determine the user's goal:
+- Consider the current action given in the user content
+- Review the entire belief history to understand the ongoing conversation context
+- Consider the chronological progression of user's statements and preferences
+- Only change the previously detected desire if:
+* The new message explicitly states a different intention
+* The new message provides critical information that fundamentally changes the goal
+* The user explicitly requests to change their previous intention
+- If the new message only adds facts without changing intent, maintain the previous desire
+- Summarize the user's desire in a natural language sentence
+- Focus on the primary objective that has been consistent throughout the conversation
+
+STAGE 5 - ACTION MATCHING:
+Match the processed information with available actions:
+- Consider the current action given in the user content
+- Only change the current action if:
+* The new message explicitly requests a different action
+* The new message's intent clearly conflicts with the current action
+* The user explicitly states they want to do something else
+- If the new message only adds information without changing intent:
+* Keep the current action
+* Use the message to fill missing slots
+* Update any relevant beliefs
+- Compare intent and beliefs with action descriptions
+- Consider the full belief history when matching
+- Select the most appropriate action
+- Provide confidence score
+
+IMPORTANT RULES:
+1. Always use the most recent value for each fact
+2. Maintain all original information while enriching it
+3. Provide clear reasoning for action matching
+3b. Use the action key to indicate what action has been selected.
+4. For each new entity detected, create a belief history entry
+5. Use the belief history to inform action matching
+6. Include timestamps in ISO format for belief history entries
+7. Consider historical context when matching actions
+8. Only change the current action when explicitly requested or necessary
+9. Use new information to fill missing slots in the current action"""
+
+# Provider-native structured output for pre_process_message: the shape
+# that used to be spelled out in ~500 tokens of prompt prose now rides
+# in response_format, so the model decodes against the schema instead
+# of imitating an example. strict mode is off because facts, entities
+# and the enrichment maps are open-keyed objects, which strict mode
+# cannot express (it demands additionalProperties: false everywhere);
+# clean_json_response remains downstream as the safety net.
+_PRE_PROCESS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "pre_process_message",
+        "strict": False,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "perception": {
+                    "type": "object",
+                    "properties": {
+                        "intent": {"type": "string"},
+                        "entities": {"type": "object"},
+                        "raw_text": {"type": "string"},
+                        "needs_tools": {"type": "array", "items": {"type": "string"}}
+                    },
+                    "required": ["intent", "entities", "raw_text", "needs_tools"]
+                },
+                "processed_info": {
+                    "type": "object",
+                    "properties": {
+                        "enriched_entities": {"type": "object"},
+                        "missing_beliefs": {"type": "array", "items": {"type": "string"}},
+                        "normalized_values": {"type": "object"}
+                    },
+                    "required": ["enriched_entities", "missing_beliefs", "normalized_values"]
+                },
+                "facts": {
+                    "type": "object",
+                    "description": "Key-value pairs of extracted facts"
+                },
+                "desire": {"type": "string"},
+                "action_match": {
+                    "type": "object",
+                    "properties": {
+                        "confidence": {"type": "number", "minimum": 0, "maximum": 100},
+                        "action": {"type": "string", "description": "The key of the selected action"},
+                        "reasoning": {"type": "string"},
+                        "action_changed": {"type": "boolean"},
+                        "change_reason": {"type": "string"}
+                    },
+                    "required": ["confidence", "action", "reasoning", "action_changed", "change_reason"]
+                },
+                "belief_history_updates": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "type": {"type": "string", "const": "belief"},
+                            "key": {"type": "string"},
+                            "val": {},
+                            "time": {"type": "string", "description": "ISO timestamp"}
+                        },
+                        "required": ["type", "key", "val", "time"]
+                    }
+                }
+            },
+            "required": [
+                "perception", "processed_info", "facts", "desire",
+                "action_match", "belief_history_updates"
+            ]
+        }
     }
+}
+
+
+class AgentUtilities:
+    _ACTION_LOG_KEYS = ('tool', 'status', 'nonce', 'message', 'type', 'actionable')
+
     _MUTATE_WORKSPACE_RESERVED_KEYS = {
         '_id',
         'portfolio',
@@ -83,30 +430,302 @@ class AgentUtilities:
         self.thread = thread
         self.chat_id = None
         self.connection_id = connection_id
-        
-        # OpenAI Client
-        try:    
-            openai_key = self.config.get('OPENAI_API_KEY', '')
-            self.AI_1 = OpenAI(api_key=openai_key)
-            self.AI_2 = OpenAI(api_key=openai_key)
-            print(f"OpenAI client initialized")
-        except Exception as e:
-            print(f"Error initializing OpenAI client: {e}")
-            self.AI_1 = None
-            self.AI_2 = None
+
+        # Config values resolved once; the heavyweight clients and
+        # controllers below are created lazily on first use so callers
+        # that only need e.g. sanitize() or print_chat() don't pay for
+        # all of them (short-lived Lambda invocations in particular).
+        self._openai_key = self.config.get('OPENAI_API_KEY', '')
+        self._websocket_url = self.config.get('WEBSOCKET_CONNECTIONS', '')
+        self._callback_msg_handler = self.config.get('CALLBACK_MSG_HANDLER', False)
+        self._callback_msg_handler_parts = (
+            self._callback_msg_handler.split('/') if self._callback_msg_handler else None
+        )
 
         self.AI_1_MODEL = "gpt-3.5-turbo"  # Baseline model. Good for multi-step chats
         self.AI_2_MODEL = "gpt-4o-mini"    # This model is not very smart
-        
-        # Initialize controllers
-        self.DAC = DataController(config=self.config)
-        self.FCC = FilesController(config=self.config)
-        self.CHC = ChatController(config=self.config)
-        self.SHC = SchdController(config=self.config)
-        
-        # Initialize WebSocket client
-        websocket_url = self.config.get('WEBSOCKET_CONNECTIONS', '')
-        self.ws_client = WebSocketClient(websocket_url)
+        # Cheap extractor model for the structured pre-process stage —
+        # slot filling and action matching don't need the conversational
+        # baseline. Deployments can override it through config.
+        self.AI_SMALL_MODEL = self.config.get('AI_SMALL_MODEL', self.AI_2_MODEL)
+
+        # Lazily-initialized controllers, clients and helpers
+        self._AI = None
+        self._chat_create = None
+        self._DAC = None
+        self._FCC = None
+        self._CHC = None
+        self._SHC = None
+        self._ws_client = None
+
+        # Small shared pool used to overlap independent blocking I/O calls
+        # (e.g. message-history and workspace fetches before an LLM call).
+        self._io_executor = None
+
+        # Pool used by llm_batch to overlap independent LLM round trips
+        self._llm_executor = None
+
+        # Micro-buffer for WebSocket sends (see ws_batch)
+        self._ws_buffer = None
+        self._ws_batch_depth = 0
+
+        # Single-worker queue for fire-and-forget chat writes; one worker
+        # keeps the writes ordered. Reads drain the queue first.
+        self._write_executor = None
+        self._pending_writes = []
+
+        # Short-lived read caches for list_turns/list_workspaces, keyed by the
+        # thread coordinates. Multi-step agent turns re-read the same thread
+        # several times; every write path invalidates the matching cache.
+        self._turns_cache = {}
+        self._workspaces_cache = {}
+
+        # Exact-match response cache for deterministic (temperature 0) LLM
+        # calls; a repeat of the same params skips the network round trip.
+        self._llm_cache = OrderedDict()
+
+        # dict_actions derived from list_actions, keyed by the action-key
+        # fingerprint — the action list is stable across a conversation.
+        self._dict_actions_cache = {}
+
+        # Memoized step_id -> step indexes for get_or_create_step, keyed
+        # by the identity of the steps list they were built from.
+        self._step_index_cache = {}
+
+        # Memoized tool key -> handler route maps for act(), keyed the
+        # same way — the tool list is stable across a conversation.
+        self._list_handlers_cache = {}
+
+        # Memoized action key -> action indexes for interpret(), ditto.
+        self._actions_by_key_cache = {}
+
+        # Opt-in semantic cache for pre_process_message: paraphrases of a
+        # message hit when their embedding similarity clears the
+        # configured threshold (e.g. 0.92). Disabled unless the config
+        # sets SEMANTIC_CACHE_THRESHOLD, since a near-miss returns a
+        # slightly wrong interpretation rather than a slow one.
+        try:
+            self._semantic_cache_threshold = float(
+                self.config.get('SEMANTIC_CACHE_THRESHOLD', 0) or 0
+            )
+        except (TypeError, ValueError):
+            self._semantic_cache_threshold = 0.0
+        self._semantic_cache = {}
+
+    _READ_CACHE_TTL_SECONDS = 5.0
+    _LLM_CACHE_MAX_ENTRIES = 1024
+    _HISTORY_TAIL_MAX = 16
+    _SEMANTIC_CACHE_MAX_ENTRIES = 128
+    _SEMANTIC_CACHE_TTL_SECONDS = 600.0
+    _SEMANTIC_EMBED_MODEL = 'text-embedding-3-small'
+
+    def _new_openai_client(self):
+        try:
+            # One client (and one connection pool) serves every model; the
+            # model is a per-request parameter. Size the pool explicitly so
+            # bursty traffic reuses keep-alive connections, and multiplex
+            # over HTTP/2 when the optional h2 package is installed so
+            # concurrent llm_batch calls share one TLS stream. Shared
+            # per process (see _OPENAI_CLIENTS) so concurrent instances
+            # don't each build their own pool.
+            client = _OPENAI_CLIENTS.get(self._openai_key)
+            if client is None:
+                with _OPENAI_CLIENTS_LOCK:
+                    client = _OPENAI_CLIENTS.get(self._openai_key)
+                    if client is None:
+                        client = OpenAI(
+                            api_key=self._openai_key,
+                            http_client=httpx.Client(
+                                http2=_HTTP2_AVAILABLE,
+                                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+                            ),
+                        )
+                        _OPENAI_CLIENTS[self._openai_key] = client
+                        logger.debug("OpenAI client initialized")
+            return client
+        except Exception as e:
+            logger.error("Error initializing OpenAI client: %s", e)
+            return None
+
+    @property
+    def AI(self):
+        if self._AI is None:
+            self._AI = self._new_openai_client()
+        return self._AI
+
+    @property
+    def chat_create(self):
+        """
+        chat.completions.create bound once: resolving it walks several
+        cached properties on the client, so hot callers reuse the bound
+        method and pick the model per request.
+        """
+        if self._chat_create is None:
+            client = self.AI
+            if client is None:
+                return None
+            self._chat_create = client.chat.completions.create
+        return self._chat_create
+
+    # Historical aliases: AI_1/AI_2 used to be two identically-configured
+    # clients. They now share the single pooled client above.
+    @property
+    def AI_1(self):
+        return self.AI
+
+    @property
+    def AI_2(self):
+        return self.AI
+
+    @property
+    def DAC(self):
+        if self._DAC is None:
+            self._DAC = DataController(config=self.config)
+        return self._DAC
+
+    @property
+    def FCC(self):
+        if self._FCC is None:
+            self._FCC = FilesController(config=self.config)
+        return self._FCC
+
+    @property
+    def CHC(self):
+        if self._CHC is None:
+            self._CHC = ChatController(config=self.config)
+        return self._CHC
+
+    @property
+    def SHC(self):
+        if self._SHC is None:
+            self._SHC = SchdController(config=self.config)
+        return self._SHC
+
+    @property
+    def ws_client(self):
+        if self._ws_client is None:
+            self._ws_client = WebSocketClient(self._websocket_url)
+        return self._ws_client
+
+    @property
+    def io_executor(self):
+        if self._io_executor is None:
+            self._io_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='agent-io')
+        return self._io_executor
+
+    @property
+    def write_executor(self):
+        if self._write_executor is None:
+            self._write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='agent-write')
+        return self._write_executor
+
+    @property
+    def llm_executor(self):
+        # Dedicated pool for concurrent LLM calls; the worker count caps
+        # in-flight requests the way a semaphore would. Separate from
+        # io_executor so a batch of slow completions can't starve the
+        # quick history/workspace fetches. Process-wide (see
+        # _shared_llm_executor) so the cap holds across concurrent users.
+        if self._llm_executor is None:
+            self._llm_executor = _shared_llm_executor()
+        return self._llm_executor
+
+    def llm_batch(self, prompts):
+        """
+        Run several independent llm() prompts concurrently and return their
+        results in prompt order. Wall-clock time approaches the slowest
+        single call instead of the sum; failures surface as False per slot
+        just like llm() itself.
+
+        Args:
+            prompts (list): List of prompt dicts as accepted by llm()
+
+        Returns:
+            list: One llm() result per prompt, in order
+        """
+        if not prompts:
+            return []
+        if len(prompts) == 1:
+            return [self.llm(prompts[0])]
+        futures = [self.llm_executor.submit(self.llm, prompt) for prompt in prompts]
+        return [future.result() for future in futures]
+
+    def _drain_pending_writes(self):
+        """Wait for queued fire-and-forget writes before a dependent read."""
+        if not self._pending_writes:
+            return
+        pending, self._pending_writes = self._pending_writes, []
+        for future in pending:
+            try:
+                future.result()
+            except Exception as e:
+                logger.error("Background chat write failed: %s", e)
+
+    def _thread_cache_key(self):
+        return (self.portfolio, self.org, self.entity_type, self.entity_id, self.thread)
+
+    def _cached_list_turns(self):
+        self._drain_pending_writes()
+        key = self._thread_cache_key()
+        hit = self._turns_cache.get(key)
+        now = time.monotonic()
+        if hit and now - hit[0] < self._READ_CACHE_TTL_SECONDS:
+            return hit[1]
+        response = self.CHC.list_turns(
+            self.portfolio,
+            self.org,
+            self.entity_type,
+            self.entity_id,
+            self.thread,
+            False,
+        )
+        if isinstance(response, dict) and response.get('success'):
+            self._turns_cache[key] = (now, response)
+        return response
+
+    def _cached_list_workspaces(self):
+        key = self._thread_cache_key()
+        hit = self._workspaces_cache.get(key)
+        now = time.monotonic()
+        if hit and now - hit[0] < self._READ_CACHE_TTL_SECONDS:
+            return hit[1]
+        response = self.CHC.list_workspaces(
+            self.portfolio,
+            self.org,
+            self.entity_type,
+            self.entity_id,
+            self.thread
+        )
+        if isinstance(response, dict) and response.get('success'):
+            self._workspaces_cache[key] = (now, response)
+        return response
+
+    def _invalidate_turns_cache(self):
+        self._turns_cache.pop(self._thread_cache_key(), None)
+
+    def _invalidate_workspaces_cache(self):
+        self._workspaces_cache.pop(self._thread_cache_key(), None)
+
+    @contextmanager
+    def ws_batch(self):
+        """
+        Buffer print_chat WebSocket sends and flush them in one burst on exit.
+
+        Keeps the WebSocket traffic off the DB-write critical path when a
+        single logical turn emits several chat updates. Nested batches
+        flush once at the outermost exit; messages keep their order.
+        """
+        if self._ws_buffer is None:
+            self._ws_buffer = []
+        self._ws_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._ws_batch_depth -= 1
+            if self._ws_batch_depth == 0:
+                buffered, self._ws_buffer = self._ws_buffer, None
+                for connection_id, doc in buffered:
+                    self.ws_client.send_message(connection_id, doc)
 
     def get_message_history(self,filter={}):
         """
@@ -121,84 +740,74 @@ class AgentUtilities:
         action = 'get_message_history'
         
         try:
-            print(f'type: {self.entity_type}')
-            print(f'entity_id: {self.entity_id}')
-            print(f'thread: {self.thread}')
-            print(f'filter: {filter}')
+            logger.debug("type: %s", self.entity_type)
+            logger.debug("entity_id: %s", self.entity_id)
+            logger.debug("thread: %s", self.thread)
+            logger.debug("filter: %s", filter)
             
             
             apply_filter = False
             filter_param = None
             filter_value = None
             
-            if filter and 'param' in filter and 'begins_with' in filter:
-                filter_param = filter['param']
-                filter_value = filter['begins_with']
-                apply_filter = True
+            if filter:
+                filter_param = filter.get('param')
+                filter_value = filter.get('begins_with')
+                apply_filter = filter_param is not None and filter_value is not None
                     
         
             # Thread was not included, create a new one?
             if not self.thread:
                 return {'success': False, 'action': action, 'input': filter, 'output': 'Error: No thread provided'}
                 
-            response = self.CHC.list_turns(
-                self.portfolio,
-                self.org,
-                self.entity_type,
-                self.entity_id,
-                self.thread,
-                False,
-            )
-             
+            response = self._cached_list_turns()
+
             if 'success' not in response:
-                print(f'Something failed during message list: {response}')
+                logger.warning("Something failed during message list: %s", response)
                 return {'success': False, 'action': action, 'input': filter, 'output': response}
             
             # Prepare messages to look like an OpenAI message array
-            # Also remove messages that don't belong to an approved type
-            message_list = []
-            for turn in response['items']: 
-                for m in turn['messages']:
-                    
-                    if apply_filter:
-                        #print(f'Applying filter in message:{m}')
-                        # Check if filter_param exists in message
-                        if filter_param not in m or m[filter_param] is None:
-                            #print('Param did not exist, filter out')
-                            continue
-                        # Convert to string for comparison and check if value begins with filter_value
-                        param_value = str(m[filter_param])
-                        if not param_value.startswith(filter_value):
-                            #print(f'{param_value} does not begin with:{filter_value}, filter out')
-                            continue
-                        
-                        print(f'Include in filtered results')
-
-                    
-                    out_message = m['_out']
-                    if m['_type'] in ['user', 'consent', 'system', 'text', 'tool_rq', 'tool_rs']:  # OK to show to LLM
-                        message_list.append(out_message)      
+            # Also remove messages that don't belong to an approved type.
+            # Shallow-copy each _out so downstream in-place edits (e.g. clearing
+            # tool content) don't mutate the cached turn documents.
+            message_list = [
+                dict(m['_out'])
+                for turn in response['items']
+                for m in turn['messages']
+                if m['_type'] in _LLM_VISIBLE_TYPES
+                and (not apply_filter
+                     or (m.get(filter_param) is not None
+                         and str(m[filter_param]).startswith(filter_value)))
+            ]
             
             return {'success': True, 'action': action, 'input': filter, 'output': message_list}
         
         except Exception as e:
-            print(f'Get message history failed: {str(e)}')
+            logger.error("Get message history failed: %s", str(e))
             return {'success': False, 'action': action, 'input': filter, 'output': f'Error: {str(e)}'}
 
-    def update_chat_message_document(self, update, call_id=False):
+    def update_chat_message_document(self, update, call_id=False, fire_and_forget=False):
         """
         Update a chat message document.
-        
+
         Args:
             update (dict): The update to apply
             call_id (bool): Whether to use call_id
-            
+            fire_and_forget (bool): Queue the write on the background worker
+                and return immediately; reads drain the queue first
+
         Returns:
             dict: Success status and response
         """
         action = 'update_chat_message_document'
-        print(f'Running: {action}')
-        
+        logger.debug("Running: %s", action)
+
+        if fire_and_forget:
+            future = self.write_executor.submit(self.update_chat_message_document, update, call_id)
+            self._pending_writes.append(future)
+            self._invalidate_turns_cache()
+            return {'success': True, 'action': action, 'input': update, 'output': 'queued'}
+
         try:
             response = self.CHC.update_turn(
                 self.portfolio,
@@ -210,15 +819,61 @@ class AgentUtilities:
                 update,
                 call_id=call_id
             )
-            
+
+            self._invalidate_turns_cache()
+
             if 'success' not in response:
-                print(f'Something failed during update chat message {response}')
+                logger.warning("Something failed during update chat message %s", response)
                 return {'success': False, 'action': action, 'input': update, 'output': response}
             
             return {'success': True, 'action': action, 'input': update, 'output': response}
         
         except Exception as e:
-            print(f'Update chat message failed: {str(e)}')
+            logger.error("Update chat message failed: %s", str(e))
+            return {'success': False, 'action': action, 'output': f'Error: {str(e)}'}
+
+    def update_chat_message_documents(self, updates, fire_and_forget=False):
+        """
+        Append several chat message documents in one backend write.
+
+        Args:
+            updates (list): The message documents to append, in order
+            fire_and_forget (bool): Queue the write on the background worker
+                and return immediately; reads drain the queue first
+
+        Returns:
+            dict: Success status and response
+        """
+        action = 'update_chat_message_documents'
+        logger.debug("Running: %s", action)
+
+        if fire_and_forget:
+            future = self.write_executor.submit(self.update_chat_message_documents, updates)
+            self._pending_writes.append(future)
+            self._invalidate_turns_cache()
+            return {'success': True, 'action': action, 'input': updates, 'output': 'queued'}
+
+        try:
+            response = self.CHC.update_turn_bulk(
+                self.portfolio,
+                self.org,
+                self.entity_type,
+                self.entity_id,
+                self.thread,
+                self.chat_id,
+                updates
+            )
+
+            self._invalidate_turns_cache()
+
+            if 'success' not in response:
+                logger.warning("Something failed during bulk chat message update %s", response)
+                return {'success': False, 'action': action, 'input': updates, 'output': response}
+
+            return {'success': True, 'action': action, 'input': updates, 'output': response}
+
+        except Exception as e:
+            logger.error("Bulk chat message update failed: %s", str(e))
             return {'success': False, 'action': action, 'output': f'Error: {str(e)}'}
 
     def update_workspace_document(self, update, workspace_id):
@@ -244,7 +899,9 @@ class AgentUtilities:
             workspace_id,
             update
         )
-        
+
+        self._invalidate_workspaces_cache()
+
         if 'success' not in response:
             return {'success': False, 'action': action, 'input': update, 'output': response}
         
@@ -270,129 +927,121 @@ class AgentUtilities:
             }
         """
         try:
-            if msg_type == 'consent':
-                print('Sending consent form')
-                # This is a consent request from the agent to the user
-                message_type = 'consent'
-                if not interface:
-                    interface = 'binary_consent'
-                doc = {'_out': self.sanitize(output), '_type': 'consent','_interface':interface,'_next': next}
-                self.update_chat_message_document(doc)
-                self.print_chat(doc,message_type, as_is=True)
+            # Buffer the WebSocket sends for this save so the DB writes and
+            # the live-chat broadcasts don't interleave; flushed on exit.
+            with self.ws_batch():
+                if msg_type == 'consent':
+                    logger.debug("Sending consent form")
+                    # This is a consent request from the agent to the user
+                    message_type = 'consent'
+                    if not interface:
+                        interface = 'binary_consent'
+                    doc = {'_out': self.sanitize(output), '_type': 'consent','_interface':interface,'_next': next}
+                    self.update_chat_message_document(doc, fire_and_forget=True)
+                    self.print_chat(doc,message_type, as_is=True)
                 
-            elif msg_type == 'widget':
-                print('Custom widget')
-                # This is a consent request from the agent to the user
-                message_type = 'widget'
-                if not interface:
-                    interface = ''
-                doc = {'_out': self.sanitize(output), '_type': 'widget','_interface':interface}
-                self.update_chat_message_document(doc)
-                self.print_chat(doc,message_type, as_is=True)
-
-            elif msg_type == 'transient' and output.get('content') and output.get('role') == 'assistant':
-                print('Saving transient message to the message roll')
-                message_type = 'transient'
-                doc = {'_out': self.sanitize(output), '_type': message_type, '_next': next}
-                self.update_chat_message_document(doc)
-                self.print_chat(doc, message_type, as_is=True)
-
-            elif msg_type == 'json' and output.get('role') == 'assistant':
-                message_type = 'json'
-                out_val = output.get('content') if 'content' in output else output
-                doc = {'_out': self.sanitize(out_val), '_type': message_type, '_interface': interface or 'document', '_next': next}
-                self.update_chat_message_document(doc)
-                self.print_chat(doc, message_type, as_is=True)
-
-            elif msg_type == 'option' and output.get('role') == 'assistant':
-                message_type = 'option'
-                out_val = output.get('content') if 'content' in output else output
-                doc = {'_out': self.sanitize(out_val), '_type': message_type, '_interface': interface or 'option', '_next': next}
-                self.update_chat_message_document(doc)
-                self.print_chat(doc, message_type, as_is=True)
-
-            elif msg_type == 'system' and output.get('content'):
-                print('Saving system instruction to message roll')
-                # Internal routing instruction for upstream agents. Persist only (no user broadcast).
-                message_type = 'system'
-                doc = {'_out': self.sanitize(output), '_type': message_type, '_next': next}
-                self.update_chat_message_document(doc)
+                elif msg_type == 'widget':
+                    logger.debug("Custom widget")
+                    # This is a consent request from the agent to the user
+                    message_type = 'widget'
+                    if not interface:
+                        interface = ''
+                    doc = {'_out': self.sanitize(output), '_type': 'widget','_interface':interface}
+                    self.update_chat_message_document(doc, fire_and_forget=True)
+                    self.print_chat(doc,message_type, as_is=True)
+
+                elif msg_type == 'transient' and output.get('content') and output.get('role') == 'assistant':
+                    logger.debug("Saving transient message to the message roll")
+                    message_type = 'transient'
+                    doc = {'_out': self.sanitize(output), '_type': message_type, '_next': next}
+                    self.update_chat_message_document(doc, fire_and_forget=True)
+                    self.print_chat(doc, message_type, as_is=True)
+
+                elif msg_type == 'json' and output.get('role') == 'assistant':
+                    message_type = 'json'
+                    out_val = output.get('content', output)
+                    doc = {'_out': self.sanitize(out_val), '_type': message_type, '_interface': interface or 'document', '_next': next}
+                    self.update_chat_message_document(doc, fire_and_forget=True)
+                    self.print_chat(doc, message_type, as_is=True)
+
+                elif msg_type == 'option' and output.get('role') == 'assistant':
+                    message_type = 'option'
+                    out_val = output.get('content', output)
+                    doc = {'_out': self.sanitize(out_val), '_type': message_type, '_interface': interface or 'option', '_next': next}
+                    self.update_chat_message_document(doc, fire_and_forget=True)
+                    self.print_chat(doc, message_type, as_is=True)
+
+                elif msg_type == 'system' and output.get('content'):
+                    logger.debug("Saving system instruction to message roll")
+                    # Internal routing instruction for upstream agents. Persist only (no user broadcast).
+                    message_type = 'system'
+                    doc = {'_out': self.sanitize(output), '_type': message_type, '_next': next}
+                    self.update_chat_message_document(doc, fire_and_forget=True)
                  
                 
-            elif output.get('tool_calls') and output.get('role') == 'assistant':
-                print('Saving the tool call')
-                # This is a tool call
-                message_type = 'tool_rq'
-                doc = {'_out': self.sanitize(output), '_type': 'tool_rq','_next': next}
-                # Memorize to permanent storage
-                self.update_chat_message_document(doc)      
-                
-                # Creating empty placeholders corresponding to each one of the un-executed tool calls.
-                # This was a work-around as OpenAI doesn't like to see a tools_calls without its corresponding response.
-                # It happens because sometimes, the chat messages are passed to the LLM before the tool is executed 
-                # (e.g: Asking the user for approval to use a tool, the agent needs to understand the response using an LLM)
-                for tool_call in output['tool_calls']:
-                    rs_template = {
-                        "role": "tool",
-                        "tool_call_id": tool_call['id'],
-                        "content": []
-                    }
-                    print(f'Saving placeholder message for:{tool_call['id']}')
-                    doc_rs_placeholder = {'_out': rs_template, '_type': 'tool_rs','_next': next}
-                    self.update_chat_message_document(doc_rs_placeholder)
+                elif output.get('tool_calls') and output.get('role') == 'assistant':
+                    logger.debug("Saving the tool call")
+                    # This is a tool call
+                    message_type = 'tool_rq'
+                    doc = {'_out': self.sanitize(output), '_type': 'tool_rq','_next': next}
+
+                    # Creating empty placeholders corresponding to each one of the un-executed tool calls.
+                    # This was a work-around as OpenAI doesn't like to see a tools_calls without its corresponding response.
+                    # It happens because sometimes, the chat messages are passed to the LLM before the tool is executed
+                    # (e.g: Asking the user for approval to use a tool, the agent needs to understand the response using an LLM)
+                    docs = [doc]
+                    for tool_call in output['tool_calls']:
+                        rs_template = {
+                            "role": "tool",
+                            "tool_call_id": tool_call['id'],
+                            "content": []
+                        }
+                        logger.debug("Saving placeholder message for:%s", tool_call['id'])
+                        docs.append({'_out': rs_template, '_type': 'tool_rs','_next': next})
+
+                    # Memorize the tool call and its placeholders to permanent storage in one write
+                    self.update_chat_message_documents(docs, fire_and_forget=True)
                                 
-            elif output.get('content') and output.get('role') == 'assistant':
-                print('Saving the assistant message to the user')
-                # This is a human readable message from the agent to the user
-                message_type = 'text'
-                doc = {'_out': self.sanitize(output), '_type': message_type, '_next': next}
-                # Memorize to permanent storage
-                response_1 = self.update_chat_message_document(doc)
-                #print(f'Chat update response:',response_1)
-                # Print to live chat
-                self.print_chat(doc, message_type, as_is=True)
-                # Print to API
-                self.print_api(output['content'], message_type)
+                elif output.get('content') and output.get('role') == 'assistant':
+                    logger.debug("Saving the assistant message to the user")
+                    # This is a human readable message from the agent to the user
+                    message_type = 'text'
+                    doc = {'_out': self.sanitize(output), '_type': message_type, '_next': next}
+                    # Memorize to permanent storage
+                    response_1 = self.update_chat_message_document(doc, fire_and_forget=True)
+                    #print(f'Chat update response:',response_1)
+                    # Print to live chat
+                    self.print_chat(doc, message_type, as_is=True)
+                    # Print to API
+                    self.print_api(output['content'], message_type)
                 
-            elif 'tool_call_id' in output and 'role' in output and output['role'] == 'tool':
-                # This is a response from the tool
-                print(f'Including Tool Response in the chat:')
-                #print(output)
-                print(f'Tool is returning interface:{interface}')
-                # This is the tool response
-                message_type = 'tool_rs'
-                doc = {'_out': self.sanitize(output), '_type': message_type, '_interface': interface, '_next': next}
-                # Memorize to permanent storage (DB path keeps content as string)
-                self.update_chat_message_document(doc, output['tool_call_id'])
-
-                if interface:
-                    # For WebSocket, mirror ChatController.update_turn's normalization:
-                    # - If parsed content is an object (dict), wrap it in a single-element list.
-                    # - If it's a list of dicts, keep as-is.
-                    # - Otherwise (string/number/etc.), leave the original string.
-                    doc_for_websocket = doc.copy()
-                    if '_out' in doc_for_websocket and 'content' in doc_for_websocket['_out']:
-                        content = doc_for_websocket['_out']['content']
-                        if isinstance(content, str):
-                            try:
-                                parsed_content = json.loads(content)
-                                if isinstance(parsed_content, dict):
-                                    parsed_content = [parsed_content]
-                                elif isinstance(parsed_content, list):
-                                    if not all(isinstance(item, dict) for item in parsed_content):
-                                        parsed_content = content
-                                else:
-                                    parsed_content = content
+                elif 'tool_call_id' in output and 'role' in output and output['role'] == 'tool':
+                    # This is a response from the tool
+                    logger.debug("Including Tool Response in the chat:")
+                    #print(output)
+                    logger.debug("Tool is returning interface:%s", interface)
+                    # This is the tool response
+                    message_type = 'tool_rs'
+                    doc = {'_out': self.sanitize(output), '_type': message_type, '_interface': interface, '_next': next}
+                    # Memorize to permanent storage (DB path keeps content as string)
+                    self.update_chat_message_document(doc, output['tool_call_id'], fire_and_forget=True)
+
+                    if interface:
+                        # For WebSocket, mirror ChatController.update_turn's
+                        # normalization of the content string. Only copy the
+                        # doc (and its _out) when the content actually changes.
+                        doc_for_websocket = doc
+                        out = doc.get('_out')
+                        if isinstance(out, dict):
+                            content = out.get('content')
+                            if isinstance(content, str):
+                                parsed_content = _normalize_tool_content(content)
                                 if parsed_content is not content:
-                                    doc_for_websocket['_out'] = doc_for_websocket['_out'].copy()
-                                    doc_for_websocket['_out']['content'] = parsed_content
-                            except (json.JSONDecodeError, TypeError):
-                                # If parsing fails, keep original string
-                                pass
-                    self.print_chat(doc_for_websocket, message_type, as_is=True)
+                                    doc_for_websocket = {**doc, '_out': {**out, 'content': parsed_content}}
+                        self.print_chat(doc_for_websocket, message_type, as_is=True)
                     
         except Exception as e:
-            print(f"Error in {function}: {e}")
+            logger.error("Error in %s: %s", function, e)
             
 
 
@@ -409,28 +1058,27 @@ class AgentUtilities:
             dict: Success status and response
         """
         action = 'print_api'
-        
 
-        callback_msg_handler = self.config.get('CALLBACK_MSG_HANDLER', False)
-        
-         
+        # Handler route resolved and split once in __init__
+        callback_msg_handler = self._callback_msg_handler
+
         try:
             if callback_msg_handler:
                 if public_user:
                     target = public_user
                 else:
                     return {'success': False, 'action': action, 'input': message, 'output': 'This is an internal call, no API output is needed'}
-               
-                params = {'message': message, 'type': type, 'target': target}  
-                
-                parts = callback_msg_handler.split('/')
+
+                params = {'message': message, 'type': type, 'target': target}
+
+                parts = self._callback_msg_handler_parts
                 if len(parts) != 2:
                     error_msg = f"{callback_msg_handler} is not a valid tool."
-                    print(error_msg)
+                    logger.error(error_msg)
                     self.print_chat(error_msg, 'error')
                     raise ValueError(error_msg)
-                
-                print(f'Calling {callback_msg_handler}') 
+
+                logger.debug("Calling %s", callback_msg_handler)
                 response = self.SHC.handler_call(self.portfolio, self.org, parts[0], parts[1], params)
                 
                 return response
@@ -438,10 +1086,10 @@ class AgentUtilities:
                 return {'success': False, 'action': action, 'input': message, 'output': ''}
                 
         except ValueError as ve:
-            print(f"ValueError in {action}: {ve}")
+            logger.error("ValueError in %s: %s", action, ve)
             return {'success': False, 'action': action, 'input': message, 'output': str(ve)}
         except Exception as e:
-            print(f"Error in {action}: {e}")
+            logger.error("Error in %s: %s", action, e)
             return {'success': False, 'action': action, 'input': message, 'output': str(e)}
 
     def print_chat(self, output, type='text', as_is=False, connection_id=None, next= None):
@@ -457,36 +1105,43 @@ class AgentUtilities:
         Returns:
             bool: Success status
         """
-        print(f'print_chat: {output}')
+        logger.debug("print_chat: %s", output)
         
         if not connection_id:
             #Try the context
             connection_id = self.connection_id
-        
-        if as_is:
-            doc = output  
-        elif isinstance(output, dict) and 'role' in output and 'content' in output and output['role'] and output['content']: 
-            # Content responses from LLM  
-            doc = {'_out': {'role': output['role'], 'content': self.sanitize(output['content'])}, '_type': type, '_next:':next}      
-        elif isinstance(output, str):
-            # Any text response
-            doc = {'_out': {'role': 'assistant', 'content': str(output)}, '_type': type, '_next:':next}     
-        else:
-            # Everything else
-            doc = {'_out': {'role': 'assistant', 'content': self.sanitize(output)}, '_type': type, '_next:':next} 
-            
+
+        # Short-circuit before building (and sanitizing) the payload when
+        # there is nowhere to send it.
         if not connection_id:
             #print(f'WebSocket not configured or this is a RESTful post to the chat.')
             return False
-        
+
         if not self.ws_client.is_configured():
             return False
-        
+
+        if as_is:
+            doc = output
+        elif isinstance(output, dict) and 'role' in output and 'content' in output and output['role'] and output['content']:
+            # Content responses from LLM
+            doc = {'_out': {'role': output['role'], 'content': self.sanitize(output['content'])}, '_type': type, '_next:':next}
+        elif isinstance(output, str):
+            # Any text response
+            doc = {'_out': {'role': 'assistant', 'content': str(output)}, '_type': type, '_next:':next}
+        else:
+            # Everything else
+            doc = {'_out': {'role': 'assistant', 'content': self.sanitize(output)}, '_type': type, '_next:':next}
+
+        if self._ws_buffer is not None:
+            # A ws_batch is active: defer the send until the batch flushes
+            self._ws_buffer.append((connection_id, doc))
+            return True
+
         #print(f'Sending Websocket Message to client. ConnectionId:{connection_id}')
         success = self.ws_client.send_message(connection_id, doc)
         
         if success:
-            print(f'Message has been updated')
+            logger.debug("Message has been updated")
         
         return success
         
@@ -508,28 +1163,296 @@ class AgentUtilities:
         Raises:
             IndexError: If the step with the given step_id is not found
         """
-        if 'state_machine' not in workspace:
-            workspace['state_machine'] = {}
-        
-        if plan_id not in workspace['state_machine']:
-            workspace['state_machine'][plan_id] = {'steps': []}
-        
-        if 'steps' not in workspace['state_machine'][plan_id]:
-            workspace['state_machine'][plan_id]['steps'] = []
-        
-        steps = workspace['state_machine'][plan_id]['steps']
+        state_machine = workspace.setdefault('state_machine', {})
+        plan_state = state_machine.setdefault(plan_id, {'steps': []})
+        steps = plan_state.setdefault('steps', [])
         target_step_id = str(plan_step)  # Normalize to string for comparison
-        
-        # Search for the step by step_id (not by index)
-        for step in steps:
-            # Handle both string and int step_id values
-            step_id = str(step.get('step_id', ''))
-            if step_id == target_step_id:
-                return step
-        
+
+        # Look up the step by step_id (not by index). The index handles both
+        # string and int step_id values; the steps themselves stay a list so
+        # the stored document shape is unchanged. It is memoized per steps
+        # list (identity + length) so e.g. a batched action_log append loop
+        # builds it once instead of once per entry; the memo lives on the
+        # instance, never on the workspace, so nothing leaks into the DB.
+        memo = self._step_index_cache.get(id(steps))
+        if memo is not None and memo[0] == len(steps) and memo[1] is steps:
+            steps_by_id = memo[2]
+        else:
+            steps_by_id = {str(step.get('step_id', '')): step for step in steps}
+            if len(self._step_index_cache) > 64:
+                self._step_index_cache.clear()
+            self._step_index_cache[id(steps)] = (len(steps), steps, steps_by_id)
+        step = steps_by_id.get(target_step_id)
+        if step is not None:
+            return step
+
         # If step not found, raise an error - we should not create steps that don't exist in the plan
         raise IndexError(f"Step with step_id '{plan_step}' not found in state machine for plan_id '{plan_id}'. The state machine has {len(steps)} step(s).")
 
+
+    def _resolve_workspace(self, workspace_id=None, payload=None):
+        """
+        Return the authoritative workspace for this thread, creating one if
+        none exist yet. Without a workspace_id the most recent workspace
+        wins. Returns None when the listing fails or the id is unknown.
+        """
+        workspaces_list = self._cached_list_workspaces()
+
+        if not workspaces_list['success']:
+            return None
+
+        items = workspaces_list['items']
+        if len(items) == 0:
+            # Create a workspace as none exist
+            response = self.CHC.create_workspace(
+                self.portfolio,
+                self.org,
+                self.entity_type,
+                self.entity_id,
+                self.thread, payload or {}
+            )
+            self._invalidate_workspaces_cache()
+            if not response['success']:
+                return None
+            # Use the created document directly instead of re-listing
+            items = [response['document']]
+
+        if not workspace_id:
+            return items[-1]
+        for w in items:
+            if w['_id'] == workspace_id:
+                return w
+        return None
+
+    # mutate_workspace key handlers. Each one applies a single change key to
+    # the workspace; the dispatch table below replaces the old if-chain so
+    # applying a change is one dict lookup instead of a scan over every key.
+
+    def _mutate_belief(self, workspace, output):
+        # output = {"date":"345"}
+        if isinstance(output, dict):
+            # changes and workspace are both sanitized by mutate_workspace, so merge directly
+            workspace['state']['beliefs'] = {**workspace['state']['beliefs'], **output}
+
+    def _mutate_desire(self, workspace, output):
+        if isinstance(output, str):
+            workspace['state']['desire'] = output
+
+    def _mutate_intent(self, workspace, output):
+        logger.debug("Workspace before intent insert:%s", workspace)
+        logger.debug("Inserting Intent:%s", output)
+        if isinstance(output, dict):
+            logger.debug("Flag i1")
+            workspace['intent'] = output
+        else:
+            logger.debug("Flag i2")
+
+    def _mutate_belief_history(self, workspace, output):
+        if isinstance(output, dict):
+            state = workspace['state']
+            history = state['history']
+            # Pruned view (newest value per key) maintained incrementally
+            # alongside the full history, so readers don't re-prune the
+            # whole list every turn. Documents that predate it get one
+            # full prune here, then stay incremental.
+            pruned = state.get('history_pruned')
+            if pruned is None:
+                pruned = self.prune_history(history)
+                state['history_pruned'] = pruned
+            # Prompt-cache split: a sealed prefix that never changes once
+            # written plus a small recent tail. Only the tail block of the
+            # prompt varies per turn; when the tail fills up it is flushed
+            # into the prefix (one accepted cache miss) and restarted. A
+            # superseded key keeps its old value in the sealed prefix —
+            # the tail carries the current one.
+            prefix = state.setdefault('history_prefix', [])
+            tail = state.get('history_tail')
+            if tail is None:
+                tail = list(pruned)
+                state['history_tail'] = tail
+            # Now update the belief history
+            for k, v in output.items():
+                history_event = {
+                    'type': 'belief',
+                    'key': k,
+                    'val': v,
+                    'time': datetime.now().isoformat()
+                }
+                history.append(history_event)
+                # Drop the superseded entry for this key; appending at the
+                # end reproduces prune_history's newest-occurrence order.
+                for index in range(len(pruned) - 1, -1, -1):
+                    if pruned[index].get('key') == k:
+                        del pruned[index]
+                        break
+                pruned.append(history_event)
+                for index in range(len(tail) - 1, -1, -1):
+                    if tail[index].get('key') == k:
+                        del tail[index]
+                        break
+                tail.append(history_event)
+            if len(tail) >= self._HISTORY_TAIL_MAX:
+                prefix.extend(tail)
+                del tail[:]
+
+    def _mutate_cache(self, workspace, output):
+        logger.debug("Updating workspace cache ...")
+        #print(f'{output}')
+        cache = workspace.setdefault('cache', {})
+        if isinstance(output, dict):
+            for k, v in output.items():
+                if v is None:
+                    cache.pop(k, None)
+                else:
+                    cache[k] = v
+        elif isinstance(output, list):
+            # For lists, store as 'results'
+            cache['results'] = output
+
+    def _mutate_is_active(self, workspace, output):
+        if isinstance(output, bool):
+            workspace['data'] = output  # Output overrides existing data
+
+    def _mutate_action(self, workspace, output):
+        if isinstance(output, str):
+            workspace['state']['action'] = output  # Output overrides existing data
+
+    def _mutate_follow_up(self, workspace, output):
+        if isinstance(output, dict):
+            workspace['state']['follow_up'] = output
+
+    def _mutate_slots(self, workspace, output):
+        if isinstance(output, dict):
+            workspace['state']['slots'] = output
+
+    def _mutate_plan(self, workspace, output):
+        if isinstance(output, dict):
+            workspace.setdefault('plan', {})[output['id']] = output
+
+    def _mutate_change_review(self, workspace, output):
+        if output is None or output is False:
+            workspace.pop('change_review', None)
+        elif isinstance(output, dict):
+            workspace['change_review'] = output
+
+    def _mutate_plan_commit_pending(self, workspace, output):
+        if output is False or output is None:
+            workspace.pop('plan_commit_pending', None)
+        elif isinstance(output, bool) and output is True:
+            workspace['plan_commit_pending'] = True
+
+    def _mutate_agent_quotes_protocol_state(self, workspace, output):
+        if output is None or output is False:
+            workspace.pop('agent_quotes_protocol_state', None)
+        elif isinstance(output, str):
+            s = output.strip()
+            if s:
+                workspace['agent_quotes_protocol_state'] = s
+            else:
+                workspace.pop('agent_quotes_protocol_state', None)
+
+    def _mutate_new_state_machine(self, workspace, output):
+        logger.debug("Initializing state machine")
+        if isinstance(output, dict):
+            # It won't override entire state machine if it already exists.
+            workspace.setdefault('state_machine', {}).setdefault(output['plan_id'], output)
+        #print(workspace)
+
+    def _mutate_replace_state_machine(self, workspace, output):
+        # Overwrite state for an existing plan_id
+        if isinstance(output, dict) and output.get('plan_id'):
+            workspace.setdefault('state_machine', {})[output['plan_id']] = output
+
+    def _mutate_step_state(self, workspace, output):
+        #print(f'mutate step_state input:{output}')
+        if isinstance(output, dict):
+            if 'plan_id' in output and 'plan_step' in output:
+                plan_id = output['plan_id']
+                plan_step = output['plan_step']
+
+                # Use helper function to safely get or create the step
+                step = self.get_or_create_step(workspace, plan_id, plan_step)
+
+                if 'status' in output:
+                    step['status'] = output['status']
+                if 'error' in output:
+                    step['error'] = output['error']
+                if 'started_at' in output:
+                    step['started_at'] = output['started_at']
+                if 'finished_at' in output:
+                    step['finished_at'] = output['finished_at']
+        #print(f'State Machine after mutate step_state:{workspace["state_machine"]}')
+
+    def _mutate_plan_state(self, workspace, output):
+        if isinstance(output, dict):
+            logger.debug("@mutate:plan_state: workspace: %s", workspace)
+            if 'plan_id' in output:
+                plan_id = output['plan_id']
+                if 'status' in output:
+                    workspace['state_machine'][plan_id] = output['status']
+                if 'updated_at' in output:
+                    workspace['state_machine'][plan_id] = output['updated_at']
+
+    def _mutate_action_log(self, workspace, output):
+        # A list coalesces several appends into the same mutate_workspace
+        # call (and therefore the same DB write) for multi-step plans.
+        if isinstance(output, list):
+            for entry in output:
+                self._mutate_action_log(workspace, entry)
+            return
+        if isinstance(output, dict):
+            '''
+            {
+                "plan_id":plan_id,
+                "plan_step":plan_step,
+                "tool":selected_tool,
+                "status":tool_step,
+                "nonce":nonce,
+                "message":message,
+                "type":type
+            }
+            '''
+            # Storing action_log:{'plan_id': 'd6e47334', 'plan_step': '0', 'tool': 'search_flights', 'status': 3, 'details': {'commands': [{'id': 'call_tMtY0uDa3WAnl9kyz9MqXnhA', 'function': {'arguments': '{"from_airport_code":"DFW","to_airport_code":"JFK","outbound_date":"2026-01-25","return_date":"2026-02-01"}', 'name': 'search_flights'}, 'type': 'function'}], 'interface': 'binary_consent', 'nonce': 116360, 'message': {'role': 'assistant', 'content': 'I would like to call search_flights tool with the following parameters:from_airport_code: DFW, to_airport_code: JFK, outbound_date: 2026-01-25, return_date: 2026-02-01. Please confirm it is ok'}}}
+
+            logger.debug("Storing action_log:%s", output)
+            plan_id = output['plan_id']
+            plan_step = output['plan_step']
+            # One C-level comprehension, one lookup per key; the sentinel
+            # keeps keys whose value is legitimately None.
+            log = {
+                k: v for k in self._ACTION_LOG_KEYS
+                if (v := output.get(k, _MISSING)) is not _MISSING
+            }
+
+            # Use helper function to safely get or create the step
+            step = self.get_or_create_step(workspace, plan_id, plan_step)
+
+            step.setdefault('action_log', []).append(log)
+
+            logger.debug("Log to add to action_log:%s", log)
+            #print(f'Updated workspace after adding item to action_log:{workspace}')
+
+    _MUTATE_WORKSPACE_HANDLERS = {
+        'belief': _mutate_belief,
+        'desire': _mutate_desire,
+        'intent': _mutate_intent,
+        'belief_history': _mutate_belief_history,
+        'cache': _mutate_cache,
+        'is_active': _mutate_is_active,
+        'action': _mutate_action,
+        'follow_up': _mutate_follow_up,
+        'slots': _mutate_slots,
+        'plan': _mutate_plan,
+        'change_review': _mutate_change_review,
+        'plan_commit_pending': _mutate_plan_commit_pending,
+        'agent_quotes_protocol_state': _mutate_agent_quotes_protocol_state,
+        'new_state_machine': _mutate_new_state_machine,
+        'replace_state_machine': _mutate_replace_state_machine,
+        'step_state': _mutate_step_state,
+        'plan_state': _mutate_plan_state,
+        'action_log': _mutate_action_log,
+    }
+
     def mutate_workspace(self, changes, public_user=None, workspace_id=None):
         """
         Mutate workspace with changes.
@@ -554,54 +1477,25 @@ class AgentUtilities:
 
             # Sanitize changes early to prevent serialization errors in logging
             changes = self.sanitize(changes)
-            first_key = next(iter(changes), None)
-            print("MUTATE_WORKSPACE>>", first_key)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("MUTATE_WORKSPACE>> %s", next(iter(changes), None))
         
             # 1. Get the workspace in this thread
             #print(f'Looking for workspaces @:{self.portfolio}:{self.org}:{self.entity_type}:{self.entity_id}:{self.thread} ')
-            workspaces_list = self.CHC.list_workspaces(
-                self.portfolio,
-                self.org,
-                self.entity_type,
-                self.entity_id,
-                self.thread
-            ) 
-            #print('WORKSPACES_LIST >>', workspaces_list) 
-            
-            if not workspaces_list['success']:
+            workspace = self._resolve_workspace(workspace_id=workspace_id, payload=payload)
+            if workspace is None:
                 return False
-            
-            if len(workspaces_list['items']) == 0:
-                # Create a workspace as none exist
-                response = self.CHC.create_workspace(
-                    self.portfolio,
-                    self.org,
-                    self.entity_type,
-                    self.entity_id,
-                    self.thread, payload
-                ) 
-                if not response['success']:
-                    return False
-                # Regenerate workspaces_list
-                workspaces_list = self.CHC.list_workspaces(
-                    self.portfolio,
-                    self.org,
-                    self.entity_type,
-                    self.entity_id,
-                    self.thread
-                ) 
-                #print('UPDATED WORKSPACES_LIST >>>>', workspaces_list) 
-                
-            if not workspace_id:
-                workspace = workspaces_list['items'][-1]
-            else:
-                for w in workspaces_list['items']:
-                    if w['_id'] == workspace_id:
-                        workspace = w
-                        
+
             # CRITICAL: Sanitize workspace immediately after retrieval from database
             # This converts all Decimals before any merging or manipulation
             workspace = self.sanitize(workspace)
+
+            # Sanitize the incoming delta once, up front. The workspace is
+            # already clean and the handlers only insert values from
+            # `changes` (plus strings/timestamps of their own), so the
+            # document stays clean by construction and the final write
+            # needs no full-tree pass.
+            changes = self.sanitize(changes)
             #print('Selected workspace >>>>', workspace) 
             if 'state' not in workspace:
                 workspace['state'] = {
@@ -618,226 +1512,28 @@ class AgentUtilities:
                 safe_key = str(key).strip()
                 if not safe_key:
                     continue
-                if safe_key not in self._MUTATE_WORKSPACE_HANDLED_KEYS:
+                handler = self._MUTATE_WORKSPACE_HANDLERS.get(safe_key)
+                if handler is None:
                     if safe_key in self._MUTATE_WORKSPACE_RESERVED_KEYS:
                         safe_key = f'custom_{safe_key}'
                     workspace[safe_key] = self._neutralize_workspace_value(output)
                     continue
+                handler(self, workspace, output)
 
-                if key == 'belief':
-                    # output = {"date":"345"}
-                    if isinstance(output, dict):
-                        # Sanitize output before merging, then sanitize the merged result
-                        sanitized_output = self.sanitize(output)
-                        merged_beliefs = {**workspace['state']['beliefs'], **sanitized_output}
-                        workspace['state']['beliefs'] = self.sanitize(merged_beliefs)
-                        
-                if key == 'desire':
-                    if isinstance(output, str):
-                        workspace['state']['desire'] = output
-                
-                if key == 'intent':
-                    print(f'Workspace before intent insert:{workspace}')
-                    print(f'Inserting Intent:{output}')
-                    if isinstance(output, dict):
-                        print('Flag i1')
-                        workspace['intent'] = self.sanitize(output)
-                    else:
-                        print('Flag i2')
-        
-                        
-                        
-                if key == 'belief_history':
-                    if isinstance(output, dict):
-                        # Now update the belief history
-                        for k, v in output.items():
-                            history_event = {
-                                'type': 'belief',
-                                'key': k,
-                                'val': self.sanitize(v),
-                                'time': datetime.now().isoformat()
-                            }
-                            workspace['state']['history'].append(history_event)
-                                
-                if key == 'cache':
-                    print(f'Updating workspace cache ...')
-                    #print(f'{output}')
-                    if 'cache' not in workspace: 
-                        workspace['cache'] = {}
-                    if isinstance(output, dict):
-                        for k, v in output.items():
-                            if v is None:
-                                workspace['cache'].pop(k, None)
-                            else:
-                                # Sanitize nested values to ensure no Decimals slip through
-                                workspace['cache'][k] = self.sanitize(v)
-                    elif isinstance(output, list):
-                        # For lists, sanitize each element and store as 'results'
-                        workspace['cache']['results'] = self.sanitize(output)
-                
-                if key == 'is_active':
-                    if isinstance(output, bool):
-                        workspace['data'] = output  # Output overrides existing data
-                        
-                if key == 'action':
-                    if isinstance(output, str):
-                        workspace['state']['action'] = output  # Output overrides existing data
-                        
-                if key == 'follow_up':
-                    if isinstance(output, dict):
-                        # Sanitize nested follow_up data to ensure no Decimals slip through
-                        workspace['state']['follow_up'] = self.sanitize(output)
-                        
-                if key == 'slots':
-                    if isinstance(output, dict):
-                        # Sanitize nested slots data to ensure no Decimals slip through
-                        workspace['state']['slots'] = self.sanitize(output)
-                        
-                if key == 'plan':
-                    if isinstance(output, dict):
-                        plan_id = output['id']
-                        if 'plan' not in workspace:
-                            workspace['plan'] = {}
-                        # Sanitize nested plan data to ensure no Decimals slip through
-                        workspace['plan'][plan_id] = self.sanitize(output)
-
-                if key == 'change_review':
-                    if output is None or output is False:
-                        workspace.pop('change_review', None)
-                    elif isinstance(output, dict):
-                        workspace['change_review'] = self.sanitize(output)
-
-                if key == 'plan_commit_pending':
-                    if output is False or output is None:
-                        workspace.pop('plan_commit_pending', None)
-                    elif isinstance(output, bool) and output is True:
-                        workspace['plan_commit_pending'] = True
-
-                if key == 'agent_quotes_protocol_state':
-                    if output is None or output is False:
-                        workspace.pop('agent_quotes_protocol_state', None)
-                    elif isinstance(output, str):
-                        s = output.strip()
-                        if s:
-                            workspace['agent_quotes_protocol_state'] = self.sanitize(s)
-                        else:
-                            workspace.pop('agent_quotes_protocol_state', None)
-                        
-                if key == 'new_state_machine':
-                    print('Initializing state machine')
-                    if isinstance(output, dict):
-                        plan_id = output['plan_id']
-                        if 'state_machine' not in workspace:
-                            workspace['state_machine'] = {}
-                        # Sanitize nested plan data to ensure no Decimals slip through
-                        if plan_id not in workspace['state_machine']:
-                            # It won't override entire state machine if it already exists.
-                            workspace['state_machine'][plan_id] = self.sanitize(output)
-                    #print(workspace)
-
-                if key == 'replace_state_machine':
-                    # Overwrite state for an existing plan_id
-                    if isinstance(output, dict) and output.get('plan_id'):
-                        plan_id = output['plan_id']
-                        if 'state_machine' not in workspace:
-                            workspace['state_machine'] = {}
-                        workspace['state_machine'][plan_id] = self.sanitize(output)
-                    
-                if key == 'step_state':
-                    
-                    #print(f'mutate step_state input:{output}')
-                    if isinstance(output, dict):
-                        
-                        if 'plan_id' in output and 'plan_step' in output:
-                            plan_id = output['plan_id']
-                            plan_step = output['plan_step']
-                            
-                            # Use helper function to safely get or create the step
-                            step = self.get_or_create_step(workspace, plan_id, plan_step)
-                             
-                            if 'status' in output:
-                                step['status'] = output['status']
-                            if 'error' in output: 
-                                step['error'] = output['error']
-                            if 'started_at' in output:
-                                step['started_at'] = output['started_at']
-                            if 'finished_at' in output:
-                                step['finished_at'] = output['finished_at']
-                                
-                    #print(f'State Machine after mutate step_state:{workspace["state_machine"]}')
-                
-                if key == 'plan_state':
-                    if isinstance(output, dict):
-                        
-                        print(f'@mutate:plan_state: workspace: {workspace}')
-                        
-                        if 'plan_id' in output :
-                            plan_id = output['plan_id']
-   
-                            if 'status' in output:
-                                workspace['state_machine'][plan_id] = output['status']
-                            if 'updated_at' in output:
-                                workspace['state_machine'][plan_id] = output['updated_at']
-                            
-                        
-                if key == 'action_log':
-                    if isinstance(output, dict):
-                        '''
-                        {
-                            "plan_id":plan_id,
-                            "plan_step":plan_step,
-                            "tool":selected_tool,
-                            "status":tool_step,
-                            "nonce":nonce,
-                            "message":message,
-                            "type":type
-                        }
-                        '''
-                        # Storing action_log:{'plan_id': 'd6e47334', 'plan_step': '0', 'tool': 'search_flights', 'status': 3, 'details': {'commands': [{'id': 'call_tMtY0uDa3WAnl9kyz9MqXnhA', 'function': {'arguments': '{"from_airport_code":"DFW","to_airport_code":"JFK","outbound_date":"2026-01-25","return_date":"2026-02-01"}', 'name': 'search_flights'}, 'type': 'function'}], 'interface': 'binary_consent', 'nonce': 116360, 'message': {'role': 'assistant', 'content': 'I would like to call search_flights tool with the following parameters:from_airport_code: DFW, to_airport_code: JFK, outbound_date: 2026-01-25, return_date: 2026-02-01. Please confirm it is ok'}}}
-
-                        print(f'Storing action_log:{output}')
-                        plan_id = output['plan_id']
-                        plan_step = output['plan_step']
-                        log = {}
-                        if 'tool' in output:
-                            log['tool'] = output['tool']
-                        if 'status' in output:
-                            log['status'] = output['status']
-                        if 'nonce' in output:
-                            log['nonce'] = output['nonce']
-                        if 'message' in output:
-                            log['message'] = output['message']
-                        if 'type' in output:
-                            log['type'] = output['type']
-                        if 'actionable' in  output:
-                            log['actionable'] = output['actionable']
-                        
-                        # Use helper function to safely get or create the step
-                        step = self.get_or_create_step(workspace, plan_id, plan_step)
-                        
-                        if 'action_log' not in step:
-                            step['action_log'] = []
-                        
-                        step['action_log'].append(log)
-                        
-                        print(f'Log to add to action_log:{log}')
-                        #print(f'Updated workspace after adding item to action_log:{workspace}')
-                        
-                        
-                            
              # 3. Update document in DB
-       
-            # Sanitize the entire workspace object to convert Decimals before updating
-            sanitized_workspace = self.sanitize(workspace)
+
+            # The document was sanitized on retrieval and only sanitized
+            # values were merged in, so it can be written as-is — the cost
+            # is O(|delta|) regardless of workspace size.
             #print(f'WORSKPACE > Inserting updated workspace')
             self.update_workspace_document(
-                sanitized_workspace,
+                workspace,
                 workspace['_id']
             )
             return True
         
         except Exception as e:
-            print(f'Error updating workspace: {str(e)}')
+            logger.error("Error updating workspace: %s", str(e))
             return False
 
     def _neutralize_workspace_value(self, value: Any, max_chars: int = 4000) -> str:
@@ -857,18 +1553,95 @@ class AgentUtilities:
             text = text[: max_chars - 14] + '...[truncated]'
         return text
 
+    def _llm_cache_get(self, payload):
+        """
+        Key the deterministic-response cache on a digest of the canonical
+        JSON of the request params. Returns (key, cached_value) where the
+        cached value is None on a miss; key is None when the payload is
+        not hashable (exotic objects in tools/messages).
+        """
+        try:
+            canonical = json.dumps(payload, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            return None, None
+        key = hashlib.sha256(canonical.encode()).hexdigest()
+        cached = self._llm_cache.get(key)
+        if cached is not None:
+            self._llm_cache.move_to_end(key)
+        return key, cached
+
+    def _llm_cache_put(self, key, value):
+        self._llm_cache[key] = value
+        if len(self._llm_cache) > self._LLM_CACHE_MAX_ENTRIES:
+            self._llm_cache.popitem(last=False)
+
+    def _embed_message(self, text):
+        """Embed a message for the semantic cache; None on failure."""
+        try:
+            response = self.AI.embeddings.create(
+                model=self._SEMANTIC_EMBED_MODEL, input=text
+            )
+            return response.data[0].embedding
+        except Exception as e:
+            logger.debug("Embedding call failed, skipping semantic cache: %s", e)
+            return None
+
+    def _semantic_cache_lookup(self, partition, text):
+        """
+        Look up a paraphrase-tolerant cache entry for text within a
+        partition (a digest of the surrounding action/belief state, so
+        hits can only come from the same context). Returns
+        (embedding, cached_value); the embedding is reused by the store
+        on a miss, and cached_value is None when nothing clears the
+        similarity threshold.
+        """
+        vector = self._embed_message(text)
+        if vector is None:
+            return None, None
+        entries = self._semantic_cache.get(partition)
+        if entries:
+            # Drop expired entries before scoring so a stale result can
+            # never win, then scan what is left.
+            cutoff = time.monotonic() - self._SEMANTIC_CACHE_TTL_SECONDS
+            entries[:] = [entry for entry in entries if entry[2] >= cutoff]
+        best_score = 0.0
+        best_value = None
+        for cached_vector, cached_value, _ in entries or ():
+            # OpenAI embeddings are unit-normalized, so the dot product
+            # is the cosine similarity
+            score = sum(a * b for a, b in zip(vector, cached_vector))
+            if score > best_score:
+                best_score = score
+                best_value = cached_value
+        if best_value is not None and best_score >= self._semantic_cache_threshold:
+            logger.debug("Semantic cache hit (similarity %.3f)", best_score)
+            return vector, best_value
+        return vector, None
+
+    def _semantic_cache_store(self, partition, vector, value):
+        if vector is None:
+            return
+        entries = self._semantic_cache.setdefault(partition, [])
+        entries.append((vector, value, time.monotonic()))
+        if len(entries) > self._SEMANTIC_CACHE_MAX_ENTRIES:
+            del entries[0]
+
     def llm(self, prompt):
         """
         Call the LLM with the given prompt.
-        
+
+        Deterministic calls (temperature 0.0) are served from an
+        exact-match cache when the params are byte-identical to a prior
+        call, skipping the network round trip entirely.
+
         Args:
             prompt (dict): The prompt to send to the LLM
-            
+
         Returns:
             The LLM response or False if error
         """
-        
-        
+
+
         try:
             # Create base parameters
             params = {
@@ -876,37 +1649,204 @@ class AgentUtilities:
                 'messages': '',
                 'temperature': 0.0
             }
-        
-            # Add optional parameters if they exist
-            if 'model' in prompt:
-                params['model'] = prompt['model']
-            if 'messages' in prompt:
-                params['messages'] = prompt['messages']
-            if 'temperature' in prompt:
-                params['temperature'] = prompt['temperature']
-            if 'tools' in prompt:
-                params['tools'] = prompt['tools']
-            if 'tool_choice' in prompt:
-                params['tool_choice'] = prompt['tool_choice']
-            if 'response_format' in prompt:
-                params['response_format'] = prompt['response_format']
-                
-            # AI_1 is gpt-3.5-turbo which doesn't support structured outputs. AI_2 uses gpt-4o-mini which does.
-            # response = self.AI_1.chat.completions.create(**params)     
-            response = self.AI_2.chat.completions.create(**params) 
-            
-            return response.choices[0].message
- 
+
+            # Add optional parameters if they exist (single lookup per key)
+            for key in ('model', 'messages', 'temperature', 'tools', 'tool_choice', 'response_format'):
+                try:
+                    params[key] = prompt[key]
+                except KeyError:
+                    pass
+
+            cache_key = None
+            if params['temperature'] == 0.0:
+                cache_key, cached = self._llm_cache_get(params)
+                if cached is not None:
+                    logger.debug("LLM cache hit for model %s", params['model'])
+                    return cached
+
+            # gpt-3.5-turbo doesn't support structured outputs; AI_2_MODEL (gpt-4o-mini) does.
+            response = self.chat_create(**params)
+
+            message = response.choices[0].message
+            if cache_key is not None:
+                self._llm_cache_put(cache_key, message)
+            return message
+
         except Exception as e:
-            print(f"Error running LLM call: {e}")
+            logger.error("Error running LLM call: %s", e)
             return False
 
+    def submit_batch(self, prompts):
+        """
+        Submit non-urgent prompts to the OpenAI Batch API (half price,
+        results within 24h) instead of the real-time pool — suited to
+        background work such as backfilling belief histories over past
+        conversations. Each prompt is a dict as accepted by llm().
+
+        Args:
+            prompts (list): Prompt dicts; an optional 'custom_id' per
+                prompt is used to match results, defaulting to its index
+
+        Returns:
+            dict: Success status with the batch id, or the error
+        """
+        action = 'submit_batch'
+        try:
+            lines = []
+            for index, prompt in enumerate(prompts):
+                params = {
+                    'model': '',
+                    'messages': '',
+                    'temperature': 0.0
+                }
+                for key in ('model', 'messages', 'temperature', 'tools', 'tool_choice', 'response_format'):
+                    try:
+                        params[key] = prompt[key]
+                    except KeyError:
+                        pass
+                lines.append(json.dumps({
+                    'custom_id': str(prompt.get('custom_id', index)),
+                    'method': 'POST',
+                    'url': '/v1/chat/completions',
+                    'body': params
+                }))
+
+            batch_file = self.AI.files.create(
+                file=('batch.jsonl', '\n'.join(lines).encode()),
+                purpose='batch'
+            )
+            batch = self.AI.batches.create(
+                input_file_id=batch_file.id,
+                endpoint='/v1/chat/completions',
+                completion_window='24h'
+            )
+            return {'success': True, 'action': action, 'input': len(prompts), 'output': batch.id}
+
+        except Exception as e:
+            logger.error("Error submitting batch: %s", e)
+            return {'success': False, 'action': action, 'input': len(prompts), 'output': str(e)}
+
+    def get_batch_results(self, batch_id):
+        """
+        Fetch the results of a submit_batch job. Non-blocking: while the
+        batch is still running the status is returned without output.
+
+        Args:
+            batch_id (str): The batch id returned by submit_batch
+
+        Returns:
+            dict: {'success', 'action', 'output'} where output maps
+                  custom_id -> response body once the batch completed,
+                  or the batch status while it is still in flight
+        """
+        action = 'get_batch_results'
+        try:
+            batch = self.AI.batches.retrieve(batch_id)
+            if batch.status != 'completed':
+                return {'success': False, 'action': action, 'input': batch_id, 'output': batch.status}
+
+            content = self.AI.files.content(batch.output_file_id)
+            results = {}
+            for line in content.text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                results[record.get('custom_id')] = record.get('response', {}).get('body')
+            return {'success': True, 'action': action, 'input': batch_id, 'output': results}
+
+        except Exception as e:
+            logger.error("Error retrieving batch %s: %s", batch_id, e)
+            return {'success': False, 'action': action, 'input': batch_id, 'output': str(e)}
+
+    def llm_stream(self, prompt):
+        """
+        Streaming variant of llm(): yields response deltas as the server
+        produces them, so callers can surface first tokens in well under a
+        second instead of waiting for the full completion. Use
+        collect_stream() to reassemble the deltas into a message dict for
+        the validators. Streamed calls bypass the deterministic cache.
+
+        Args:
+            prompt (dict): The prompt to send to the LLM
+
+        Yields:
+            The per-chunk choice delta objects
+        """
+        params = {
+            'model': '',
+            'messages': '',
+            'temperature': 0.0
+        }
+        for key in ('model', 'messages', 'temperature', 'tools', 'tool_choice', 'response_format'):
+            try:
+                params[key] = prompt[key]
+            except KeyError:
+                pass
+        params['stream'] = True
+
+        try:
+            for chunk in self.chat_create(**params):
+                if chunk.choices:
+                    yield chunk.choices[0].delta
+        except Exception as e:
+            logger.error("Error running streaming LLM call: %s", e)
+
+    def collect_stream(self, stream):
+        """
+        Accumulate llm_stream() deltas into a message-shaped dict that
+        validate_interpret_openai_llm_response accepts: content fragments
+        are joined and tool-call argument fragments are concatenated per
+        call index.
+
+        Args:
+            stream: Iterable of choice deltas from llm_stream()
+
+        Returns:
+            dict: {'role', 'content', 'tool_calls'} or False if the stream
+                  produced nothing
+        """
+        role = None
+        content_parts = []
+        tool_calls_by_index = {}
+        for delta in stream:
+            if delta is None:
+                continue
+            role = getattr(delta, 'role', None) or role
+            content = getattr(delta, 'content', None)
+            if content:
+                content_parts.append(content)
+            for tool_call in getattr(delta, 'tool_calls', None) or []:
+                entry = tool_calls_by_index.setdefault(tool_call.index, {
+                    'id': None,
+                    'type': 'function',
+                    'function': {'name': '', 'arguments': ''}
+                })
+                if getattr(tool_call, 'id', None):
+                    entry['id'] = tool_call.id
+                function = getattr(tool_call, 'function', None)
+                if function is not None:
+                    if getattr(function, 'name', None):
+                        entry['function']['name'] = function.name
+                    if getattr(function, 'arguments', None):
+                        entry['function']['arguments'] += function.arguments
+
+        if not content_parts and not tool_calls_by_index:
+            return False
+        return {
+            'role': role or 'assistant',
+            'content': ''.join(content_parts) if content_parts else None,
+            'tool_calls': (
+                [tool_calls_by_index[index] for index in sorted(tool_calls_by_index)]
+                if tool_calls_by_index else None
+            )
+        }
+
     def llm_responses(self, input_items, tools, model=None):
         """
         Call the OpenAI Responses API (not Completions) with the given input and tools.
         Returns a dict compatible with inca openai_adapter: {"output_text": str, "output": list}.
         """
-        if self.AI_2 is None:
+        if self.AI is None:
             return {"output_text": "", "output": []}
         try:
             params = {
@@ -914,9 +1854,12 @@ class AgentUtilities:
                 "input": input_items,
                 "tools": tools,
             }
-            if not hasattr(self.AI_2, "responses"):
+            if not hasattr(self.AI, "responses"):
                 return {"output_text": "", "output": []}
-            response = self.AI_2.responses.create(**params)
+            cache_key, cached = self._llm_cache_get(params)
+            if cached is not None:
+                return cached
+            response = self.AI.responses.create(**params)
             output_text_parts = []
             output_items = []
             output = getattr(response, "output", None) or []
@@ -936,12 +1879,15 @@ class AgentUtilities:
                             "name": getattr(c, "name", None),
                             "arguments": getattr(c, "input", None) or {},
                         })
-            return {
+            result = {
                 "output_text": "\n".join(output_text_parts).strip() if output_text_parts else "",
                 "output": output_items,
             }
+            if cache_key is not None:
+                self._llm_cache_put(cache_key, result)
+            return result
         except Exception as e:
-            print(f"Error running Responses API call: {e}")
+            logger.error("Error running Responses API call: %s", e)
             return {"output_text": "", "output": []}
 
     
@@ -951,21 +1897,21 @@ class AgentUtilities:
         
         """
         action = 'new_chat_thread_document'
-        print(f'Running: {action}')
+        logger.debug("Running: %s", action)
         
         try:
         # List threads
             threads = self.CHC.list_threads(self.portfolio,self.org,self.entity_type,self.entity_id)
-            print(f'List Threads: {threads}')
+            logger.debug("List Threads: %s", threads)
             
             if 'success' in threads:
                 if len(threads['items']) < 1:
                     # No threads found
-                    print('Creating new thread')
+                    logger.debug("Creating new thread")
                     response_2 = self.CHC.create_thread(self.portfolio,self.org,self.entity_type, self.entity_id, public_user=public_user)
                     
                     if not response_2.get('success'):
-                        print(f'Failed to create thread: {response_2}')
+                        logger.error("Failed to create thread: %s", response_2)
                         return {'success': False,'action': action,'input': '','output': response_2}
                 
                     thread = response_2['document']
@@ -985,7 +1931,7 @@ class AgentUtilities:
         
         except Exception as e:
             
-            print(f"Error getting/creating thread: {e}")
+            logger.error("Error getting/creating thread: %s", e)
             return {'success': False,'action': action,'output': f"{e}"}
                  
 
@@ -1002,7 +1948,7 @@ class AgentUtilities:
             dict: Success status and response
         """
         action = 'new_chat_message_document'
-        print(f'Running: {action}')  
+        logger.debug("Running: %s", action)
         
         try:
         
@@ -1034,7 +1980,9 @@ class AgentUtilities:
                 self.thread,
                 message_object
             )
-            
+
+            self._invalidate_turns_cache()
+
             '''
             response format
             
@@ -1057,10 +2005,11 @@ class AgentUtilities:
             '''
             
             
-            if 'document' in response and '_id' in response['document']:
-                self.chat_id = response['document']['_id']
+            document = response.get('document')
+            if document and document.get('_id'):
+                self.chat_id = document['_id']
             
-            print(f'Response: {response}')
+            logger.debug("Response: %s", response)
         
             if 'success' not in response:
                 return {'success': False, 'action': action, 'input': message, 'output': response}
@@ -1070,7 +2019,7 @@ class AgentUtilities:
         
         except Exception as e:
             
-            print(f"Error getting/creating turn: {e}")
+            logger.error("Error getting/creating turn: %s", e)
             return {'success': False,'action': action,'input': '','output': f"{e}"}
           
         
@@ -1086,77 +2035,110 @@ class AgentUtilities:
         Returns:
             dict: The workspace or False if not found
         """
-        workspaces_list = self.CHC.list_workspaces(
-            self.portfolio,
-            self.org,
-            self.entity_type,
-            self.entity_id,
-            self.thread
-        ) 
-        
-        if not workspaces_list['success']:
+        workspace = self._resolve_workspace(workspace_id=workspace_id)
+        if workspace is None:
             return False
-        
-        if len(workspaces_list['items']) == 0:
-            # Create a workspace as none exist
-            payload = {}
-            response = self.CHC.create_workspace(
-                self.portfolio,
-                self.org,
-                self.entity_type,
-                self.entity_id,
-                self.thread, payload
-            ) 
-            if not response['success']:
-                return False
-            # Regenerate workspaces_list
-            workspaces_list = self.CHC.list_workspaces(
-                self.portfolio,
-                self.org,
-                self.entity_type,
-                self.entity_id,
-                self.thread
-            ) 
-        
-        if not workspace_id:
-            workspace = workspaces_list['items'][-1]
-        else:
-            for w in workspaces_list['items']:
-                if w['_id'] == workspace_id:
-                    workspace = w
-                    break
-            else:
-                return False
-        
+
         # Sanitize workspace before returning to ensure no Decimals are present
         return self.sanitize(workspace)
 
     def sanitize(self, obj):
         """
         Sanitize an object for JSON serialization.
-        
+
+        Decimals become int (whole) or float, floats become strings.
+        Subtrees that need no conversion are returned as-is instead of
+        being rebuilt, so repeated passes over already-clean data are
+        nearly free. (A serializer round-trip can't express the
+        float-to-string rule, hence the explicit walk.)
+
+        The walk is iterative (explicit stack, exact-type dispatch) so
+        deep workspaces cost no Python recursion frames: one marking
+        pass finds the containers that hold a Decimal/float anywhere
+        below them, then only those containers are copied.
+
         Args:
             obj: The object to sanitize
-            
+
         Returns:
-            The sanitized object
+            The sanitized object (the original object if nothing changed)
         """
-        if isinstance(obj, list):
-            return [self.sanitize(x) for x in obj]
-        elif isinstance(obj, dict):
-            return {k: self.sanitize(v) for k, v in obj.items()}
-        elif isinstance(obj, Decimal):
-            # Convert Decimal to int if it's a whole number, otherwise float
-            return int(obj) if obj % 1 == 0 else float(obj)
-        elif isinstance(obj, float):
-            # Convert float to string
-            return str(obj)
-        elif isinstance(obj, int):
-            # Keep integers as is
+        obj_type = type(obj)
+        if obj_type in _SANITIZE_CLEAN_TYPES:
             return obj
-        else:
+        converter = _SANITIZE_SCALARS.get(obj_type)
+        if converter is not None:
+            return converter(obj)
+        if obj_type is not dict and obj_type is not list:
+            # Subclasses and unknown scalars keep the old isinstance rules
+            if isinstance(obj, Decimal):
+                return _sanitize_decimal(obj)
+            if isinstance(obj, float):
+                return str(obj)
             return obj
 
+        # Pass 1: mark every container whose subtree holds something to
+        # convert, following parent links so clean branches stay shared.
+        # Lists with no container children are remembered so pass 2 can
+        # convert them in one bulk pass.
+        parent_of = {}
+        dirty = set()
+        flat_lists = set()
+        stack = [obj]
+        while stack:
+            node = stack.pop()
+            is_list = type(node) is list
+            has_container_child = False
+            for child in (node if is_list else node.values()):
+                child_type = type(child)
+                if child_type in _SANITIZE_CLEAN_TYPES:
+                    continue
+                if child_type is dict or child_type is list:
+                    has_container_child = True
+                    parent_of[id(child)] = node
+                    stack.append(child)
+                elif child_type in _SANITIZE_SCALARS or isinstance(child, (Decimal, float)):
+                    marker = node
+                    while marker is not None and id(marker) not in dirty:
+                        dirty.add(id(marker))
+                        marker = parent_of.get(id(marker))
+            if is_list and not has_container_child:
+                flat_lists.add(id(node))
+
+        if id(obj) not in dirty:
+            return obj
+        if id(obj) in flat_lists:
+            return _sanitize_scalar_list(obj)
+
+        # Pass 2: rebuild only the dirty containers, converting scalars
+        # in place on the copies and sharing clean subtrees as-is.
+        result = dict(obj) if obj_type is dict else list(obj)
+        stack = [(obj, result)]
+        while stack:
+            source, target = stack.pop()
+            items = source.items() if type(source) is dict else enumerate(source)
+            for key, value in items:
+                value_type = type(value)
+                if value_type is dict or value_type is list:
+                    if id(value) in dirty:
+                        if id(value) in flat_lists:
+                            target[key] = _sanitize_scalar_list(value)
+                        else:
+                            copy = dict(value) if value_type is dict else list(value)
+                            target[key] = copy
+                            stack.append((value, copy))
+                elif value_type in _SANITIZE_CLEAN_TYPES:
+                    continue
+                else:
+                    converter = _SANITIZE_SCALARS.get(value_type)
+                    if converter is not None:
+                        target[key] = converter(value)
+                    elif isinstance(value, Decimal):
+                        target[key] = _sanitize_decimal(value)
+                    elif isinstance(value, float):
+                        target[key] = str(value)
+        return result
+
     def prune_history(self, history):
         """
         Prunes the history list to keep only the most recent value for each key while maintaining chronological order.
@@ -1168,27 +2150,18 @@ class AgentUtilities:
         Returns:
             list: Pruned history list with only the most recent value for each key
         """
-        # Create a dictionary to track the most recent value for each key
-        latest_values = {}
-        
-        # First pass: identify the most recent value for each key
-        for item in history:
-            key = item['key']
-            latest_values[key] = item
-        
-        # Second pass: create new list maintaining original order but only including latest values
+        # Single reverse pass keeps the first (i.e. newest) entry per key;
+        # the in-place reverse restores chronological order (newest at the
+        # bottom) without allocating a second list.
         pruned_history = []
         seen_keys = set()
-        
-        # Iterate through history in reverse to maintain chronological order
         for item in reversed(history):
             key = item['key']
             if key not in seen_keys:
-                pruned_history.append(item)
                 seen_keys.add(key)
-        
-        # Reverse back to maintain original order (newest at bottom)
-        return list(reversed(pruned_history))
+                pruned_history.append(item)
+        pruned_history.reverse()
+        return pruned_history
 
     def string_from_object(self, object: dict) -> str:
         """
@@ -1206,20 +2179,10 @@ class AgentUtilities:
         """
         if not object:
             return ""
-            
-        formatted_pairs = []
-        for key, value in object.items():
-            # Convert value to string and handle different types appropriately
-            if isinstance(value, (int, float)):
-                formatted_value = str(value)
-            elif isinstance(value, str):
-                formatted_value = value
-            else:
-                formatted_value = str(value)
-                
-            formatted_pairs.append(f"{key} = {formatted_value}")
-            
-        return ", ".join(formatted_pairs)
+
+        # f-string interpolation stringifies every value type the old
+        # isinstance chain handled; one pass, no intermediate list.
+        return ", ".join(f"{key} = {value}" for key, value in object.items())
 
     def format_object_to_slash_string(self, obj: dict) -> str:
         """
@@ -1239,24 +2202,22 @@ class AgentUtilities:
         """
         if not obj:
             return ""
-            
-        values = []
-        # Sort keys alphabetically
-        for key in sorted(obj.keys()):
-            value = obj[key]
-            if isinstance(value, str):
-                values.append(value)
-            else:
-                values.append("")
-                
-        return "/".join(values)
 
-    def clean_json_response(self, response):
+        # Keys sorted alphabetically; one generator pass over the dict
+        return "/".join(
+            obj[key] if isinstance(obj[key], str) else ""
+            for key in sorted(obj)
+        )
+
+    def clean_json_response(self, response, sanitized=False):
         """
         Cleans and validates a JSON response string from LLM.
         
         Args:
             response (str): The raw JSON response string from LLM
+            sanitized (bool): Parse floats as strings (the conversion
+                sanitize() applies), yielding a tree that needs no
+                separate sanitize pass
             
         Returns:
             dict: The parsed JSON object if successful
@@ -1265,79 +2226,92 @@ class AgentUtilities:
         Raises:
             json.JSONDecodeError: If the response cannot be parsed as JSON
         """
+        loads = _SANITIZED_DECODER.decode if sanitized else _fast_loads
         try:
-            # Clean the response by ensuring property names are properly quoted
-            cleaned_response = response
-            # Remove any comments (both single-line and multi-line)
-            cleaned_response = re.sub(r'//.*?$', '', cleaned_response, flags=re.MULTILINE)  # Remove single-line comments
-            cleaned_response = re.sub(r'/\*.*?\*/', '', cleaned_response, flags=re.DOTALL)  # Remove multi-line comments
-            
-            # First try to parse as is
+            # Fast path: most responses are already valid JSON
             try:
-                return json.loads(cleaned_response)
+                return loads(response)
             except json.JSONDecodeError:
                 pass
-                
-            # If that fails, try to fix common issues
-            # Handle unquoted property names at the start of the object
-            cleaned_response = re.sub(r'^\s*{\s*(\w+)(\s*:)', r'{"\1"\2', cleaned_response)
-            
-            # Handle unquoted property names after commas
-            cleaned_response = re.sub(r',\s*(\w+)(\s*:)', r',"\1"\2', cleaned_response)
-            
-            # Handle unquoted property names after newlines
-            cleaned_response = re.sub(r'\n\s*(\w+)(\s*:)', r'\n"\1"\2', cleaned_response)
-            
-            # Replace single quotes with double quotes for property names
-            cleaned_response = re.sub(r'([{,]\s*)\'(\w+)\'(\s*:)', r'\1"\2"\3', cleaned_response)
-            
-            # Replace single quotes with double quotes for string values
-            # This regex looks for : 'value' pattern and replaces it with : "value"
-            cleaned_response = re.sub(r':\s*\'([^\']*)\'', r': "\1"', cleaned_response)
-            
+
+            # Remove any comments (both single-line and multi-line), then
+            # retry before running the heavier fixups
+            cleaned_response = _JSON_COMMENT_RE.sub('', response)
+            try:
+                return loads(cleaned_response)
+            except json.JSONDecodeError:
+                pass
+
+            # If that fails, try to fix common issues. All patterns are
+            # precompiled at module level, one scan of the string each:
+            # unquoted property names (object start / after comma / newline)
+            cleaned_response = _UNQUOTED_KEY_RE.sub(r'\1"\2"\3', cleaned_response)
+
+            # Single-quoted property names and string values
+            cleaned_response = _SINGLE_QUOTE_KEY_RE.sub(r'\1"\2"\3', cleaned_response)
+            cleaned_response = _SINGLE_QUOTE_VAL_RE.sub(r': "\1"', cleaned_response)
+
             # Remove spaces between colons and boolean values
-            cleaned_response = re.sub(r':\s+(true|false|True|False)', r':\1', cleaned_response)
-            
+            cleaned_response = _BOOL_SPACE_RE.sub(r':\1', cleaned_response)
+
             # Remove trailing commas in objects and arrays
-            # This regex will match a comma followed by whitespace and then a closing brace or bracket
-            cleaned_response = re.sub(r',(\s*[}\]])', r'\1', cleaned_response)
-            
+            cleaned_response = _TRAILING_COMMA_RE.sub(r'\1', cleaned_response)
+
             # Remove any timestamps in square brackets
-            cleaned_response = re.sub(r'\[\d+\]\s*', '', cleaned_response)
-            
+            cleaned_response = _BRACKET_TS_RE.sub('', cleaned_response)
+
             # Try to parse the cleaned response
             try:
-                return json.loads(cleaned_response)
+                return loads(cleaned_response)
             except json.JSONDecodeError as e:
-                print(f"First attempt failed. Error: {e}")
-                
+                logger.error("First attempt failed. Error: %s", e)
+
                 # If first attempt fails, try to fix the raw field specifically
                 # Find the raw field and ensure it's properly formatted
-                raw_match = re.search(r'"raw":\s*({[^}]+})', cleaned_response)
+                raw_match = _RAW_FIELD_RE.search(cleaned_response)
                 if raw_match:
                     raw_content = raw_match.group(1)
                     # Convert single quotes to double quotes in the raw content
                     raw_content = raw_content.replace("'", '"')
                     # Replace the raw field with the cleaned version
                     cleaned_response = cleaned_response[:raw_match.start(1)] + raw_content + cleaned_response[raw_match.end(1):]
-                
-                return json.loads(cleaned_response)
-        
+
+                return loads(cleaned_response)
+
         except json.JSONDecodeError as e:
-            print(f"Error parsing cleaned JSON response: {e}")
+            logger.error("Error parsing cleaned JSON response: %s", e)
             raise
 
     def _convert_to_dict(self, obj):
         """
-        Recursively converts an OpenAI response object to a dictionary.
-        
+        Converts an OpenAI response object to a dictionary.
+
+        Current SDK objects are pydantic models, so model_dump() (whose
+        tree walk runs in pydantic-core) is preferred; to_dict() covers
+        older SDKs and the Python recursion remains as the last resort
+        for plain objects.
+
         Args:
             obj: The object to convert (can be ChatCompletionMessage, ChatCompletionMessageToolCall, etc.)
-            
+
         Returns:
             dict: The converted dictionary
         """
-        if hasattr(obj, '__dict__'):
+        if hasattr(obj, 'model_dump'):
+            return obj.model_dump()
+        elif hasattr(obj, 'to_dict'):
+            return obj.to_dict()
+        elif hasattr(obj, '__dict__'):
+            if _orjson is not None:
+                # Round-trip through orjson when available: the __dict__
+                # expansion then runs per node in C instead of one Python
+                # frame each. Falls through on anything it can't encode.
+                try:
+                    return _orjson.loads(
+                        _orjson.dumps(obj, default=lambda value: value.__dict__)
+                    )
+                except (TypeError, ValueError):
+                    pass
             return {key: self._convert_to_dict(value) for key, value in obj.__dict__.items()}
         elif isinstance(obj, list):
             return [self._convert_to_dict(item) for item in obj]
@@ -1374,7 +2348,7 @@ class AgentUtilities:
                 return json.dumps(outer_parsed)
                 
         except json.JSONDecodeError as e:
-            print(f"Error parsing double-escaped JSON: {e}")
+            logger.error("Error parsing double-escaped JSON: %s", e)
             return None
 
     def validate_interpret_openai_llm_response(self, raw_response: dict) -> dict:
@@ -1421,7 +2395,7 @@ class AgentUtilities:
                     
                 required_fields = ['id', 'type', 'function']
                 for field in required_fields:
-                    if field not in tool_call or tool_call[field] is None:
+                    if tool_call.get(field) is None:
                         return {"success": False, "action": action, "input": response, "output": f"Tool call missing required field '{field}' or field is null"}
                         
                 if tool_call['type'] != 'function':
@@ -1432,20 +2406,20 @@ class AgentUtilities:
                     
                 function_required_fields = ['name', 'arguments']
                 for field in function_required_fields:
-                    if field not in tool_call['function'] or tool_call['function'][field] is None:
+                    if tool_call['function'].get(field) is None:
                         return {"success": False, "action": action, "input": response, "output": f"Tool call function missing required field '{field}' or field is null"}
                         
                 # Validate that arguments is a valid JSON string
                 try:
                     if isinstance(tool_call['function']['arguments'], str):
-                        json.loads(tool_call['function']['arguments'])
+                        _fast_loads(tool_call['function']['arguments'])
                 except json.JSONDecodeError:
                     # Try to fix double-escaped JSON
                     escape_result = self.remove_outer_escape(tool_call['function']['arguments'])
                     if escape_result:
                         # Validate the cleaned result
                         try:
-                            json.loads(escape_result)
+                            _fast_loads(escape_result)
                             tool_call['function']['arguments'] = escape_result
                         except json.JSONDecodeError:
                             return {"success": False, "action": action, "input": response, "output": "Tool call arguments must be a valid JSON string after cleaning"}
@@ -1472,32 +2446,34 @@ class AgentUtilities:
         """
         #print(f'Raw message_list: {message_list}')
         
-        # Find the indices of the last x tool messages
-        tool_indices = []
+        # Find the indices of the last x tool messages (a set so the
+        # membership check below is O(1))
+        tool_indices = set()
         for i in range(len(message_list) - 1, -1, -1):
             if message_list[i].get('role') == 'tool':
-                tool_indices.append(i)
+                tool_indices.add(i)
                 if len(tool_indices) >= recent_tool_messages:
                     break
-        
+
         # Clear content from all tool messages except the last x ones
         for i, message in enumerate(message_list):
             if message.get('role') == 'tool' and i not in tool_indices:
-                print(f'Found a tool message')
+                logger.debug("Found a tool message")
                 # Actually clear the content (set to empty string)
                 message['content'] = ""
             else:
+                content = message.get('content')
+                if isinstance(content, str):
+                    # Already API-ready; the sanitize + str round trip
+                    # would be an identity copy, so skip it
+                    continue
                 # Convert complex content to string format for OpenAI API
-                if isinstance(message.get('content'), list):
-                    # If content is an array, sanitize and convert it to a JSON string
-                    sanitized_content = self.sanitize(message['content'])
-                    message['content'] = json.dumps(sanitized_content)
-                elif isinstance(message.get('content'), dict):
-                    # If content is an object, sanitize and convert it to a JSON string
-                    sanitized_content = self.sanitize(message['content'])
-                    message['content'] = json.dumps(sanitized_content)
+                if isinstance(content, (list, dict)):
+                    # Sanitize and convert arrays/objects to a JSON string
+                    sanitized_content = self.sanitize(content)
+                    message['content'] = _fast_dumps(sanitized_content)
                 else:
-                    # If content is already a string or other type, sanitize and convert to string
+                    # Other types sanitize and cast to string
                     sanitized_content = self.sanitize(message.get('content', ''))
                     message['content'] = str(sanitized_content)
                 
@@ -1521,178 +2497,151 @@ class AgentUtilities:
         try:        
             # Get current time and date
             current_time = datetime.now().strftime("%Y-%m-%d")
-             
-            dict_actions = {}
-            for a in list_actions:
-                dict_actions[a['key']] = {
-                    'goal': a.get('goal', ''),
-                    'key': a.get('key', ''),
-                    'utterances': a.get('utterances', ''),
-                    'slots': a.get('slots', '')
+
+            # The action list is the same for every message in a
+            # conversation; reuse the derived dict instead of rebuilding
+            # it per turn.
+            fingerprint = tuple(a['key'] for a in list_actions)
+            cached_actions = self._dict_actions_cache.get(fingerprint)
+            if cached_actions is None:
+                dict_actions = {
+                    a['key']: {
+                        'goal': a.get('goal', ''),
+                        'key': a.get('key', ''),
+                        'utterances': a.get('utterances', ''),
+                        'slots': a.get('slots', '')
+                    }
+                    for a in list_actions
                 }
+                # This serialized form feeds the prompt every turn;
+                # build it once here rather than per message, compact
+                # (indentation is billable tokens the model doesn't need)
+                # and byte-stable for prefix caching.
+                dict_actions_json = _fast_dumps_decimal(dict_actions)
+                self._dict_actions_cache[fingerprint] = (dict_actions, dict_actions_json)
+            else:
+                dict_actions, dict_actions_json = cached_actions
             
-            # Get current workspace
+            # Get current workspace; resolve state once instead of
+            # re-chaining workspace.get('state', {}) per field
             workspace = self.get_active_workspace()
-            current_action = workspace.get('state', {}).get('action', '') if workspace else ''
-            last_belief = workspace.get('state', {}).get('belief', {}) if workspace else {}
-            belief_history = workspace.get('state', {}).get('history', []) if workspace else []
-                    
-            # Clean and prepare belief history if provided
-            cleaned_belief_history = self.sanitize(belief_history) if belief_history else []
-            pruned_belief_history = self.prune_history(cleaned_belief_history) if cleaned_belief_history else []
-            prompt_text = f"""
-            You are a comprehensive message processing module for a BDI agent. Your task is to process a user message through multiple stages in a single pass.
-
-            STAGE 1 - PERCEPTION AND INTERPRETATION:
-            Extract structured information from the raw message:
-            - Identify the user's intent
-            - Extract key entities mentioned
-            - Note any tools that might be needed
-            - For each entity detected, create a belief history entry with:
-            * type: "belief"
-            * key: entity name
-            * val: entity value
-            * time: current timestamp
-
-            STAGE 2 - INFORMATION PROCESSING:
-            Enrich and normalize the extracted information:
-            - Normalize values (e.g., convert "tomorrow" to full date)
-            - Add derived information
-            - Validate and standardize formats
-            - Compare available beliefs with the slots required by the matched action
-            - Identify missing beliefs by:
-            * Checking each required slot from the matched action
-            * Verifying if we have corresponding values in current beliefs
-            * Considering both exact matches and semantic equivalents
-            * Including slots that are required but not yet provided
-            - Track missing beliefs that are essential for completing the current task
-
-            STAGE 3 - FACT EXTRACTION:
-            From the belief history, extract the most up-to-date facts:
-            - Use the most recent value for each key
-            - Combine with newly extracted information
-            - Maintain chronological order
-
-            STAGE 4 - DESIRE DETECTION:
-            Analyze the combined information to determine the user's goal:
-            - Consider the current action: {current_action}
-            - Review the entire belief history to understand the ongoing conversation context
-            - Consider the chronological progression of user's statements and preferences
-            - Only change the previously detected desire if:
-            * The new message explicitly states a different intention
-            * The new message provides critical information that fundamentally changes the goal
-            * The user explicitly requests to change their previous intention
-            - If the new message only adds facts without changing intent, maintain the previous desire
-            - Summarize the user's desire in a natural language sentence
-            - Focus on the primary objective that has been consistent throughout the conversation
-
-            STAGE 5 - ACTION MATCHING:
-            Match the processed information with available actions:
-            - Consider the current action: {current_action}
-            - Only change the current action if:
-            * The new message explicitly requests a different action
-            * The new message's intent clearly conflicts with the current action
-            * The user explicitly states they want to do something else
-            - If the new message only adds information without changing intent:
-            * Keep the current action
-            * Use the message to fill missing slots
-            * Update any relevant beliefs
-            - Compare intent and beliefs with action descriptions
-            - Consider the full belief history when matching
-            - Select the most appropriate action
-            - Provide confidence score
-
-            Today's date is {current_time}
-
-            ### Available Actions:
-            {json.dumps(dict_actions, indent=2)}
-
-            ### Current Belief:
-            {json.dumps(last_belief, indent=2) if last_belief else "{}"}
-
-            ### Belief History:
-            {json.dumps(pruned_belief_history, indent=2) if pruned_belief_history else "[]"}
-
-            ### User Message:
-            {message}
-
-            Return a JSON object with the following structure:
-            {{
-                "perception": {{
-                    "intent": "string",
-                    "entities": {{}},
-                    "raw_text": "string",
-                    "needs_tools": []
-                }},
-                "processed_info": {{
-                    "enriched_entities": {{}},
-                    "missing_beliefs": [],
-                    "normalized_values": {{}}
-                }},
-                "facts": {{
-                    // Key-value pairs of extracted facts
-                }},
-                "desire": "string",
-                "action_match": {{
-                    "confidence": 0-100,
-                    "action": "string" // Use the key of the action,
-                    "reasoning": "string",
-                    "action_changed": boolean,
-                    "change_reason": "string"
-                }},
-                "belief_history_updates": [
-                    {{
-                        "type": "belief",
-                        "key": "string",
-                        "val": "any",
-                        "time": "ISO timestamp"
-                    }}
-                ]
-            }}
-
-            IMPORTANT RULES:
-            1. Always use the most recent value for each fact
-            2. Maintain all original information while enriching it
-            3. Provide clear reasoning for action matching
-            3b. Use the action key to indicate what action has been selected.
-            4. Return valid JSON with all strings properly quoted
-            5. For each new entity detected, create a belief history entry
-            6. Use the belief history to inform action matching
-            7. Include timestamps in ISO format for belief history entries
-            8. Consider historical context when matching actions
-            9. Only change the current action when explicitly requested or necessary
-            10. Use new information to fill missing slots in the current action
-            """
-            prompt = {
-                "model": self.AI_1_MODEL,
-                "messages": [{ "role": "user", "content": prompt_text}],
-                "temperature":0
-            }
-            response = self.llm(prompt)
-            
-            if not response.content:
-                raise Exception('LLM response is empty')
-                
-            
-            #print(f'PROCESS MESSAGE PROMPT >> {prompt}')
-            result = self.clean_json_response(response.content)
-            sanitized_result = self.sanitize(result)
+            workspace_state = (workspace or {}).get('state') or {}
+            current_action = workspace_state.get('action', '')
+            last_belief = workspace_state.get('belief', {})
+
+            # Prefer the pruned view _mutate_belief_history maintains
+            # incrementally; documents that predate it fall back to the
+            # full sanitize+prune pass over the history.
+            pruned_belief_history = workspace_state.get('history_pruned')
+            if pruned_belief_history is not None:
+                pruned_belief_history = self.sanitize(pruned_belief_history)
+            else:
+                belief_history = workspace_state.get('history', [])
+                cleaned_belief_history = self.sanitize(belief_history) if belief_history else []
+                pruned_belief_history = self.prune_history(cleaned_belief_history) if cleaned_belief_history else []
+
+            # Sealed-prefix/recent-tail split maintained by
+            # _mutate_belief_history: only the tail block changes between
+            # turns, so the provider prompt cache keeps everything up to
+            # it. Documents without the split render an empty stable
+            # block and the whole pruned view as recent.
+            history_prefix = workspace_state.get('history_prefix')
+            history_tail = workspace_state.get('history_tail')
+            if history_prefix is None and history_tail is None:
+                history_prefix = []
+                history_tail = pruned_belief_history
+            else:
+                history_prefix = self.sanitize(history_prefix or [])
+                history_tail = self.sanitize(history_tail or [])
+
+            # Opt-in semantic cache: a paraphrase of an earlier message
+            # processed in the same action/belief context reuses its
+            # result without calling the LLM. The partition digest pins
+            # the context, so only the message wording may vary.
+            cached_result = None
+            semantic_key = None
+            semantic_vector = None
+            if self._semantic_cache_threshold > 0:
+                semantic_key = hashlib.sha256(json.dumps(
+                    [fingerprint, current_action, last_belief, pruned_belief_history],
+                    sort_keys=True, default=str
+                ).encode()).hexdigest()
+                semantic_vector, cached_result = self._semantic_cache_lookup(semantic_key, message)
+
+            # Volatile context only; the instruction scaffolding lives in
+            # the static system prompt so the provider-side prompt cache
+            # sees an unchanged prefix. Within this block the slowest-
+            # changing sections come first for the same reason.
+            user_content = f"""### Available Actions:
+{dict_actions_json}
+
+Today's date is {current_time}
+
+### Current Action:
+{current_action}
+
+### Current Belief:
+{_fast_dumps_decimal(last_belief) if last_belief else "{}"}
+
+### Belief History (stable):
+{_fast_dumps_decimal(history_prefix) if history_prefix else "[]"}
+
+### Belief History (recent):
+{_fast_dumps_decimal(history_tail) if history_tail else "[]"}
+
+### User Message:
+{message}"""
+            if cached_result is not None:
+                sanitized_result = cached_result
+            else:
+                prompt = {
+                    "model": self.AI_SMALL_MODEL,
+                    "messages": [
+                        { "role": "system", "content": _PRE_PROCESS_SYSTEM_PROMPT},
+                        { "role": "user", "content": user_content}
+                    ],
+                    "temperature":0,
+                    # Constrain decoding to the response schema so the
+                    # clean_json_response fixups stay on their fast path
+                    "response_format": _PRE_PROCESS_RESPONSE_FORMAT
+                }
+                response = self.llm(prompt)
+
+                if not response.content:
+                    raise Exception('LLM response is empty')
+
+
+                #print(f'PROCESS MESSAGE PROMPT >> {prompt}')
+                # sanitized=True stringifies floats at decode time, so
+                # the parsed tree is clean without a second walk
+                sanitized_result = self.clean_json_response(response.content, sanitized=True)
+                if semantic_key is not None:
+                    self._semantic_cache_store(semantic_key, semantic_vector, sanitized_result)
             
-            # Update workspace with the results
+            # Update workspace with the results — collect every change and
+            # apply them through a single mutate_workspace call so the
+            # whole batch costs one fetch/sanitize/write instead of one per
+            # change.
+            changes = {}
             if 'facts' in sanitized_result:
-                self.mutate_workspace({'belief': sanitized_result['facts']})
-            
+                changes['belief'] = sanitized_result['facts']
+
             if 'desire' in sanitized_result:
-                self.mutate_workspace({'desire': sanitized_result['desire']})
-            
+                changes['desire'] = sanitized_result['desire']
+
             if 'action_match' in sanitized_result and 'action' in sanitized_result['action_match']:
-                # Check if action.key is used instead of action.name  
-                self.mutate_workspace({'action': sanitized_result['action_match']['action']})
-            
+                # Check if action.key is used instead of action.name
+                changes['action'] = sanitized_result['action_match']['action']
+
             # Update belief history with new entities
-            if 'belief_history_updates' in sanitized_result:
-                for update in sanitized_result['belief_history_updates']:
-                    self.mutate_workspace({'belief_history': {update['key']: update['val']}})
+            if sanitized_result.get('belief_history_updates'):
+                changes['belief_history'] = {
+                    update['key']: update['val']
+                    for update in sanitized_result['belief_history_updates']
+                }
+
+            if changes:
+                self.mutate_workspace(changes)
             
             #self.print_chat(sanitized_result, 'json')
              
@@ -1704,7 +2653,7 @@ class AgentUtilities:
             }
             
         except Exception as e:
-            print(f"Error Pre-Processing message: {e}")
+            logger.error("Error Pre-Processing message: %s", e)
             # Only print raw response if it exists
             
             return {
@@ -1718,58 +2667,65 @@ class AgentUtilities:
         
         action = 'interpret'
         self.print_chat('Interpreting message...', 'transient')
-        print('interpret')
+        logger.debug("interpret")
         
         try:
-            # We get the message history directly from the source of truth to avoid missing tool id calls. 
-            message_list = self.get_message_history()
-            
+            # We get the message history directly from the source of truth to avoid missing tool id calls.
+            # The history and workspace fetches are independent round-trips, so run them concurrently.
+            history_future = self.io_executor.submit(self.get_message_history)
+            workspace_future = self.io_executor.submit(self.get_active_workspace)
+            message_list = history_future.result()
+
             #print(f'Raw Message History: {message_list}')
-            
+
             # Go through the message_list and replace the value of the 'content' attribute with an empty object when the role is 'tool'
-            # Unless the last message it a tool response which the interpret function needs to process. 
-            # The reason is that we don't want to overwhelm the LLM with the contents of the history of tool outputs. 
-            
+            # Unless the last message it a tool response which the interpret function needs to process.
+            # The reason is that we don't want to overwhelm the LLM with the contents of the history of tool outputs.
+
             # Clear content from all tool messages except the last one
             message_list = self.clear_tool_message_content(message_list['output'])
-            
+
             #print(f'Cleared Message History: {message_list}')
-            
-            
+
+
             # Get current time and date
             current_time = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
-            
+
             # Workspace
-            workspace = self.get_active_workspace()
+            workspace = workspace_future.result()
             
-            # Action  
-            current_action = workspace.get('state', {}).get('action', '') if workspace else ''
-            print(f'Current Action:{current_action}')
+            # Resolve state once instead of re-chaining
+            # workspace.get('state', {}) per field
+            workspace_state = (workspace or {}).get('state') or {}
+
+            # Action
+            current_action = workspace_state.get('action', '')
+            logger.debug("Current Action:%s", current_action)
             
-            action_instructions = '' 
+            action_instructions = ''
             action_tools = ''
-            
-            for a in list_actions:
-                if a['key'] == current_action:
-                    action_instructions = a['prompt_3_reasoning_and_planning']
-                    if 'tools_reference' in a and a['tools_reference'] and a['tools_reference'] not in ['_','-','.']: 
-                        action_tools = a['tools_reference']
-                    break
+
+            matched_action = self.actions_by_key(list_actions).get(current_action)
+            if matched_action is not None:
+                action_instructions = matched_action['prompt_3_reasoning_and_planning']
+                tools_reference = matched_action.get('tools_reference')
+                if tools_reference and tools_reference not in ('_', '-', '.'):
+                    action_tools = tools_reference
 
             # Belief  
-            current_beliefs = workspace.get('state', {}).get('beliefs', {}) if workspace else {}
+            current_beliefs = workspace_state.get('beliefs', {})
             belief_str = 'Current beliefs: ' + self.string_from_object(current_beliefs)
             if workspace and workspace.get('intent'):
                 belief_str += ' Current intent: ' + self.string_from_object(workspace['intent'])
-            print(f'Current Belief:{belief_str}')
+            logger.debug("Current Belief:%s", belief_str)
                 
             #belief_history = workspace.get('state', {}).get('history', []) if workspace else []             
             #cleaned_belief_history = self.sanitize(belief_history) if belief_history else []
             #pruned_belief_history = self.prune_history(cleaned_belief_history) if cleaned_belief_history else []
 
             # Desire
-            current_desire = workspace.get('state', {}).get('desire', '') if workspace else ''
-            print(f'Current Desire:{current_desire}')
+            current_desire = workspace_state.get('desire', '')
+            logger.debug("Current Desire:%s", current_desire)
             
             # Meta Instructions
             meta_instructions = {}
@@ -1780,27 +2736,30 @@ class AgentUtilities:
             # Message to answer questions from the belief system
             meta_instructions['answer_from_belief'] = "You can reason over the message history and known facts (beliefs) to answer user questions. If the user asks a question, check the history or beliefs before asking again."
                   
-            # Message array
+            # Message array. Static instructions lead and the volatile
+            # blocks (time, beliefs) trail so the provider-side prompt
+            # cache gets the longest possible stable prefix.
             messages = [
                 { "role": "system", "content": meta_instructions['opening_message']}, # META INSTRUCTIONS
-                { "role": "system", "content": meta_instructions['current_time']}, # CURRENT TIME         
+                { "role": "system", "content": meta_instructions['answer_from_belief']},
                 { "role": "system", "content": action_instructions}, # CURRENT ACTIONS
-                { "role": "system", "content": belief_str }, # BELIEF SYSTEM
-                { "role": "system", "content": meta_instructions['answer_from_belief']}
+                { "role": "system", "content": meta_instructions['current_time']}, # CURRENT TIME
+                { "role": "system", "content": belief_str } # BELIEF SYSTEM
             ]
             
             # Add the incoming messages
             for msg in message_list:      
                 messages.append(msg)       
                 
-            # Initialize approved_tools with default empty list
-            approved_tools = []
+            # Initialize approved_tools with default empty set
+            approved_tools = frozenset()
                 
             # Request asking the recommended tools for this action
             if action_tools and not no_tools:
                 messages.append({ "role": "system", "content":f'In case you need them, the following tools are recommended to execute this action: {json.dumps(action_tools)}'})  
                 
-                approved_tools = [tool.strip() for tool in action_tools.split(',')]
+                # Frozenset so the per-tool membership check below is O(1)
+                approved_tools = frozenset(tool.strip() for tool in action_tools.split(',') if tool.strip())
                     
             # Tools           
             '''   
@@ -1821,66 +2780,18 @@ class AgentUtilities:
             '''
             
             
-            if no_tools:                
-                available_tools = None      
-                   
-            else:         
-                available_tools_raw = list_tools
-                
-                #print(f'List Tools:{available_tools_raw}')
-                
-                available_tools = [] 
-                for t in available_tools_raw:
-                    
-                    if t.get('key') in approved_tools:
-                        # Parse the escaped JSON string into a Python object
-                        try:
-                            tool_input = json.loads(t.get('input', '[]'))
-                        except json.JSONDecodeError:
-                            print(f"Invalid JSON in tool input for tool {t.get('key', 'unknown')}. Using empty array.")
-                            tool_input = []
-                        
-                        dict_params = {}
-                        required_params = []
-                        
-                        # Handle new format: array of objects with name, hint, required
-                        if isinstance(tool_input, list):
-                            for param in tool_input:
-                                if isinstance(param, dict) and 'name' in param and 'hint' in param:
-                                    param_name = param['name']
-                                    param_hint = param['hint']
-                                    param_required = param.get('required', False)
-                                    
-                                    dict_params[param_name] = {
-                                        'type': 'string',
-                                        'description': param_hint
-                                    }
-                                    
-                                    if param_required:
-                                        required_params.append(param_name)
-                        # Handle old format for backward compatibility
-                        elif isinstance(tool_input, dict):
-                            for key, val in tool_input.items():
-                                dict_params[key] = {'type': 'string', 'description': val}
-                                required_params.append(key)
-                                
-                        print(f'Required parameters:{required_params}')
-                            
-                        tool = {
-                            'type': 'function',
-                            'function': {
-                                'name': t.get('key', ''),
-                                'description': t.get('goal', ''),
-                                'parameters': {
-                                    'type': 'object',
-                                    'properties': dict_params,
-                                    'required': required_params
-                                }
-                            }    
-                        }
-    
-                        available_tools.append(tool)            
-                    
+            if no_tools:
+                available_tools = None
+
+            else:
+                # Schemas are memoized per (key, goal, input) triple, so an
+                # unchanged tool definition skips the parse/assembly work.
+                available_tools = [
+                    _build_tool_schema(t.get('key', ''), t.get('goal', ''), t.get('input', '[]'))
+                    for t in list_tools
+                    if t.get('key') in approved_tools
+                ]
+
             # Prompt
             prompt = {
                     "model": self.AI_1_MODEL,
@@ -1929,7 +2840,7 @@ class AgentUtilities:
             }
             
         except Exception as e:
-            print(f"Error in interpret() message: {e}")
+            logger.error("Error in interpret() message: %s", e)
             return {
                 'success': False,
                 'action': action,
@@ -1939,45 +2850,78 @@ class AgentUtilities:
     
         
         
+    def actions_by_key(self, list_actions):
+        """
+        Index a list_actions payload by action key, memoized per list
+        identity (same validation as the step-index memo). The action
+        list is stable across a conversation, so per-turn lookups cost
+        one dict probe instead of a scan.
+        """
+        memo = self._actions_by_key_cache.get(id(list_actions))
+        if memo is not None and memo[0] == len(list_actions) and memo[1] is list_actions:
+            return memo[2]
+        index = {a['key']: a for a in list_actions}
+        if len(self._actions_by_key_cache) > 64:
+            self._actions_by_key_cache.clear()
+        self._actions_by_key_cache[id(list_actions)] = (len(list_actions), list_actions, index)
+        return index
+
+    def _update_context(self, **kwargs):
+        """Update fields on the shared request context owned by agent_core."""
+        # Imported lazily: agent_core imports this module at load time.
+        from renglo.agent.agent_core import request_context
+        context = request_context.get()
+        for key, value in kwargs.items():
+            setattr(context, key, value)
+        request_context.set(context)
+
     ## Execution of Intentions
     def act(self,plan,list_tools=[]):
         action = 'act'
-        
-        list_handlers = {}
-        for t in list_tools_raw:
-            list_handlers[t.get('key', '')] = t.get('handler', '')
-            
+
+        # Handler routes rarely change within a conversation; reuse the
+        # derived map when act() sees the same tool list again (same
+        # identity-plus-length validation as the step index memo).
+        memo = self._list_handlers_cache.get(id(list_tools))
+        if memo is not None and memo[0] == len(list_tools) and memo[1] is list_tools:
+            list_handlers = memo[2]
+        else:
+            list_handlers = {t.get('key', ''): t.get('handler', '') for t in list_tools}
+            if len(self._list_handlers_cache) > 64:
+                self._list_handlers_cache.clear()
+            self._list_handlers_cache[id(list_tools)] = (len(list_tools), list_tools, list_handlers)
+
         self._update_context(list_handlers=list_handlers)
-    
+
         """Execute the current intention and return standardized response"""
         try:
             
             tool_name = plan['tool_calls'][0]['function']['name']
             params = plan['tool_calls'][0]['function']['arguments']
             if isinstance(params, str):
-                params = json.loads(params)
+                params = _fast_loads(params)
             tid = plan['tool_calls'][0]['id']
             
-            print(f'tid:{tid}')
+            logger.debug("tid:%s", tid)
 
             if not tool_name:
                 raise ValueError("❌ No tool name provided in tool selection")
                 
-            print(f"Selected tool: {tool_name}")
+            logger.debug("Selected tool: %s", tool_name)
             self.print_chat(f'Calling tool {tool_name} with parameters {params} ', 'transient')
-            print(f"Parameters: {params}")
+            logger.debug("Parameters: %s", params)
 
             # Check if handler exists
             if tool_name not in list_handlers:
                 error_msg = f"❌ No handler found for tool '{tool_name}'"
-                print(error_msg)
+                logger.error(error_msg)
                 self.print_chat(error_msg, 'error')
                 raise ValueError(error_msg)
             
             # Check if handler is an empty string
             if list_handlers[tool_name] == '':
                 error_msg = f"❌ Handler is empty"
-                print(error_msg)
+                logger.error(error_msg)
                 self.print_chat(error_msg, 'error')
                 raise ValueError(error_msg)
                 
@@ -1986,32 +2930,37 @@ class AgentUtilities:
             parts = handler_route.split('/')
             if len(parts) != 2:
                 error_msg = f"❌ {tool_name} is not a valid tool."
-                print(error_msg)
+                logger.error(error_msg)
                 self.print_chat(error_msg, 'error')
                 raise ValueError(error_msg)
             
 
             portfolio = self.portfolio
             org = self.org
-            
+
+            # Snapshot the parsed arguments before the context keys are
+            # added below; the workspace cache stores this instead of
+            # re-parsing the same JSON string a second time.
+            tool_input_obj = dict(params) if isinstance(params, dict) else params
+
             params['_portfolio'] = self.portfolio
             params['_org'] = self.org
             params['_entity_type'] = self.entity_type
             params['_entity_id'] = self.entity_id
             params['_thread'] = self.thread
             
-            print(f'Calling {handler_route} ') 
+            logger.debug("Calling %s ", handler_route)
             
             response = self.SHC.handler_call(portfolio,org,parts[0],parts[1],params)
             
-            print(f'Handler response:{response}')
+            logger.debug("Handler response:%s", response)
 
             if not response['success']:
                 return {'success':False,'action':action,'input':params,'output':response}
 
             # The response of every handler always comes nested 
             clean_output = response['output']
-            clean_output_str = json.dumps(clean_output, cls=DecimalEncoder)
+            clean_output_str = _fast_dumps_decimal(clean_output)
             
             interface = None
             
@@ -2040,12 +2989,12 @@ class AgentUtilities:
                 
                 
             
-            print(f'flag3')
+            logger.debug("flag3")
             
             # Results coming from the handler
             self._update_context(execute_intention_results=tool_out)
             
-            print(f'flag4')
+            logger.debug("flag4")
             
             # Save handler result to workspace
             
@@ -2053,17 +3002,16 @@ class AgentUtilities:
             # Into a string like this one: "4/16:00/2026-06-04"
             # If the value of each key is not a string just output an empty space in its place
             #params_str = self.format_object_to_slash_string(params)
-            index = f'irn:tool_rs:{handler_route}' 
-            tool_input = plan['tool_calls'][0]['function']['arguments'] 
-            #input is a serialize json, you need to turn it into a python object before inserting it into the value dictionary
-            tool_input_obj = json.loads(tool_input) if isinstance(tool_input, str) else tool_input
+            index = f'irn:tool_rs:{handler_route}'
+            # tool_input_obj was captured above from the already-parsed
+            # arguments, so the payload is not decoded twice.
             value = {'input': tool_input_obj, 'output': clean_output}
             self.mutate_workspace({'cache': {index:value}})
             
-            print(f'flag5')
+            logger.debug("flag5")
             
             #print(f'message output: {tool_out}')
-            print("✅ Tool execution complete.")
+            logger.debug("✅ Tool execution complete.")
             
             return {"success": True, "action": action, "input": plan, "output": tool_out}
                     
@@ -2071,7 +3019,7 @@ class AgentUtilities:
 
             error_msg = f"❌ Execute Intention failed. @act trying to run tool:'{tool_name}': {str(e)}"
             self.print_chat(error_msg,'error') 
-            print(error_msg)
+            logger.error(error_msg)
             self._update_context(execute_intention_error=error_msg)
             
             error_result = {
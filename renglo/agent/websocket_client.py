@@ -4,9 +4,24 @@ WebSocket client wrapper that supports both AWS API Gateway and local dev WebSoc
 import json
 import boto3
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from renglo.logger import get_logger
 from typing import Dict, Any, Optional
 from decimal import Decimal
 
+# Optional Rust JSON encoder (install with the 'speed' extra); the
+# stdlib DecimalEncoder below remains the fallback.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+logger = get_logger()
+
 
 class DecimalEncoder(json.JSONEncoder):
     """JSON encoder that handles Decimal types."""
@@ -16,6 +31,24 @@ class DecimalEncoder(json.JSONEncoder):
         return super(DecimalEncoder, self).default(obj)
 
 
+def _decimal_default(obj):
+    """orjson hook mirroring DecimalEncoder's Decimal handling."""
+    if isinstance(obj, Decimal):
+        return int(obj) if obj % 1 == 0 else float(obj)
+    raise TypeError
+
+
+def _dumps_decimal(payload):
+    """
+    Serialize an outbound payload. A stdlib JSONEncoder subclass forces
+    the pure-Python encoder, so the hot path goes through orjson (which
+    only leaves Rust for the Decimal hook) when it is installed.
+    """
+    if _orjson is not None:
+        return _orjson.dumps(payload, default=_decimal_default).decode()
+    return json.dumps(payload, cls=DecimalEncoder)
+
+
 class WebSocketClient:
     """
     WebSocket client that abstracts away the differences between:
@@ -35,13 +68,15 @@ class WebSocketClient:
         self.is_local = False
         self.local_ws_url = None
         self.apigw_client = None
-        
+        self._session = None
+        self._broadcast_executor = None
+
         if not websocket_url:
             return
-        
+
         # Check if using local dev WebSocket service
         if 'localhost' in websocket_url or '127.0.0.1' in websocket_url or '0.0.0.0' in websocket_url:
-            print('Initializing local Websocket service')
+            logger.debug('Initializing local Websocket service')
             self.is_local = True
             # Convert ws:// to http:// for local service
             self.local_ws_url = websocket_url.replace('ws://', 'http://').replace('wss://', 'https://')
@@ -49,14 +84,25 @@ class WebSocketClient:
                 self.local_ws_url = f"http://{self.local_ws_url}"
             # Remove trailing slash and /ws if present
             self.local_ws_url = self.local_ws_url.rstrip('/').replace('/ws', '')
+            # Persistent session so each send_message reuses a pooled
+            # keep-alive connection instead of a fresh TCP handshake,
+            # with a short retry for transient dev-service hiccups
+            self._session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=64,
+                max_retries=Retry(total=2, backoff_factor=0.1)
+            )
+            self._session.mount('http://', adapter)
+            self._session.mount('https://', adapter)
         else:
-            print('Initializing AWS API Gateway Websocket service')
+            logger.debug('Initializing AWS API Gateway Websocket service')
             # AWS API Gateway
             self.is_local = False
             try:
                 self.apigw_client = boto3.client("apigatewaymanagementapi", endpoint_url=websocket_url)
             except Exception as e:
-                print(f"Error initializing AWS API Gateway client: {e}")
+                logger.error("Error initializing AWS API Gateway client: %s", e)
                 self.apigw_client = None
     
     def is_configured(self) -> bool:
@@ -84,7 +130,7 @@ class WebSocketClient:
             if self.is_local:
                 # Local dev WebSocket service - use HTTP POST
                 #print(f"Posting locally to: {self.local_ws_url}")
-                response = requests.post(
+                response = self._session.post(
                     f"{self.local_ws_url}",
                     json={
                         "connection_id": connection_id,
@@ -95,20 +141,20 @@ class WebSocketClient:
                 response.raise_for_status()
                 result = response.json()
                 if not result.get('ok', False):
-                    print(f'Error sending message to local WebSocket: {result.get("error", "Unknown error")}')
+                    logger.error('Error sending message to local WebSocket: %s', result.get('error', 'Unknown error'))
                     return False
             else:
                 # AWS API Gateway
-                print(f"Posting to AWS WSS")
+                logger.debug("Posting to AWS WSS")
                 self.apigw_client.post_to_connection(
                     ConnectionId=connection_id,
-                    Data=json.dumps(payload, cls=DecimalEncoder)
+                    Data=_dumps_decimal(payload)
                 )
             
             return True
             
         except requests.exceptions.RequestException as e:
-            print(f'Error sending message to local WebSocket: {str(e)}')
+            logger.error('Error sending message to local WebSocket: %s', str(e))
             return False
         except Exception as e:
             # Handle AWS API Gateway exceptions
@@ -116,8 +162,37 @@ class WebSocketClient:
                 # Check if it's a GoneException (connection closed)
                 exception_name = type(e).__name__
                 if exception_name == 'GoneException':
-                    print(f'Connection is no longer available')
+                    logger.warning('Connection is no longer available')
                     return False
-            print(f'Error sending message: {str(e)}')
+            logger.error('Error sending message: %s', str(e))
             return False
 
+    def broadcast(self, connection_ids, payload):
+        """
+        Send the same payload to many connections concurrently. Each send
+        is a network round trip, so posting them from a worker pool makes
+        a fan-out cost roughly one RTT instead of one per recipient (both
+        boto3 clients and the pooled session are thread safe).
+
+        Args:
+            connection_ids: Iterable of WebSocket connection IDs
+            payload: The message payload to send to each connection
+
+        Returns:
+            dict: connection_id -> bool result of its send_message call
+        """
+        connection_ids = [cid for cid in connection_ids if cid]
+        if not connection_ids:
+            return {}
+        if len(connection_ids) == 1:
+            cid = connection_ids[0]
+            return {cid: self.send_message(cid, payload)}
+
+        if self._broadcast_executor is None:
+            self._broadcast_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='ws-broadcast')
+        futures = {
+            cid: self._broadcast_executor.submit(self.send_message, cid, payload)
+            for cid in connection_ids
+        }
+        return {cid: future.result() for cid, future in futures.items()}
+
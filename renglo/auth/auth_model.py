@@ -1,31 +1,306 @@
 import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import boto3
+from boto3.dynamodb.conditions import Key
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from datetime import datetime
 import uuid
 from decimal import Decimal
 
+# Optional DAX client (install with the 'dax' extra); reads fall back to
+# plain DynamoDB when it is absent.
+try:
+    import amazondax as _amazondax
+except ImportError:
+    _amazondax = None
+
 logger = logging.getLogger(__name__)
 
+# Key condition builders are immutable; resolving
+# boto3.dynamodb.conditions.Key per call walks three module dicts for
+# the same object every time, so hoist the two we ever use.
+_K_INDEX = Key('index')
+_K_REL = Key('rel')
+
+
+# Module-level singletons: boto3 client construction is expensive
+# (endpoint resolution, credential chain, service model loading), so a
+# warm container reuses one resource/client per region across every
+# AuthModel instance instead of rebuilding them per request.
+_DDB_RESOURCE = None
+_TABLES = {}
+_COGNITO_CLIENTS = {}
+_SES_CLIENTS = {}
+_BOTO_LOCK = threading.Lock()
+_WARMED = False
+
+# Wider connection pool with keep-alive so concurrent handlers are not
+# serialized on the default 10 sockets, plus adaptive retries.
+_BOTO_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+)
+
+
+def _get_ddb_resource():
+    global _DDB_RESOURCE
+    if _DDB_RESOURCE is None:
+        with _BOTO_LOCK:
+            if _DDB_RESOURCE is None:
+                _DDB_RESOURCE = boto3.resource('dynamodb', config=_BOTO_CONFIG)
+    return _DDB_RESOURCE
+
+
+def _get_table(name):
+    table = _TABLES.get(name)
+    if table is None:
+        with _BOTO_LOCK:
+            table = _TABLES.get(name)
+            if table is None:
+                table = _get_ddb_resource().Table(name)
+                _TABLES[name] = table
+    return table
+
+
+_DAX_RESOURCES = {}
+_DAX_TABLES = {}
+
+
+def _get_dax_resource(endpoint, region):
+    resource = _DAX_RESOURCES.get(endpoint)
+    if resource is None:
+        with _BOTO_LOCK:
+            resource = _DAX_RESOURCES.get(endpoint)
+            if resource is None:
+                resource = _amazondax.AmazonDaxClient.resource(
+                    endpoint_url=endpoint, region_name=region
+                )
+                _DAX_RESOURCES[endpoint] = resource
+    return resource
+
+
+def _get_dax_table(endpoint, region, name):
+    key = (endpoint, name)
+    table = _DAX_TABLES.get(key)
+    if table is None:
+        with _BOTO_LOCK:
+            table = _DAX_TABLES.get(key)
+            if table is None:
+                table = _get_dax_resource(endpoint, region).Table(name)
+                _DAX_TABLES[key] = table
+    return table
+
+
+def _get_cognito_client(region):
+    client = _COGNITO_CLIENTS.get(region)
+    if client is None:
+        with _BOTO_LOCK:
+            client = _COGNITO_CLIENTS.get(region)
+            if client is None:
+                client = boto3.client('cognito-idp', region_name=region, config=_BOTO_CONFIG)
+                _COGNITO_CLIENTS[region] = client
+    return client
+
+
+def _get_ses_client(region):
+    client = _SES_CLIENTS.get(region)
+    if client is None:
+        with _BOTO_LOCK:
+            client = _SES_CLIENTS.get(region)
+            if client is None:
+                client = boto3.client('ses', region_name=region, config=_BOTO_CONFIG)
+                _SES_CLIENTS[region] = client
+    return client
+
+
+# Short-TTL read-through cache for the hot entity/rel lookups. Entries
+# expire after 30 seconds and the cache is LRU-bounded; every write path
+# in this module invalidates the keys it touches, so the TTL only limits
+# staleness from writes made by other processes. Callers get a shallow
+# copy of the outer result dict and must treat the document as
+# read-only.
+_READ_CACHE = OrderedDict()
+_READ_CACHE_LOCK = threading.Lock()
+_READ_CACHE_MAX = 4096
+_READ_CACHE_TTL = 30.0
+
+
+@lru_cache(maxsize=1)
+def _iso_for_second(epoch_s):
+    return datetime.fromtimestamp(epoch_s).isoformat()
+
+
+def _iso_now():
+    """
+    Second-granularity 'modified' timestamp. Formatting an ISO string
+    allocates a datetime and does Python-level string work per call, so
+    bulk write loops reuse the string for the current second.
+    """
+    return _iso_for_second(int(time.time()))
+
+
+def _projection_params(projection):
+    """
+    Build ProjectionExpression/ExpressionAttributeNames kwargs for an
+    optional list of attribute names. Every name is aliased so reserved
+    words ('index', 'status', ...) are safe to project.
+    """
+    if not projection:
+        return {}
+    names = {f'#a{i}': attr for i, attr in enumerate(projection)}
+    return {
+        'ProjectionExpression': ','.join(names),
+        'ExpressionAttributeNames': names,
+    }
+
+
+def _read_cache_get(key):
+    now = time.monotonic()
+    with _READ_CACHE_LOCK:
+        entry = _READ_CACHE.get(key)
+        if entry is None:
+            return None
+        if now >= entry[0]:
+            del _READ_CACHE[key]
+            return None
+        _READ_CACHE.move_to_end(key)
+        return entry[1]
+
+
+def _read_cache_put(key, value):
+    with _READ_CACHE_LOCK:
+        _READ_CACHE[key] = (time.monotonic() + _READ_CACHE_TTL, value)
+        _READ_CACHE.move_to_end(key)
+        while len(_READ_CACHE) > _READ_CACHE_MAX:
+            _READ_CACHE.popitem(last=False)
+
+
+def _read_cache_invalidate(kind, index, sort_key=None):
+    """
+    Drop cached reads touched by a write. begins_with results cannot be
+    matched to a single sort key, so any rel write also drops the
+    prefix queries cached for its index.
+    """
+    with _READ_CACHE_LOCK:
+        if sort_key is not None:
+            stale = [
+                k for k in _READ_CACHE
+                if k[0] == kind and k[1] == index and k[2] == sort_key
+            ]
+            for k in stale:
+                del _READ_CACHE[k]
+        if kind == 'rel':
+            stale = [k for k in _READ_CACHE if k[0] == 'rel_prefix' and k[1] == index]
+            for k in stale:
+                del _READ_CACHE[k]
+
+
+def _email_cache_invalidate(email):
+    """Drop the cached email->sub lookup after a user is (re)created."""
+    with _READ_CACHE_LOCK:
+        _READ_CACHE.pop(('cognito_email', email), None)
+
+
+_READ_EXECUTOR = None
+
+
+def _shared_read_executor():
+    global _READ_EXECUTOR
+    if _READ_EXECUTOR is None:
+        with _BOTO_LOCK:
+            if _READ_EXECUTOR is None:
+                _READ_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix='auth-read')
+    return _READ_EXECUTOR
+
+
+def _warm_connections(entity_table, cognito_client, user_pool_id):
+    """
+    Open the TCP/TLS connections once per process so the first real
+    request does not pay the handshake cost. Failures are harmless: the
+    warm-up calls are best effort and the real call will connect anyway.
+    """
+    global _WARMED
+    if _WARMED:
+        return
+    with _BOTO_LOCK:
+        if _WARMED:
+            return
+        _WARMED = True
+    try:
+        entity_table.load()
+    except Exception as e:
+        logger.debug('DynamoDB warm-up skipped: %s', e)
+    if user_pool_id:
+        try:
+            cognito_client.describe_user_pool(UserPoolId=user_pool_id)
+        except Exception as e:
+            logger.debug('Cognito warm-up skipped: %s', e)
+
 
 class AuthModel:
+    """
+    DynamoDB/Cognito/SES data access.
+
+    Every method returns a plain dict shaped
+    {'success', 'message', 'document', 'status'} — controllers and
+    handlers consume these with subscript access and pass them straight
+    to jsonify, so the shape is a compatibility contract. Keep new
+    methods on the same dict form rather than a tuple/dataclass record:
+    the per-response allocation difference is noise next to the network
+    round trip each method performs.
+    """
 
     def __init__(self, config=None, tid=False, ip=False):
         self.config = config or {}
-        
-        #Dynamo
-        self.dynamodb = boto3.resource('dynamodb')
+
+        #Dynamo (through DAX when an endpoint is configured and the
+        #client is installed; the Table API is the same either way)
         entity_table_name = self.config.get('DYNAMODB_ENTITY_TABLE', 'default_entity_table')
         rel_table_name = self.config.get('DYNAMODB_REL_TABLE', 'default_rel_table')
-        self.entity_table = self.dynamodb.Table(entity_table_name)
-        self.rel_table = self.dynamodb.Table(rel_table_name)
-
-        #SES
+        dax_endpoint = self.config.get('DAX_ENDPOINT')
+        if dax_endpoint and _amazondax is not None:
+            dax_region = self.config.get('DAX_REGION', 'us-east-1')
+            self.dynamodb = _get_dax_resource(dax_endpoint, dax_region)
+            self.entity_table = _get_dax_table(dax_endpoint, dax_region, entity_table_name)
+            self.rel_table = _get_dax_table(dax_endpoint, dax_region, rel_table_name)
+        else:
+            if dax_endpoint:
+                logger.warning('DAX_ENDPOINT is set but amazondax is not installed; using DynamoDB directly')
+            self.dynamodb = _get_ddb_resource()
+            self.entity_table = _get_table(entity_table_name)
+            self.rel_table = _get_table(rel_table_name)
+
+        #Cognito
         cognito_region = self.config.get('COGNITO_REGION', 'us-east-1')
-        self.cognito_client = boto3.client('cognito-idp', region_name=cognito_region) 
+        self.cognito_client = _get_cognito_client(cognito_region)
         self.USER_POOL_ID = self.config.get('COGNITO_USERPOOL_ID', '')
         self.COGNITO_APP_CLIENT_ID = self.config.get('COGNITO_APP_CLIENT_ID', '')
 
+        _warm_connections(self.entity_table, self.cognito_client, self.USER_POOL_ID)
+
+
+    def gather(self, *calls):
+        """
+        Run independent read calls concurrently and return their results
+        in call order. Handlers often issue several unrelated lookups
+        (e.g. get_entity + list_rel_prefix + check_user_by_email); each
+        is a 5-20 ms network round trip, so running them from a shared
+        worker pool makes the group cost max-of-RTTs instead of
+        sum-of-RTTs. boto3 clients are thread safe. Each argument is a
+        zero-argument callable, typically a lambda over a read method.
+        """
+        if len(calls) == 1:
+            return [calls[0]()]
+        executor = _shared_read_executor()
+        futures = [executor.submit(call) for call in calls]
+        return [future.result() for future in futures]
+
 
  #-------------------------------------------------AWS COGNITO
 
@@ -37,10 +312,45 @@ class AuthModel:
             if not email:
                 return {'success': False, 'error': 'Email is required', 'status': 400}
 
-            # List users by email filter
+            # A session resolves the same email to the same sub many
+            # times; serve repeats from the read cache instead of a
+            # ~100 ms Cognito round trip. Only positive hits are
+            # cached — a sub never changes, so stale entries are safe.
+            cache_key = ('cognito_email', email)
+            cached = _read_cache_get(cache_key)
+            if cached is not None:
+                return dict(cached)
+
+            # Fast path: pools configured with email-as-username resolve
+            # with a point lookup instead of the filtered scan behind
+            # list_users (which is also far more throttle-prone)
+            try:
+                user = self.cognito_client.admin_get_user(
+                    UserPoolId=self.USER_POOL_ID,
+                    Username=email
+                )
+                cognito_user_id = next(
+                    (attr['Value'] for attr in user['UserAttributes'] if attr['Name'] == 'sub'),
+                    None
+                )
+                if cognito_user_id:
+                    result = {
+                        "success":True,
+                        "message": "User found",
+                        "document": {'email':email,'cognito_user_id':cognito_user_id},
+                        "status" : 200
+                    }
+                    _read_cache_put(cache_key, result)
+                    return result
+            except self.cognito_client.exceptions.UserNotFoundException:
+                pass  # Username is not the email in this pool; fall back to the filter
+
+            # List users by email filter (escape quotes so the value
+            # cannot terminate the filter expression early)
             response = self.cognito_client.list_users(
                 UserPoolId=self.USER_POOL_ID,
-                Filter=f'email = "{email}"'  # Filter by email
+                Filter=f'email = "{email.replace('"', '\\"')}"',  # Filter by email
+                Limit=1  # Email is unique, so one match is all we need
             )
 
             # Check if a user was found
@@ -54,13 +364,15 @@ class AuthModel:
                 )
 
                 if cognito_user_id:
-                    return {
-                        "success":True, 
-                        "message": "User found", 
+                    result = {
+                        "success":True,
+                        "message": "User found",
                         "document": {'email':email,'cognito_user_id':cognito_user_id},
                         "status" : 200
-                    } 
-                        
+                    }
+                    _read_cache_put(cache_key, result)
+                    return result
+
             return {
                 "success":False, 
                 "message": "User not found",
@@ -106,10 +418,11 @@ class AuthModel:
                 Permanent=True  # Make the password permanent
             )
 
-            print(f"User {email} created with a permanent password.")
+            _email_cache_invalidate(email)
+            logger.info('User %s created with a permanent password', email)
 
         except Exception as e:
-            print(f"Error creating user: {str(e)}")
+            logger.error('Error creating user: %s', e)
 
 
     
@@ -124,7 +437,7 @@ class AuthModel:
                 Permanent=True  # Make the password permanent
             )
 
-            print(f"User {email} created with a permanent password.")
+            logger.info('Password made permanent for user %s', email)
             # Return success message
             return {
                 'success': True,
@@ -172,6 +485,7 @@ class AuthModel:
                 MessageAction='SUPPRESS'  # Optional: Suppresses the sending of the welcome email
             )
 
+            _email_cache_invalidate(email)
             # Return success message
             return {
                 'success': True,
@@ -248,8 +562,8 @@ class AuthModel:
 
 
     def send_email(self, sender, recipient, subject, body_text, body_html):
-        # Initialize the SES client
-        ses_client = boto3.client('ses', region_name=self.config.get('COGNITO_REGION', 'us-east-1'))  # Replace with your AWS region
+        # Shared SES client for the region
+        ses_client = _get_ses_client(self.config.get('COGNITO_REGION', 'us-east-1'))
 
         # Email details
         email_data = {
@@ -313,23 +627,33 @@ class AuthModel:
 #-------------------------------------------------MODEL/ENTITIES
 
 
-    def list_entity(self,index,limit=50,lastkey=None):
+    def list_entity(self,index,limit=50,lastkey=None,projection=None):
 
         try:
             # Build the query parameters
             query_params = {
-                'KeyConditionExpression': boto3.dynamodb.conditions.Key('index').eq(index),
+                'KeyConditionExpression': _K_INDEX.eq(index),
                 'Limit': int(limit)
             }
-            
+            query_params.update(_projection_params(projection))
+
             # Add the ExclusiveStartKey to the query parameters if provided
             if lastkey:
                 query_params['ExclusiveStartKey'] = {'index': index, 'ref': lastkey}
 
-            # Query DynamoDB to get items with the same partition key
-            response = self.entity_table.query(**query_params)
-            items = response.get('Items', [])
-            endkey = response.get('LastEvaluatedKey') # This will become the first in the next page 
+            # A single query call can stop short of Limit at the 1 MB
+            # page boundary, silently truncating the page; keep paging
+            # until the page is full or the partition is exhausted.
+            items = []
+            while True:
+                response = self.entity_table.query(**query_params)
+                items.extend(response.get('Items', []))
+                endkey = response.get('LastEvaluatedKey') # This will become the first in the next page
+                remaining = int(limit) - len(items)
+                if not endkey or remaining <= 0:
+                    break
+                query_params['Limit'] = remaining
+                query_params['ExclusiveStartKey'] = endkey
 
             documents = {
                 "items": items,
@@ -345,40 +669,79 @@ class AuthModel:
         
         except ClientError as e:
             return {
-                "success":False, 
+                "success":False,
                 "message": e.response['Error']['Message'],
                 "status" : e.response['ResponseMetadata']['HTTPStatusCode']
                 }
 
 
+    def _iter_table(self, table, index, batch, projection, where):
+        query_params = {
+            'KeyConditionExpression': _K_INDEX.eq(index),
+            'Limit': int(batch)
+        }
+        query_params.update(_projection_params(projection))
+        while True:
+            response = table.query(**query_params)
+            items = response.get('Items', [])
+            if where is not None:
+                items = filter(where, items)
+            yield from items
+            endkey = response.get('LastEvaluatedKey')
+            if not endkey:
+                break
+            query_params['ExclusiveStartKey'] = endkey
+
+
+    def iter_entity(self, index, batch=200, projection=None, where=None):
+        """
+        Lazily yield every entity in a partition, one DynamoDB page at a
+        time. Unlike list_entity this keeps at most one page in memory
+        and lets the caller consume items while later pages are still
+        unfetched. where, when given, is a predicate applied to each
+        item before it is yielded. ClientError propagates to the
+        consumer, since a generator cannot return the usual result
+        dict.
+        """
+        return self._iter_table(self.entity_table, index, batch, projection, where)
+
+
+    def iter_rel(self, index, batch=200, projection=None, where=None):
+        """Lazy counterpart of list_rel, paged like iter_entity."""
+        return self._iter_table(self.rel_table, index, batch, projection, where)
+
+
+    def get_entity(self,index,id,projection=None):
+
+        cache_key = ('entity', index, id, tuple(projection) if projection else None)
+        cached = _read_cache_get(cache_key)
+        if cached is not None:
+            return dict(cached)
 
-    def get_entity(self,index,id):
-   
         try:
-            logger.debug('INDEX:'+index)
-            logger.debug('ID:'+id)
-            response = self.entity_table.get_item(Key={'index':index,'_id':id})
+            logger.debug('INDEX:%s ID:%s', index, id)
+            response = self.entity_table.get_item(Key={'index':index,'_id':id}, **_projection_params(projection))
             item = response.get('Item')
-            logger.debug('MODEL: get_entity:')
-            logger.debug(response)
-            logger.debug('MODEL: item:')
-            logger.debug(item)
-            
+            logger.debug('MODEL: get_entity: %s', response)
+            logger.debug('MODEL: item: %s', item)
+
 
             if item:
                 #return item
-                return {
-                    "success":True, 
-                    "message": "Entity found", 
+                result = {
+                    "success":True,
+                    "message": "Entity found",
                     "document": item,
                     "status" : response['ResponseMetadata']['HTTPStatusCode']
                     }
             else:
-                return {
-                    "success":False, 
+                result = {
+                    "success":False,
                     "message": "Entity not found",
                     "status" : 404
                     }
+            _read_cache_put(cache_key, result)
+            return result
         except ClientError as e:
             return {
                 "success":False, 
@@ -387,13 +750,70 @@ class AuthModel:
                 }
         
     
+    def _batch_get(self, table, sort_attr, items, projection=None):
+        """
+        Fetch many items from one table in ceil(N/100) round trips
+        instead of N. items is a list of (index, sort-key) pairs;
+        BatchGetItem takes at most 100 keys per request and may return
+        UnprocessedKeys under throttling, which are retried.
+        """
+        items = list(dict.fromkeys(tuple(item) for item in items))  # BatchGetItem rejects duplicate keys
+        if not items:
+            return {
+                "success": True,
+                "message": "Documents found",
+                "document": [],
+                "status": 200
+                }
+
+        table_name = table.name
+        found = []
+        try:
+            for start in range(0, len(items), 100):
+                chunk = items[start:start + 100]
+                request = {
+                    table_name: {
+                        'Keys': [{'index': index, sort_attr: sort_key} for index, sort_key in chunk],
+                        **_projection_params(projection)
+                    }
+                }
+                while request:
+                    response = self.dynamodb.batch_get_item(RequestItems=request)
+                    found.extend(response.get('Responses', {}).get(table_name, []))
+                    request = response.get('UnprocessedKeys') or None
+
+            return {
+                "success": True,
+                "message": "Documents found",
+                "document": found,
+                "status": 200
+                }
+        except ClientError as e:
+            return {
+                "success": False,
+                "message": e.response['Error']['Message'],
+                "status": e.response['ResponseMetadata']['HTTPStatusCode']
+                }
+
+
+    def batch_get_entity(self, items, projection=None):
+        """Batch variant of get_entity; items is a list of (index, _id) pairs."""
+        return self._batch_get(self.entity_table, '_id', items, projection)
+
+
+    def batch_get_rel(self, items, projection=None):
+        """Batch variant of get_rel; items is a list of (index, rel) pairs."""
+        return self._batch_get(self.rel_table, 'rel', items, projection)
+
+
     def create_entity(self,data):
 
-        data['modified'] = datetime.now().isoformat()
+        data['modified'] = _iso_now()
         
         try:
             response = self.entity_table.put_item(Item=data)
-            logger.debug('MODEL: Created entity successfully:'+str(data))
+            _read_cache_invalidate('entity', data.get('index'), data.get('_id'))
+            logger.debug('MODEL: Created entity successfully: %s', data)
             return {
                 "success":True, 
                 "message": "Entity created", 
@@ -412,10 +832,11 @@ class AuthModel:
 
     def update_entity(self,data):
 
-        data['modified'] = datetime.now().isoformat()
+        data['modified'] = _iso_now()
         
         try:
             response = self.entity_table.put_item(Item=data)
+            _read_cache_invalidate('entity', data.get('index'), data.get('_id'))
             #logger.debug('MODEL: Updated entity successfully')
             return {
                 "success":True, 
@@ -443,45 +864,144 @@ class AuthModel:
 
         try:
             response = self.entity_table.delete_item(Key=keys)
-            logger.debug('MODEL: Deleted Entity:' + str(entity_document))
+            _read_cache_invalidate('entity', keys['index'], keys['_id'])
+            logger.debug('MODEL: Deleted Entity: %s', entity_document)
             return {
                 "success":True,
-                "message": "Entity deleted", 
+                "message": "Entity deleted",
                 "document": entity_document,
-                "status" : response['ResponseMetadata']['HTTPStatusCode'] 
+                "status" : response['ResponseMetadata']['HTTPStatusCode']
                 }
-        
+
         except ClientError as e:
             return {
                 "success":False,
                 "message": e.response['Error']['Message'],
-                "document": rel_document,
+                "document": entity_document,
                 "status" : e.response['ResponseMetadata']['HTTPStatusCode']
                 }
 
 
 
 
-    def get_rel(self,index,rel):
-   
+    def create_entities(self, items):
+        """
+        Bulk variant of create_entity. batch_writer chunks the puts into
+        25-item BatchWriteItem calls and retries UnprocessedItems, so a
+        bulk load costs ceil(N/25) round trips instead of N. The
+        'modified' timestamp is stamped once per batch.
+        """
+        modified = _iso_now()
+        try:
+            with self.entity_table.batch_writer(overwrite_by_pkeys=['index', '_id']) as bw:
+                for item in items:
+                    item['modified'] = modified
+                    bw.put_item(Item=item)
+                    _read_cache_invalidate('entity', item.get('index'), item.get('_id'))
+            return {
+                "success": True,
+                "message": "Entities created",
+                "document": items,
+                "status": 200
+                }
+        except ClientError as e:
+            return {
+                "success": False,
+                "message": e.response['Error']['Message'],
+                "document": items,
+                "status": e.response['ResponseMetadata']['HTTPStatusCode']
+                }
+
+
+    def delete_entities(self, keys):
+        """Bulk variant of delete_entity; keys is a list of (index, _id) pairs."""
+        try:
+            with self.entity_table.batch_writer() as bw:
+                for index, id in keys:
+                    bw.delete_item(Key={'index': index, '_id': id})
+                    _read_cache_invalidate('entity', index, id)
+            return {
+                "success": True,
+                "message": "Entities deleted",
+                "status": 200
+                }
+        except ClientError as e:
+            return {
+                "success": False,
+                "message": e.response['Error']['Message'],
+                "status": e.response['ResponseMetadata']['HTTPStatusCode']
+                }
+
+
+    def create_rels(self, items):
+        """Bulk variant of create_rel, batched like create_entities."""
+        try:
+            with self.rel_table.batch_writer(overwrite_by_pkeys=['index', 'rel']) as bw:
+                for item in items:
+                    bw.put_item(Item=item)
+                    _read_cache_invalidate('rel', item.get('index'), item.get('rel'))
+            return {
+                "success": True,
+                "message": "Rels created",
+                "document": items,
+                "status": 200
+                }
+        except ClientError as e:
+            return {
+                "success": False,
+                "message": e.response['Error']['Message'],
+                "document": items,
+                "status": e.response['ResponseMetadata']['HTTPStatusCode']
+                }
+
+
+    def delete_rels(self, keys):
+        """Bulk variant of delete_rel; keys is a list of (index, rel) pairs."""
+        try:
+            with self.rel_table.batch_writer() as bw:
+                for index, rel in keys:
+                    bw.delete_item(Key={'index': index, 'rel': rel})
+                    _read_cache_invalidate('rel', index, rel)
+            return {
+                "success": True,
+                "message": "Rels deleted",
+                "status": 200
+                }
+        except ClientError as e:
+            return {
+                "success": False,
+                "message": e.response['Error']['Message'],
+                "status": e.response['ResponseMetadata']['HTTPStatusCode']
+                }
+
+
+    def get_rel(self,index,rel,projection=None):
+
+        cache_key = ('rel', index, rel, tuple(projection) if projection else None)
+        cached = _read_cache_get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
         try:
-            response = self.rel_table.get_item(Key={'index':index,'rel':rel})
+            response = self.rel_table.get_item(Key={'index':index,'rel':rel}, **_projection_params(projection))
             item = response.get('Item')
 
             if item:
                 #return item
-                return {
-                    "success":True, 
-                    "message": "Entity found", 
+                result = {
+                    "success":True,
+                    "message": "Entity found",
                     "document": item,
                     "status" : 200
                     }
             else:
-                return {
-                    "success":False, 
+                result = {
+                    "success":False,
                     "message": "Entity not found",
                     "status" : 404
                     }
+            _read_cache_put(cache_key, result)
+            return result
         except ClientError as e:
             return {
                 "success":False, 
@@ -491,23 +1011,32 @@ class AuthModel:
         
 
     
-    def list_rel(self,index,limit=50,lastkey=None):
+    def list_rel(self,index,limit=50,lastkey=None,projection=None):
 
         try:
             # Build the query parameters
             query_params = {
-                'KeyConditionExpression': boto3.dynamodb.conditions.Key('index').eq(index),
+                'KeyConditionExpression': _K_INDEX.eq(index),
                 'Limit': int(limit)
             }
-            
+            query_params.update(_projection_params(projection))
+
             # Add the ExclusiveStartKey to the query parameters if provided
             if lastkey:
                 query_params['ExclusiveStartKey'] = {'index': index, 'ref': lastkey}
 
-            # Query DynamoDB to get items with the same partition key
-            response = self.rel_table.query(**query_params)
-            items = response.get('Items', [])
-            endkey = response.get('LastEvaluatedKey') # This will become the first in the next page 
+            # Same paging loop as list_entity: a query call may return
+            # fewer than Limit items at the 1 MB page boundary.
+            items = []
+            while True:
+                response = self.rel_table.query(**query_params)
+                items.extend(response.get('Items', []))
+                endkey = response.get('LastEvaluatedKey') # This will become the first in the next page
+                remaining = int(limit) - len(items)
+                if not endkey or remaining <= 0:
+                    break
+                query_params['Limit'] = remaining
+                query_params['ExclusiveStartKey'] = endkey
 
             documents = {
                 "items": items,
@@ -529,7 +1058,7 @@ class AuthModel:
                 }
         
 
-    def list_rel_prefix(self,partition_key_value,prefix):
+    def list_rel_prefix(self,partition_key_value,prefix,projection=None):
         
 
         if not partition_key_value or not prefix:
@@ -539,20 +1068,27 @@ class AuthModel:
                     "status" : 400
                     }
 
+        cache_key = ('rel_prefix', partition_key_value, prefix, tuple(projection) if projection else None)
+        cached = _read_cache_get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
         try:
             # Query the table with the begins_with function on the sort key
             response = self.rel_table.query(
-                KeyConditionExpression=boto3.dynamodb.conditions.Key('index').eq(partition_key_value) &
-                                    boto3.dynamodb.conditions.Key('rel').begins_with(prefix)
+                KeyConditionExpression=_K_INDEX.eq(partition_key_value) & _K_REL.begins_with(prefix),
+                **_projection_params(projection)
             )
 
-        
-            return {
-                "success":True, 
-                "message": "Documents found", 
+
+            result = {
+                "success":True,
+                "message": "Documents found",
                 "document": response['Items'],
                 "status" : response['ResponseMetadata']['HTTPStatusCode']
             }
+            _read_cache_put(cache_key, result)
+            return result
 
         except Exception as e:
             return {
@@ -570,7 +1106,8 @@ class AuthModel:
         
         try:
             response = self.rel_table.put_item(Item=rel_document)
-            logger.debug('MODEL: Created Relationship:' + str(rel_document))
+            _read_cache_invalidate('rel', rel_document.get('index'), rel_document.get('rel'))
+            logger.debug('MODEL: Created Relationship: %s', rel_document)
             return {
                 "success":True,
                 "message": "Rel created", 
@@ -597,7 +1134,8 @@ class AuthModel:
 
         try:
             response = self.rel_table.delete_item(Key=keys)
-            logger.debug('MODEL: Deleted Relationship:' + str(rel_document))
+            _read_cache_invalidate('rel', keys['index'], keys['rel'])
+            logger.debug('MODEL: Deleted Relationship: %s', rel_document)
             return {
                 "success":True,
                 "message": "Rel deleted", 
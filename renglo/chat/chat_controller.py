@@ -49,6 +49,11 @@ class ChatController:
 
         self._invocation_jwt_claims = None
 
+        # Bound once so hot paths don't re-read the config per call
+        self._websocket_url = self.config.get('WEBSOCKET_CONNECTIONS', '')
+
+        self.apigw_client = None
+
         self.CHM = ChatModel(config=self.config, tid=tid, ip=ip)
 
         
@@ -57,25 +62,17 @@ class ChatController:
 
     def error_chat(self, error, connection_id):
 
-    
-
-        try:
-
-            websocket_url = self.config.get('WEBSOCKET_CONNECTIONS', '')
+        if self.apigw_client is None:
 
-            self.apigw_client = boto3.client("apigatewaymanagementapi", endpoint_url=websocket_url)
-
-        
+            try:
 
-        except Exception as e:
+                self.apigw_client = boto3.client("apigatewaymanagementapi", endpoint_url=self._websocket_url)
 
-            print(f"Error initializing WebSocket client: {e}")
+            except Exception as e:
 
-            self.apigw_client = None
+                print(f"Error initializing WebSocket client: {e}")
 
-        
-
-     
+                self.apigw_client = None
 
         try:
 
@@ -1202,11 +1199,62 @@ class ChatController:
 
             }
 
-        
 
-        
 
-        
+    def update_turn_bulk(self, portfolio, org, entity_type, entity_id, thread_id, turn_id, updates):
+
+        """
+        Append several message documents to a turn in one backend write.
+
+        Equivalent to calling update_turn once per document (append path only,
+        no call_id replacement), but reads and stores the turn a single time so
+        N messages cost one round-trip instead of N+1.
+        """
+
+        updates = self._convert_floats_to_strings(updates)
+
+        print(f'CHC:update_turn_bulk {entity_type}/{thread_id}/{turn_id}::{len(updates)} docs')
+
+        try:
+
+            data = self.get_turn(portfolio, org, entity_type, entity_id, thread_id, turn_id)
+
+            if not data['success']:
+
+                return data
+
+            item = self._convert_floats_to_strings(data['item'])
+
+            if 'messages' not in item or not isinstance(item['messages'], list):
+
+                item['messages'] = []
+
+            for update in updates:
+
+                item['messages'].append(self._ensure_message_meta(update))
+
+            response = self.CHM.update_chat(item)
+
+            return response
+
+        except Exception as e:
+
+            self.logger.error("Error in update_turn_bulk: %s", str(e))
+            return {
+
+                "success": False,
+
+                "message": f"Error updating messages: {str(e)}",
+
+                "status": 500
+
+            }
+
+
+
+
+
+
 
     # WORKSPACE
 
@@ -1,19 +1,61 @@
 import re
 import hashlib
+import logging
 import os
-import sys
+import base64
+import json
 import importlib.util
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+
+# Environment variables merged over file-based config (env vars win).
+# This allows Lambda/production to use environment variables.
+_ENV_VAR_KEYS = (
+    'WL_NAME', 'BASE_URL', 'FE_BASE_URL', 'DOC_BASE_URL',
+    'AWS_REGION', 'API_GATEWAY_ARN', 'ROLE_ARN', 'SYS_ENV',
+    'DYNAMODB_ENTITY_TABLE', 'DYNAMODB_BLUEPRINT_TABLE', 'DYNAMODB_RINGDATA_TABLE',
+    'DYNAMODB_REL_TABLE', 'DYNAMODB_CHAT_TABLE', 'DYNAMODB_SESSION_TABLE', 'DYNAMODB_GRAPH_TABLE',
+    'DYNAMODB_SEARCH_TABLE',
+    'GRAPH_DB_ENABLED',
+    'CSRF_SESSION_KEY', 'SECRET_KEY',
+    'COGNITO_REGION', 'COGNITO_USERPOOL_ID', 'COGNITO_APP_CLIENT_ID',
+    'COGNITO_CHECK_TOKEN_EXPIRATION',
+    'PREVIEW_LAYER', 'S3_BUCKET_NAME',
+    'OPENAI_API_KEY', 'WEBSOCKET_CONNECTIONS',
+    'ALLOW_DEV_ORIGINS', 'EXTERNAL_HANDLERS',
+    'OPENSEARCH_ENDPOINT', 'OPENSEARCH_INDEX', 'OPENSEARCH_REFRESH',
+    'KB_ID', 'RAG_MODEL_ARN',
+)
+
+
+# Deletion table for every non-alphanumeric ASCII character;
+# str.translate with a precomputed table beats re.sub per call.
+_USERNAME_DELETE = {c: None for c in range(128) if not chr(c).isalnum()}
+_NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9]')
 
 
 def get_username_from_email(email):
-    # Extract the part before the @
-    username = email.split('@')[0]
-    # Remove any non-alphanumeric characters
-    cleaned_username = re.sub(r'[^a-zA-Z0-9]', '', username)
-    return cleaned_username
+    # Extract the part before the @ (stop scanning at the first one)
+    username = email.split('@', 1)[0]
+    # Remove any non-alphanumeric characters; the regex fallback keeps
+    # the old behavior for the rare non-ASCII local part
+    if username.isascii():
+        return username.translate(_USERNAME_DELETE)
+    return _NON_ALNUM_RE.sub('', username)
 
 
-def create_md5_hash(input_string, num_digits):
+def create_md5_hash(input_string, num_digits, algo='md5'):
+    # Every existing caller derives persisted IDs (user_id etc.) from
+    # the MD5 prefix, so the default algorithm must never change. New,
+    # non-identity callers can pass algo='blake2b': it is faster than
+    # MD5 in the OpenSSL backend and natively truncatable, so it hashes
+    # only the bytes it needs instead of hexdigesting 128 unused bits.
+    if algo == 'blake2b':
+        digest = hashlib.blake2b(input_string.encode('utf-8'),
+                                 digest_size=(num_digits + 1) // 2)
+        return digest.hexdigest()[:num_digits]
     # Create an MD5 hash object
     md5_hash = hashlib.md5()
     # Update the hash object with the input string encoded as bytes
@@ -24,83 +66,110 @@ def create_md5_hash(input_string, num_digits):
     return full_hash[:num_digits]
 
 
+def decode_jwt_claims(token):
+    """
+    Decode a JWT's claims without verifying the signature.
+
+    A raw base64url split is several times faster than
+    jwt.decode(..., options={'verify_signature': False}), which still
+    parses the header and runs algorithm checks. Decodes are memoized,
+    so repeating the same token within a session is near free. Never
+    use this for authentication decisions — the signature is not
+    checked.
+
+    Returns:
+        dict: The claims from the token payload (a fresh copy per call)
+    """
+    return dict(_decode_jwt_claims_cached(token))
+
+
+@lru_cache(maxsize=1024)
+def _decode_jwt_claims_cached(token):
+    payload_b64 = token.split('.')[1]
+    padded = payload_b64 + '=' * (-len(payload_b64) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded))
+
+
 def load_config():
     """
     Load configuration for handlers from env_config.py or environment variables.
-    
+
     Handlers are independent of Flask and need their own way to access config.
     This function is used by handlers in all extensions
     to load the system configuration before initializing controllers.
-    
+
     Loading Strategy:
     1. Try explicit path from RENGLO_CONFIG_PATH
     2. Try local env_config.py (for local development)
     3. Try legacy system/env_config.py locations for backwards compatibility
     4. Merge environment variables (env vars take precedence)
-    
+
+    The filesystem walk and module exec only run once per process: the
+    result is memoized, and each call returns a fresh shallow copy so
+    callers can mutate their dict without affecting others. Use
+    load_config.cache_clear() in tests to force a reload.
+
     Returns:
         dict: Configuration dictionary with all uppercase config variables
-        
+
     Usage in handlers:
         from renglo.common import load_config
-        
+
         class MyHandler:
             def __init__(self):
                 config = load_config()
                 self.DAC = DataController(config=config)
                 self.AUC = AuthController(config=config)
     """
-    config = {}
-    
-    # Try multiple paths to find env_config.py
-    possible_paths = []
+    return dict(_load_config_uncached())
+
 
+def _candidate_config_paths():
+    """
+    Yield env_config.py candidates in priority order. Lazy, so the
+    caller stops probing the filesystem at the first existing path.
+    """
     # 1. Explicit config path (preferred for headless runtimes)
     explicit_config_path = os.getenv("RENGLO_CONFIG_PATH")
     if explicit_config_path:
-        possible_paths.append(explicit_config_path)
+        yield explicit_config_path
 
-    # 2. Try relative to current working directory
-    possible_paths.append(os.path.join(os.getcwd(), "env_config.py"))
-    possible_paths.append(os.path.join(os.getcwd(), 'system', 'env_config.py'))
-    
-    # 3. Try to find workspace root by looking for marker directories
-    current_dir = os.getcwd()
+    # 2. Relative to the current working directory
+    cwd = os.getcwd()
+    yield os.path.join(cwd, "env_config.py")
+    yield os.path.join(cwd, 'system', 'env_config.py')
+
+    # 3. Climb toward the filesystem root probing for the config file
+    # directly (the old marker-directory heuristic cost extra stat
+    # calls per level without finding anything the direct probe misses)
+    current_dir = os.path.dirname(cwd)
     while current_dir != os.path.dirname(current_dir):  # Stop at filesystem root
-        if os.path.exists(os.path.join(current_dir, "env_config.py")):
-            possible_paths.append(os.path.join(current_dir, "env_config.py"))
-            break
-        if os.path.exists(os.path.join(current_dir, 'system', 'env_config.py')):
-            possible_paths.append(os.path.join(current_dir, 'system', 'env_config.py'))
-            break
-        # Look for workspace markers
-        if any(os.path.exists(os.path.join(current_dir, marker)) 
-               for marker in ['dev', 'extensions', 'console', 'system']):
-            possible_paths.append(os.path.join(current_dir, "env_config.py"))
-            possible_paths.append(os.path.join(current_dir, 'system', 'env_config.py'))
-            break
+        yield os.path.join(current_dir, "env_config.py")
+        yield os.path.join(current_dir, 'system', 'env_config.py')
         current_dir = os.path.dirname(current_dir)
-    
-    # 4. Try relative from this module's location (renglo/common.py)
+
+    # 4. Relative from this module's location (renglo/common.py)
     # Go up: renglo -> renglo-lib -> dev -> root
     renglo_lib_path = os.path.dirname(os.path.dirname(__file__))
     workspace_root = os.path.dirname(os.path.dirname(renglo_lib_path))
-    possible_paths.append(os.path.join(workspace_root, "env_config.py"))
-    possible_paths.append(os.path.join(workspace_root, 'system', 'env_config.py'))
-    
+    yield os.path.join(workspace_root, "env_config.py")
+    yield os.path.join(workspace_root, 'system', 'env_config.py')
+
+
+@lru_cache(maxsize=1)
+def _load_config_uncached():
+    config = {}
+
     env_config = None
     loaded_from = None
-    
+
+    # Load from the first candidate that exists; the generator is lazy
+    # so the stat calls stop at the first hit.
     seen_paths = set()
-    deduped_paths = []
-    for candidate in possible_paths:
-        if not candidate or candidate in seen_paths:
+    for config_path in _candidate_config_paths():
+        if config_path in seen_paths:
             continue
-        seen_paths.add(candidate)
-        deduped_paths.append(candidate)
-
-    # Try to load from each path
-    for config_path in deduped_paths:
+        seen_paths.add(config_path)
         if os.path.exists(config_path):
             try:
                 spec = importlib.util.spec_from_file_location("env_config", config_path)
@@ -109,45 +178,27 @@ def load_config():
                 loaded_from = config_path
                 break
             except Exception as e:
-                print(f"Warning: Failed to load config from {config_path}: {e}", file=sys.stderr)
+                logger.warning('Failed to load config from %s: %s', config_path, e)
                 continue
-    
+
     if env_config:
         # Extract all uppercase variables (convention for config constants)
         for key in dir(env_config):
             if key.isupper() and not key.startswith('_'):
                 config[key] = getattr(env_config, key)
-        print(f"Config loaded from file: {loaded_from}")
+        logger.info('Config loaded from file: %s', loaded_from)
     else:
-        print("Config file not found, using environment variables", file=sys.stderr)
+        logger.info('Config file not found, using environment variables')
     
     # Load from environment variables (overwrites file-based config)
-    # This allows Lambda/production to use environment variables
-    env_var_keys = [
-        'WL_NAME', 'BASE_URL', 'FE_BASE_URL', 'DOC_BASE_URL',
-        'AWS_REGION', 'API_GATEWAY_ARN', 'ROLE_ARN', 'SYS_ENV',
-        'DYNAMODB_ENTITY_TABLE', 'DYNAMODB_BLUEPRINT_TABLE', 'DYNAMODB_RINGDATA_TABLE',
-        'DYNAMODB_REL_TABLE', 'DYNAMODB_CHAT_TABLE', 'DYNAMODB_SESSION_TABLE', 'DYNAMODB_GRAPH_TABLE',
-        'DYNAMODB_SEARCH_TABLE',
-        'GRAPH_DB_ENABLED',
-        'CSRF_SESSION_KEY', 'SECRET_KEY',
-        'COGNITO_REGION', 'COGNITO_USERPOOL_ID', 'COGNITO_APP_CLIENT_ID',
-        'COGNITO_CHECK_TOKEN_EXPIRATION',
-        'PREVIEW_LAYER', 'S3_BUCKET_NAME',
-        'OPENAI_API_KEY', 'WEBSOCKET_CONNECTIONS',
-        'ALLOW_DEV_ORIGINS', 'EXTERNAL_HANDLERS',
-        'OPENSEARCH_ENDPOINT', 'OPENSEARCH_INDEX', 'OPENSEARCH_REFRESH',
-        'KB_ID', 'RAG_MODEL_ARN',
-    ]
-    
     env_loaded_count = 0
-    for key in env_var_keys:
+    for key in _ENV_VAR_KEYS:
         if key in os.environ:
             config[key] = os.environ[key]
             env_loaded_count += 1
     
     if env_loaded_count > 0:
-        print(f"Loaded {env_loaded_count} config values from environment variables")
+        logger.info('Loaded %d config values from environment variables', env_loaded_count)
     
     # Validate critical config exists
     critical_keys = ['DYNAMODB_RINGDATA_TABLE', 'DYNAMODB_ENTITY_TABLE']
@@ -159,5 +210,8 @@ def load_config():
             "Please set these as environment variables or provide env_config.py "
             "via RENGLO_CONFIG_PATH"
         )
-    
-    return config
\ No newline at end of file
+
+    return config
+
+
+load_config.cache_clear = _load_config_uncached.cache_clear
\ No newline at end of file
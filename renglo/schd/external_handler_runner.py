@@ -6,17 +6,23 @@ external handlers configured. Extension-specific information comes from
 the external_handlers_config module.
 """
 
+import atexit
+import functools
 import json
 import subprocess
 import os
+import struct
 import tempfile
 import sys
 import shlex
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 from pathlib import Path
 
 try:
     import boto3
+    from botocore.config import Config
     from botocore.exceptions import ClientError
     BOTO3_AVAILABLE = True
 except ImportError:
@@ -56,22 +62,364 @@ def _ecs_run_task_params(ecs_cfg: Dict[str, Any], overrides: Dict[str, Any]) ->
     return params
 from renglo.common import load_config
 
+# Optional Rust JSON codec (install with the 'speed' extra); it parses
+# and serializes bytes directly, skipping the str round trip stdlib
+# json forces on subprocess and Lambda payloads.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def _json_loads(data):
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps_bytes(obj) -> bytes:
+    if _orjson is not None:
+        return _orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+# Shared AWS clients keyed by (service, region). Client construction
+# loads endpoint data and parses the service model (hundreds of ms),
+# and a fresh client starts with a cold HTTPS pool — reusing one keeps
+# TLS connections alive across invocations.
+_AWS_CLIENTS: Dict[tuple, Any] = {}
+_AWS_CLIENTS_LOCK = threading.Lock()
+
+# Lambda gets a wider connection pool (concurrent invokes share the
+# client) and a tight standard retry policy; default retries on a slow
+# synchronous invoke just double the wait.
+_LAMBDA_CLIENT_CONFIG = (
+    Config(max_pool_connections=64, retries={'max_attempts': 2, 'mode': 'standard'})
+    if BOTO3_AVAILABLE else None
+)
+
+
+def _get_aws_client(service: str, region: str):
+    key = (service, region)
+    client = _AWS_CLIENTS.get(key)
+    if client is None:
+        with _AWS_CLIENTS_LOCK:
+            client = _AWS_CLIENTS.get(key)
+            if client is None:
+                kwargs: Dict[str, Any] = {'region_name': region}
+                if service == 'lambda':
+                    kwargs['config'] = _LAMBDA_CLIENT_CONFIG
+                client = boto3.client(service, **kwargs)
+                _AWS_CLIENTS[key] = client
+    return client
+
+
+# Entry script executed inside the container (warm exec or one-shot
+# run). It reads one JSON event from stdin and prints the handler's
+# JSON result to stdout, so the host never has to embed the payload in
+# a shell heredoc. It lives in a host temp dir mounted read-only at
+# /renglo-entry (NOT /package, which is the user's source tree).
+_DOCKER_ENTRY_SCRIPT = '''\
+import sys
+import json
+from datetime import datetime, date
+from decimal import Decimal
+
+# Normalize function to handle non-JSON-serializable objects
+def normalize_for_json(obj):
+    # Recursively normalize objects to be JSON-serializable.
+    if obj is None:
+        return None
+    if isinstance(obj, (str, int, float, bool)):
+        return obj
+    if isinstance(obj, Decimal):
+        return int(obj) if obj % 1 == 0 else float(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, dict):
+        return {k: normalize_for_json(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [normalize_for_json(item) for item in obj]
+    if hasattr(obj, '__dict__'):
+        return normalize_for_json(obj.__dict__)
+    # Fallback: convert to string
+    return str(obj)
+
+# Custom JSON encoder
+class UniversalEncoder(json.JSONEncoder):
+    def default(self, obj):
+        if isinstance(obj, Decimal):
+            return int(obj) if obj % 1 == 0 else float(obj)
+        if isinstance(obj, (datetime, date)):
+            return obj.isoformat()
+        if hasattr(obj, 'isoformat'):
+            return obj.isoformat()
+        return super(UniversalEncoder, self).default(obj)
+
+# Logging setup - send to stderr so it's visible
+def log(message):
+    print(message, file=sys.stderr)
+
+log("Starting handler execution in Docker container")
+
+# renglo and deps are installed in the image at /build/output (see build_lambda_package.sh)
+sys.path.insert(0, '/build/output')
+sys.path.insert(0, '/package')
+from lambda_router import lambda_handler
+
+event = json.loads(sys.stdin.read())
+
+try:
+    result = lambda_handler(event, None)
+    normalized_result = normalize_for_json(result)
+    print(json.dumps(normalized_result, indent=2, cls=UniversalEncoder))
+except Exception as e:
+    import traceback
+    log(f"ERROR: Handler execution failed (EHRC): {str(e)}")
+    log(f"Traceback: {traceback.format_exc()}")
+    error_result = {
+        'statusCode': 500,
+        'success': False,
+        'error': str(e),
+        'traceback': traceback.format_exc()
+    }
+    print(json.dumps(normalize_for_json(error_result), indent=2, cls=UniversalEncoder))
+    sys.exit(1)
+'''
+
+# Resident handler server run inside the warm container. It imports
+# lambda_handler once at startup, then loops reading length-prefixed
+# (4-byte little-endian size + JSON) events from stdin and writing
+# length-prefixed JSON responses, so a call costs a pipe round trip
+# instead of a fresh interpreter + import per exec. fd 1 is re-pointed
+# at stderr before the handler ever runs, so stray prints (even from C
+# extensions) cannot corrupt the frame stream.
+_DOCKER_SERVER_SCRIPT = '''\
+import sys
+import os
+import json
+import struct
+from datetime import datetime, date
+from decimal import Decimal
+
+# Normalize function to handle non-JSON-serializable objects
+def normalize_for_json(obj):
+    # Recursively normalize objects to be JSON-serializable.
+    if obj is None:
+        return None
+    if isinstance(obj, (str, int, float, bool)):
+        return obj
+    if isinstance(obj, Decimal):
+        return int(obj) if obj % 1 == 0 else float(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, dict):
+        return {k: normalize_for_json(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [normalize_for_json(item) for item in obj]
+    if hasattr(obj, '__dict__'):
+        return normalize_for_json(obj.__dict__)
+    # Fallback: convert to string
+    return str(obj)
+
+# Custom JSON encoder
+class UniversalEncoder(json.JSONEncoder):
+    def default(self, obj):
+        if isinstance(obj, Decimal):
+            return int(obj) if obj % 1 == 0 else float(obj)
+        if isinstance(obj, (datetime, date)):
+            return obj.isoformat()
+        if hasattr(obj, 'isoformat'):
+            return obj.isoformat()
+        return super(UniversalEncoder, self).default(obj)
+
+def log(message):
+    print(message, file=sys.stderr)
+    sys.stderr.flush()
+
+# Reserve the real stdout for the frame stream, then point fd 1 at
+# stderr so handler prints (Python or C level) go to the logs instead
+frame_out = os.fdopen(os.dup(1), 'wb')
+os.dup2(2, 1)
+sys.stdout = sys.stderr
+
+# renglo and deps are installed in the image at /build/output (see build_lambda_package.sh)
+sys.path.insert(0, '/build/output')
+sys.path.insert(0, '/package')
+from lambda_router import lambda_handler
+
+log("Handler server ready")
+
+stdin = sys.stdin.buffer
+while True:
+    header = stdin.read(4)
+    if len(header) < 4:
+        break  # host closed the pipe
+    (size,) = struct.unpack('<I', header)
+    event = json.loads(stdin.read(size))
+    try:
+        result = lambda_handler(event, None)
+        out = json.dumps(normalize_for_json(result), cls=UniversalEncoder).encode()
+    except Exception as e:
+        import traceback
+        log(f"ERROR: Handler execution failed (EHRC): {e}")
+        log(traceback.format_exc())
+        error_result = {
+            'statusCode': 500,
+            'success': False,
+            'error': str(e),
+            'traceback': traceback.format_exc()
+        }
+        out = json.dumps(normalize_for_json(error_result), cls=UniversalEncoder).encode()
+    frame_out.write(struct.pack('<I', len(out)) + out)
+    frame_out.flush()
+'''
+
+# Warm container pool: one long-lived container per
+# (extension, image, package path). Spawning a fresh `docker run --rm`
+# per call pays 1-2 s of dockerd fork + interpreter cold start that a
+# `docker exec` into a resident container avoids entirely.
+_CONTAINER_POOL: Dict[tuple, Dict[str, Any]] = {}
+_CONTAINER_POOL_LOCK = threading.Lock()
+_POOL_CLEANUP_REGISTERED = False
+
+
+@functools.lru_cache(maxsize=1)
+def _entry_script_dir() -> str:
+    """
+    Host temp dir holding handler_entry.py and handler_server.py,
+    mounted read-only at /renglo-entry inside containers. Written once
+    per process and shared by the warm pool and the one-shot fallback.
+    """
+    entry_dir = tempfile.mkdtemp(prefix='renglo-entry-')
+    with open(os.path.join(entry_dir, 'handler_entry.py'), 'w') as f:
+        f.write(_DOCKER_ENTRY_SCRIPT)
+    with open(os.path.join(entry_dir, 'handler_server.py'), 'w') as f:
+        f.write(_DOCKER_SERVER_SCRIPT)
+    return entry_dir
+
+
+def _shutdown_container_pool() -> None:
+    """Remove every pooled container; registered with atexit."""
+    with _CONTAINER_POOL_LOCK:
+        entries = list(_CONTAINER_POOL.values())
+        _CONTAINER_POOL.clear()
+    for entry in entries:
+        try:
+            subprocess.run(['docker', 'rm', '-f', entry['cid']], capture_output=True)
+        except Exception:
+            pass
+
+
+def _get_warm_container(
+    pool_key: tuple,
+    base_args: list,
+    docker_image: str,
+) -> Optional[Dict[str, Any]]:
+    """
+    Return (starting if needed) the warm container for pool_key, or None
+    if one could not be started — callers fall back to one-shot
+    `docker run`. base_args are the -v/-w/-e arguments the one-shot
+    path would use; environment is baked in at container start.
+    """
+    global _POOL_CLEANUP_REGISTERED
+
+    with _CONTAINER_POOL_LOCK:
+        entry = _CONTAINER_POOL.get(pool_key)
+    if entry is not None:
+        probe = subprocess.run(
+            ['docker', 'inspect', '-f', '{{.State.Running}}', entry['cid']],
+            capture_output=True,
+            text=True,
+        )
+        if probe.returncode == 0 and probe.stdout.strip() == 'true':
+            return entry
+        # Container died (docker restart, manual rm): drop and restart
+        with _CONTAINER_POOL_LOCK:
+            _CONTAINER_POOL.pop(pool_key, None)
+
+    run_args = (
+        ['docker', 'run', '-d', '--entrypoint', '/bin/sh']
+        + base_args
+        + ['-v', f'{_entry_script_dir()}:/renglo-entry:ro', docker_image, '-c', 'tail -f /dev/null']
+    )
+    result = subprocess.run(run_args, capture_output=True, text=True)
+    if result.returncode != 0:
+        print(f"Warning: could not start warm container: {result.stderr.strip()[:300]}", file=sys.stderr)
+        return None
+
+    entry = {'cid': result.stdout.strip(), 'lock': threading.Lock()}
+    with _CONTAINER_POOL_LOCK:
+        _CONTAINER_POOL[pool_key] = entry
+        if not _POOL_CLEANUP_REGISTERED:
+            atexit.register(_shutdown_container_pool)
+            _POOL_CLEANUP_REGISTERED = True
+    return entry
 
+
+@functools.lru_cache(maxsize=1)
 def is_running_locally() -> bool:
     """
     Determine if we're running in a local environment vs Lambda.
-    
+
+    Cached: the execution environment cannot change within a process.
+
     Returns:
         True if running locally, False if in Lambda
     """
     # Check for Lambda environment variable
     if os.getenv('AWS_LAMBDA_FUNCTION_NAME'):
         return False
-    
+
     # Default to local if we can't determine
     return True
 
 
+@functools.lru_cache(maxsize=1)
+def _workspace_root() -> Optional[str]:
+    """
+    Find the workspace root: the ancestor directory holding both
+    extensions/ and dev/. Cached — the answer cannot change within a
+    process and each probe costs two stat calls per ancestor level.
+    """
+    current = Path(__file__).resolve()
+    for parent in current.parents:
+        if (parent / "extensions").exists() and (parent / "dev").exists():
+            return str(parent)
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _docker_available() -> bool:
+    """
+    Whether the docker CLI is on PATH and answering. Cached — the probe
+    pays a full fork+exec of the docker client (~100ms) per call.
+    """
+    try:
+        subprocess.run(['docker', '--version'], capture_output=True, check=True)
+        return True
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return False
+
+
+# Images confirmed present by `docker image inspect`; positive answers
+# are stable for the life of the process, misses are re-probed because
+# the image may get built between calls
+_VERIFIED_IMAGES: set = set()
+_VERIFIED_IMAGES_LOCK = threading.Lock()
+
+
+def _image_exists(img: str) -> bool:
+    if img in _VERIFIED_IMAGES:
+        return True
+    result = subprocess.run(['docker', 'image', 'inspect', img], capture_output=True)
+    if result.returncode == 0:
+        with _VERIFIED_IMAGES_LOCK:
+            _VERIFIED_IMAGES.add(img)
+        return True
+    return False
+
+
 def use_dev_docker(extension_name: str) -> bool:
     """
     Check if the extension should use local Docker instead of Lambda.
@@ -146,6 +494,175 @@ def load_config_for_docker() -> Dict[str, Any]:
         return {}
 
 
+def _exec_via_server(entry: Dict[str, Any], event_json: bytes, workspace_root: str) -> Optional[bytes]:
+    """
+    Send one event to the container's resident handler server over
+    length-prefixed frames, starting (or restarting) the server process
+    if needed. Returns the raw response JSON bytes, or None on transport
+    failure so the caller can fall back to a one-shot exec. Must be
+    called with the entry lock held. The server's stderr is inherited,
+    so handler logs still reach the API server log.
+    """
+    proc = entry.get('proc')
+    if proc is None or proc.poll() is not None:
+        proc = subprocess.Popen(
+            ['docker', 'exec', '-i', entry['cid'], 'python3.12', '/renglo-entry/handler_server.py'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            cwd=workspace_root,
+        )
+        entry['proc'] = proc
+    try:
+        proc.stdin.write(struct.pack('<I', len(event_json)) + event_json)
+        proc.stdin.flush()
+        header = proc.stdout.read(4)
+        if len(header) < 4:
+            raise EOFError('handler server closed the stream')
+        (size,) = struct.unpack('<I', header)
+        body = proc.stdout.read(size)
+        if len(body) < size:
+            raise EOFError('short read from handler server')
+        return body
+    except Exception as e:
+        print(f"Warning: handler server transport failed, falling back to exec: {e}", file=sys.stderr)
+        try:
+            proc.kill()
+        except Exception:
+            pass
+        entry['proc'] = None
+        return None
+
+
+# Chunk size for streaming subprocess output, and the cap on how much
+# stderr we retain (a rolling tail — the interesting part of a crash)
+_STREAM_CHUNK = 1 << 16
+
+
+def _run_handler_process(args, input_data=None, cwd=None):
+    """
+    Run a handler subprocess, streaming its output instead of
+    materializing it with capture_output=True.
+
+    stdout is read in 64KB chunks into a bytearray and decoded once at
+    the end, avoiding Python-level line buffering and an eager decode of
+    multi-MB handler payloads. stderr is drained concurrently into a
+    rolling tail capped at 64KB so a chatty handler cannot grow memory
+    without bound; the tail still carries the traceback when things go
+    wrong.
+
+    Returns:
+        tuple: (returncode, stdout, stderr_tail) with the text fields decoded
+    """
+    proc = subprocess.Popen(
+        args,
+        stdin=subprocess.PIPE if input_data is not None else None,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=_STREAM_CHUNK,
+        cwd=cwd,
+    )
+
+    stderr_tail = bytearray()
+
+    def _drain_stderr():
+        while True:
+            chunk = proc.stderr.read(_STREAM_CHUNK)
+            if not chunk:
+                break
+            stderr_tail.extend(chunk)
+            if len(stderr_tail) > _STREAM_CHUNK:
+                del stderr_tail[:len(stderr_tail) - _STREAM_CHUNK]
+
+    stderr_thread = threading.Thread(target=_drain_stderr, daemon=True)
+    stderr_thread.start()
+
+    # Feed stdin from a thread: writing it all up front can deadlock if
+    # the child fills its stdout pipe before consuming its stdin
+    if input_data is not None:
+        stdin_bytes = input_data if isinstance(input_data, bytes) else input_data.encode()
+
+        def _feed_stdin():
+            try:
+                proc.stdin.write(stdin_bytes)
+                proc.stdin.close()
+            except (BrokenPipeError, OSError):
+                pass
+
+        threading.Thread(target=_feed_stdin, daemon=True).start()
+
+    stdout_buf = bytearray()
+    while True:
+        chunk = proc.stdout.read(_STREAM_CHUNK)
+        if not chunk:
+            break
+        stdout_buf.extend(chunk)
+
+    returncode = proc.wait()
+    stderr_thread.join(timeout=5)
+    return (
+        returncode,
+        bytes(stdout_buf).decode('utf-8', errors='replace'),
+        bytes(stderr_tail).decode('utf-8', errors='replace'),
+    )
+
+
+def _convert_lambda_response(json_output: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert Lambda handler response format to SchdLoader format."""
+    if json_output.get('statusCode') == 200 and json_output.get('success'):
+        return {
+            'success': True,
+            'output': json_output.get('body', {})
+        }
+    return {
+        'success': False,
+        'output': json_output.get('error') or json_output.get('body', {}),
+        'error': json_output.get('error', 'Handler execution failed (EHRP)')
+    }
+
+
+def _handler_response_from_stdout(stdout: str, stderr: str) -> Dict[str, Any]:
+    """
+    Extract the handler's JSON response from Docker stdout (which may be
+    interleaved with debug prints) and convert it to SchdLoader format.
+    """
+    # The handler may output debug messages before the JSON response, so
+    # scan stdout once with raw_decode: at each '{' either a complete
+    # object decodes (and raw_decode tells us where it ends, so we jump
+    # past it) or it doesn't (and we advance one character). The last
+    # decoded dict carrying 'statusCode' is the Lambda response. This is
+    # linear in the output size; the old heuristic re-ran json.loads on
+    # O(n) candidate suffixes, which was quadratic on log-heavy output.
+    stdout_text = stdout.strip()
+    json_output = None
+
+    decoder = json.JSONDecoder()
+    pos = 0
+    while True:
+        start = stdout_text.find('{', pos)
+        if start < 0:
+            break
+        try:
+            parsed, end = decoder.raw_decode(stdout_text, start)
+        except json.JSONDecodeError:
+            pos = start + 1
+            continue
+        if isinstance(parsed, dict) and 'statusCode' in parsed:
+            json_output = parsed
+        pos = end
+
+    if json_output:
+        return _convert_lambda_response(json_output)
+    else:
+        # Log the raw output for debugging
+        _emit_docker_logs(stdout, stderr, "Could not parse JSON from Docker output", show_stdout_first=True)
+        return {
+            'success': False,
+            'error': 'Could not parse handler output as JSON. Check server logs or response raw_stderr.',
+            'raw_output': stdout,
+            'raw_stderr': stderr
+        }
+
+
 def call_local_docker_handler(
     extension_name: str,
     handler_name: str,
@@ -172,20 +689,14 @@ def call_local_docker_handler(
             'error': f'No local configuration found for extension: {extension_name}'
         }
     
-    # Auto-detect workspace root
-    workspace_root = None
-    current = Path(__file__).resolve()
-    for parent in current.parents:
-        if (parent / "extensions").exists() and (parent / "dev").exists():
-            workspace_root = str(parent)
-            break
-    
+    # Auto-detect workspace root (cached)
+    workspace_root = _workspace_root()
     if not workspace_root:
         return {
             'success': False,
             'error': 'Could not determine workspace root'
         }
-    
+
     package_path = config['package_path']
     full_package_path = os.path.join(workspace_root, package_path)
     # Use ECS (large) image for handlers in ECS list, else Lambda (small) image
@@ -196,22 +707,13 @@ def call_local_docker_handler(
         image_latest = config['docker_image']
         image_local = f"{extension_name}-lambda-builder:local"
 
-    # Check if Docker is available
-    try:
-        subprocess.run(['docker', '--version'], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    # Check if Docker is available (cached probe)
+    if not _docker_available():
         return {
             'success': False,
             'error': 'Docker is not available or not in PATH'
         }
 
-    def _image_exists(img: str) -> bool:
-        result = subprocess.run(
-            ['docker', 'image', 'inspect', img],
-            capture_output=True,
-        )
-        return result.returncode == 0
-
     # Prefer :local if it exists (from "build --local"), else use :latest. Same as run_handler_local.sh.
     if _image_exists(image_local):
         docker_image = image_local
@@ -234,22 +736,20 @@ def call_local_docker_handler(
         'handler': handler_name,
         'payload': payload
     }
-    event_json = json.dumps(event)
+    event_json = _json_dumps_bytes(event)
     
     # Prepare AWS credentials
     aws_dir = os.path.expanduser('~/.aws')
-    docker_args = [
-        'docker', 'run', '--rm',
+    base_args = [
         '--platform', run_platform,
-        '--entrypoint', '/bin/sh',
         '-v', f'{full_package_path}:/package',
         '-w', '/package'
     ]
-    
+
     # Mount AWS credentials if available
     if os.path.isdir(aws_dir):
-        docker_args.extend(['-v', f'{aws_dir}:/root/.aws:ro'])
-    
+        base_args.extend(['-v', f'{aws_dir}:/root/.aws:ro'])
+
     # Pass AWS environment variables
     aws_env_vars = [
         'AWS_PROFILE', 'AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY',
@@ -258,248 +758,97 @@ def call_local_docker_handler(
     for env_var in aws_env_vars:
         value = os.getenv(env_var)
         if value:
-            docker_args.extend(['-e', f'{env_var}={value}'])
-    
+            base_args.extend(['-e', f'{env_var}={value}'])
+
     # Pass configuration environment variables (same as run_handler_local.sh does)
     # Load config from system/env_config.py or environment variables
     config = load_config_for_docker()
     for key, value in config.items():
         if value is not None and value != '':
             # Escape the value properly for shell
-            docker_args.extend(['-e', f'{key}={shlex.quote(str(value))}'])
-    
-    # Add image and command
-    #
-    # NOTE: We avoid f-strings with nested triple quotes here to keep the Python
-    # source valid. We build the heredoc script as a normal string and inject
-    # the JSON payload via .format().
-    python_script = """python3.12 <<'PYTHON_SCRIPT'
-import sys
-import json
-from datetime import datetime, date
-from decimal import Decimal
+            base_args.extend(['-e', f'{key}={shlex.quote(str(value))}'])
 
-# Normalize function to handle non-JSON-serializable objects
-def normalize_for_json(obj):
-    # Recursively normalize objects to be JSON-serializable.
-    if obj is None:
-        return None
-    if isinstance(obj, (str, int, float, bool)):
-        return obj
-    if isinstance(obj, Decimal):
-        return int(obj) if obj % 1 == 0 else float(obj)
-    if isinstance(obj, (datetime, date)):
-        return obj.isoformat()
-    if isinstance(obj, dict):
-        return {{k: normalize_for_json(v) for k, v in obj.items()}}
-    if isinstance(obj, (list, tuple)):
-        return [normalize_for_json(item) for item in obj]
-    if hasattr(obj, '__dict__'):
-        return normalize_for_json(obj.__dict__)
-    # Fallback: convert to string
-    return str(obj)
-
-# Custom JSON encoder
-class UniversalEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, Decimal):
-            return int(obj) if obj % 1 == 0 else float(obj)
-        if isinstance(obj, (datetime, date)):
-            return obj.isoformat()
-        if hasattr(obj, 'isoformat'):
-            return obj.isoformat()
-        return super(UniversalEncoder, self).default(obj)
-
-# Logging setup - send to stderr so it's visible
-def log(message):
-    print(message, file=sys.stderr)
-
-log("=" * 60)
-log("Starting handler execution in Docker")
-log("=" * 60)
-
-# renglo and deps are installed in the image at /build/output (see build_lambda_package.sh)
-sys.path.insert(0, '/build/output')
-sys.path.insert(0, '/package')
-from lambda_router import lambda_handler
-
-event_str = {event_json!r}
-log(f"Event received: {{event_str[:200]}}...")  # Log first 200 chars
-event = json.loads(event_str)
-
-try:
-    log("Calling lambda_handler...")
-    result = lambda_handler(event, None)
-    log("Handler execution completed")
-    
-    # Normalize the result before JSON serialization
-    normalized_result = normalize_for_json(result)
-    log("Result normalized, serializing to JSON...")
-    
-    # Use custom encoder for extra safety
-    json_output = json.dumps(normalized_result, indent=2, cls=UniversalEncoder)
-    log("JSON serialization successful")
-    
-    # Output JSON to stdout (this is what gets parsed)
-    print(json_output)
-    
-except Exception as e:
-    import traceback
-    log(f"ERROR: Handler execution failed (EHRC): {{str(e)}}")
-    log(f"Traceback: {{traceback.format_exc()}}")
-    
-    error_result = {{
-        'statusCode': 500,
-        'success': False,
-        'error': str(e),
-        'traceback': traceback.format_exc()
-    }}
-    normalized_error = normalize_for_json(error_result)
-    print(json.dumps(normalized_error, indent=2, cls=UniversalEncoder))
-    sys.exit(1)
-PYTHON_SCRIPT"""
-
-    docker_args.extend([
-        docker_image,
-        '-c',
-        python_script.format(event_json=event_json),
-    ])
-    
-    # Run Docker container
-    try:
-        result = subprocess.run(
-            docker_args,
-            capture_output=True,
-            text=True,
-            check=True,
-            cwd=workspace_root
-        )
-        _emit_docker_logs(result.stdout, result.stderr, "Docker Execution Logs")
+    # Warm path: talk to the resident handler server first (one pipe
+    # round trip, lambda_handler already imported); fall back to a
+    # per-call exec, then to a one-shot docker run
+    pool_key = (extension_name, docker_image, full_package_path)
+    entry = _get_warm_container(pool_key, base_args, docker_image)
+    if entry is not None:
+        with entry['lock']:
+            response_text = _exec_via_server(entry, event_json, workspace_root)
+        if response_text is not None:
+            try:
+                return _convert_lambda_response(_json_loads(response_text))
+            except json.JSONDecodeError as e:
+                print(f"Warning: handler server returned invalid JSON: {e}", file=sys.stderr)
 
-        # Parse output
-        # The handler may output debug messages before the JSON
-        # The JSON is typically the last complete JSON object in the output
-        stdout_text = result.stdout.strip()
-        json_output = None
-        
-        # Find the JSON by looking for a '{' that's likely the start of JSON
-        # (not a Python dict in debug output like {'key': 'value'})
-        # Strategy: Find all '{' positions and check which ones look like JSON
-        brace_positions = []
-        for i, char in enumerate(stdout_text):
-            if char == '{':
-                # Check if this looks like JSON:
-                # 1. Followed by newline and then whitespace and a quote (pretty-printed JSON)
-                # 2. Followed by whitespace and a quote (compact JSON)
-                # 3. At the start of a line (after newline)
-                looks_like_json = False
-                if i + 1 < len(stdout_text):
-                    # Check for pretty-printed JSON: {\n  "
-                    if i > 0 and stdout_text[i-1] == '\n':
-                        # This '{' is at the start of a line - likely JSON
-                        looks_like_json = True
-                    elif i + 2 < len(stdout_text):
-                        next_part = stdout_text[i+1:i+20].lstrip()
-                        # Check if followed by quote (JSON key) or newline then quote
-                        if next_part.startswith('"') or (next_part.startswith('\n') and '"' in next_part[:30]):
-                            looks_like_json = True
-                
-                if looks_like_json:
-                    brace_positions.append(i)
-        
-        # If no JSON-like braces found, fall back to finding the last '{' (JSON is usually at the end)
-        if not brace_positions:
-            last_brace = stdout_text.rfind('{')
-            if last_brace >= 0:
-                brace_positions = [last_brace]
-
-        # Try parsing from each potential JSON start position (last first: handler prints
-        # logs then the final JSON response, so the last complete object is the Lambda response)
-        for first_brace in reversed(brace_positions):
-            if first_brace >= 0:
-                # Strategy 1: Try to parse from this '{' to the end
-                json_text = stdout_text[first_brace:].strip()
-                try:
-                    parsed = json.loads(json_text)
-                    if isinstance(parsed, dict) and 'statusCode' in parsed:
-                        json_output = parsed
-                        break
-                except json.JSONDecodeError:
-                    pass
-                if json_output is not None:
-                    break
-                brace_count = 0
-                json_end = len(stdout_text)
-                for i in range(first_brace, len(stdout_text)):
-                    if stdout_text[i] == '{':
-                        brace_count += 1
-                    elif stdout_text[i] == '}':
-                        brace_count -= 1
-                        if brace_count == 0:
-                            json_end = i + 1
-                            break
-                if brace_count == 0:
-                    json_text = stdout_text[first_brace:json_end].strip()
-                    try:
-                        parsed = json.loads(json_text)
-                        if isinstance(parsed, dict) and 'statusCode' in parsed:
-                            json_output = parsed
-                            break
-                    except json.JSONDecodeError:
-                        continue
-        
-        if json_output:
-            # Convert Lambda handler response format to SchdLoader format
-            if json_output.get('statusCode') == 200 and json_output.get('success'):
-                return {
-                    'success': True,
-                    'output': json_output.get('body', {})
-                }
-            else:
-                return {
-                    'success': False,
-                    'output': json_output.get('error') or json_output.get('body', {}),
-                    'error': json_output.get('error', 'Handler execution failed (EHRP)')
-                }
-        else:
-            # Log the raw output for debugging
-            _emit_docker_logs(result.stdout, result.stderr, "Could not parse JSON from Docker output", show_stdout_first=True)
+        with entry['lock']:
+            returncode, stdout, stderr = _run_handler_process(
+                ['docker', 'exec', '-i', entry['cid'], 'python3.12', '/renglo-entry/handler_entry.py'],
+                input_data=event_json,
+                cwd=workspace_root,
+            )
+        _emit_docker_logs(stdout, stderr, "Docker Execution Logs (warm container)")
+        if returncode != 0 and not stdout.strip():
             return {
                 'success': False,
-                'error': 'Could not parse handler output as JSON. Check server logs or response raw_stderr.',
-                'raw_output': result.stdout,
-                'raw_stderr': result.stderr
+                'error': f'Docker execution failed: {(stderr or str(returncode))[:500]}',
+                'raw_output': stdout,
+                'raw_stderr': stderr
             }
+        return _handler_response_from_stdout(stdout, stderr)
 
-    except subprocess.CalledProcessError as e:
+    # Fallback: one-shot `docker run`, streaming the event over stdin to
+    # the same entry script the warm path uses. No shell heredoc: the
+    # old path repr-escaped the whole payload into argv and had /bin/sh
+    # re-parse it, which inflated large events and risked argv limits.
+    docker_args = (
+        ['docker', 'run', '--rm', '-i', '--entrypoint', 'python3.12']
+        + base_args
+        + ['-v', f'{_entry_script_dir()}:/renglo-entry:ro', docker_image, '/renglo-entry/handler_entry.py']
+    )
+
+    # Run Docker container; a handler error still prints its JSON (with
+    # statusCode 500) before exiting non-zero, so only treat an empty
+    # stdout as a hard Docker failure
+    returncode, stdout, stderr = _run_handler_process(docker_args, input_data=event_json, cwd=workspace_root)
+    if returncode != 0 and not stdout.strip():
         # Container exited non-zero: emit logs so you can see handler tracebacks/prints
-        docker_stdout = getattr(e, 'stdout', None) or getattr(e, 'output', '')
-        docker_stderr = getattr(e, 'stderr', None) or ''
-        _emit_docker_logs(docker_stdout, docker_stderr, "Docker Execution Error (container exited non-zero)")
+        _emit_docker_logs(stdout, stderr, "Docker Execution Error (container exited non-zero)")
         return {
             'success': False,
-            'error': f'Docker execution failed: {(docker_stderr or docker_stdout or str(e))[:500]}',
-            'raw_output': docker_stdout,
-            'raw_stderr': docker_stderr
+            'error': f'Docker execution failed: {(stderr or stdout or str(returncode))[:500]}',
+            'raw_output': stdout,
+            'raw_stderr': stderr
         }
+    _emit_docker_logs(stdout, stderr, "Docker Execution Logs")
+    return _handler_response_from_stdout(stdout, stderr)
 
 
 def call_lambda_handler(
     extension_name: str,
     handler_name: str,
-    payload: Dict[str, Any]
+    payload: Dict[str, Any],
+    invocation_type: str = 'RequestResponse'
 ) -> Dict[str, Any]:
     """
     Call a handler via AWS Lambda.
-    
+
     This is loosely based on test_lambda_handler.py but is extension-agnostic.
     It uses the extension's configuration to determine Lambda function name and region.
-    
+
     Args:
         extension_name: Name of the extension
         handler_name: Name of the handler to invoke
         payload: Payload to pass to the handler
-        
+        invocation_type: 'RequestResponse' (synchronous, default) or
+            'Event' (fire-and-forget). With 'Event' the caller does not
+            block on the remote function and gets back
+            {'success': True, 'status_code': ...} as soon as Lambda
+            accepts the event; use it when the handler's output is
+            discarded. Payloads over the async limit (256KB) fall back
+            to a synchronous invoke.
+
     Returns:
         Response dict with 'success', 'output', etc.
     """
@@ -519,9 +868,9 @@ def call_lambda_handler(
     function_name = config['function_name']
     region = config['region']
     
-    # Create Lambda client
+    # Get the shared Lambda client for this region
     try:
-        lambda_client = boto3.client('lambda', region_name=region)
+        lambda_client = _get_aws_client('lambda', region)
     except Exception as e:
         return {
             'success': False,
@@ -593,16 +942,33 @@ def call_lambda_handler(
         print(f"Warning: Could not check/update Lambda environment variables: {e}", file=sys.stderr)
         print("Note: Ensure Lambda function has environment variables configured via deployment (deploy_input.json)", file=sys.stderr)
     
+    event_payload = _json_dumps_bytes(event)
+
+    # Async invokes cap the payload at 256KB; above that, silently run
+    # synchronously rather than failing the call
+    if invocation_type == 'Event' and len(event_payload) > 256 * 1024:
+        print(f"Warning: payload too large for async invoke ({len(event_payload)} bytes), "
+              f"falling back to RequestResponse", file=sys.stderr)
+        invocation_type = 'RequestResponse'
+
     try:
         # Invoke the function
         response = lambda_client.invoke(
             FunctionName=function_name,
-            InvocationType='RequestResponse',  # Synchronous
-            Payload=json.dumps(event)
+            InvocationType=invocation_type,
+            Payload=event_payload
         )
-        
+
+        # Fire-and-forget: Lambda queued the event (202); there is no
+        # payload to read and the caller is not billed for our waiting
+        if invocation_type == 'Event':
+            return {
+                'success': True,
+                'status_code': response['StatusCode']
+            }
+
         # Read the response
-        response_payload = json.loads(response['Payload'].read())
+        response_payload = _json_loads(response['Payload'].read())
         
         # Check for function errors
         if 'FunctionError' in response:
@@ -663,8 +1029,8 @@ def call_ecs_handler(
     result_key = f"{result_prefix}/{request_id}.json"
     event = {'handler': handler_name, 'payload': payload}
     try:
-        s3 = boto3.client('s3', region_name=region)
-        ecs = boto3.client('ecs', region_name=region)
+        s3 = _get_aws_client('s3', region)
+        ecs = _get_aws_client('ecs', region)
         s3.put_object(
             Bucket=bucket,
             Key=payload_key,
@@ -761,8 +1127,8 @@ def call_ecs_handler_async(
     status_key = f"status/{request_id}.json"
     event = {'handler': handler_name, 'payload': payload}
     try:
-        s3 = boto3.client('s3', region_name=region)
-        ecs = boto3.client('ecs', region_name=region)
+        s3 = _get_aws_client('s3', region)
+        ecs = _get_aws_client('ecs', region)
         s3.put_object(
             Bucket=bucket,
             Key=payload_key,
@@ -827,12 +1193,7 @@ def call_local_docker_handler_batch_start(
     if not config:
         return {'success': False, 'error': f'No local Docker config for extension: {extension_name}'}
 
-    workspace_root = None
-    current = Path(__file__).resolve()
-    for parent in current.parents:
-        if (parent / "extensions").exists() and (parent / "dev").exists():
-            workspace_root = str(parent)
-            break
+    workspace_root = _workspace_root()
     if not workspace_root:
         return {'success': False, 'error': 'Could not determine workspace root'}
 
@@ -847,7 +1208,7 @@ def call_local_docker_handler_batch_start(
     event = {'handler': handler_name, 'payload': payload}
 
     try:
-        s3 = boto3.client('s3', region_name=region)
+        s3 = _get_aws_client('s3', region)
         s3.put_object(
             Bucket=bucket,
             Key=payload_key,
@@ -861,15 +1222,9 @@ def call_local_docker_handler_batch_start(
     image_latest = config.get('ecs_docker_image', f"{extension_name}-ecs-builder:latest")
     image_local = f"{extension_name}-ecs-builder:local"
 
-    try:
-        subprocess.run(['docker', '--version'], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    if not _docker_available():
         return {'success': False, 'error': 'Docker not available or not in PATH'}
 
-    def _image_exists(img: str) -> bool:
-        result = subprocess.run(['docker', 'image', 'inspect', img], capture_output=True)
-        return result.returncode == 0
-
     if _image_exists(image_local):
         docker_image = image_local
         run_platform = 'linux/arm64'
@@ -929,7 +1284,7 @@ def write_batch_payload(extension_name: str, request_id: str, event: Dict[str, A
         raise RuntimeError('No S3 config or boto3 for batch payload')
     prefix = s3_cfg.get('payload_prefix', 'payloads')
     key = f"{prefix}/{request_id}.json"
-    s3 = boto3.client('s3', region_name=s3_cfg['region'])
+    s3 = _get_aws_client('s3', s3_cfg['region'])
     s3.put_object(
         Bucket=s3_cfg['s3_bucket'],
         Key=key,
@@ -952,7 +1307,7 @@ def write_batch_result(extension_name: str, request_id: str, run_response: Dict[
     if not success and run_response.get('error'):
         body['error'] = run_response['error']
     key = f"{s3_cfg.get('result_prefix', 'results')}/{request_id}.json"
-    s3 = boto3.client('s3', region_name=s3_cfg['region'])
+    s3 = _get_aws_client('s3', s3_cfg['region'])
     s3.put_object(
         Bucket=s3_cfg['s3_bucket'],
         Key=key,
@@ -976,7 +1331,7 @@ def get_batch_result(extension_name: str, request_id: str) -> Dict[str, Any]:
     result_prefix = s3_cfg.get('result_prefix', 'results')
     result_key = f"{result_prefix}/{request_id}.json"
     try:
-        s3 = boto3.client('s3', region_name=region)
+        s3 = _get_aws_client('s3', region)
         obj = s3.get_object(Bucket=bucket, Key=result_key)
         body = json.loads(obj['Body'].read().decode())
         if body.get('statusCode') == 200 and body.get('success'):
@@ -1009,7 +1364,7 @@ def get_batch_status(extension_name: str, request_id: str) -> Dict[str, Any]:
     region = s3_cfg['region']
     status_key = f"status/{request_id}.json"
     try:
-        s3 = boto3.client('s3', region_name=region)
+        s3 = _get_aws_client('s3', region)
         obj = s3.get_object(Bucket=bucket, Key=status_key)
         body = json.loads(obj['Body'].read().decode())
         step = body.get('step')
@@ -1025,20 +1380,25 @@ def get_batch_status(extension_name: str, request_id: str) -> Dict[str, Any]:
 def run_external_handler(
     extension_name: str,
     handler_name: str,
-    payload: Dict[str, Any]
+    payload: Dict[str, Any],
+    invocation_type: str = 'RequestResponse'
     ) -> Dict[str, Any]:
     """
     Run an external handler (automatically chooses local Docker or Lambda).
-    
+
     This is the main entry point that abstracts away the choice between
     local and Lambda execution. It automatically detects the environment
     and calls the appropriate function.
-    
+
     Args:
         extension_name: Name of the extension
         handler_name: Name of the handler to run
         payload: Payload to pass to the handler
-        
+        invocation_type: 'RequestResponse' (default) or 'Event' for a
+            fire-and-forget Lambda invoke when the caller discards the
+            output. Only honored on the Lambda path; local Docker and
+            ECS runs are always synchronous.
+
     Returns:
         Response dict with 'success', 'output', etc.
     """
@@ -1062,6 +1422,47 @@ def run_external_handler(
         response = call_ecs_handler(extension_name, handler_name, payload)
     else:
         print(f'Calling external handler: {extension_name}/{handler_name} in remote lambda. Payload:{payload}')
-        response = call_lambda_handler(extension_name, handler_name, payload)
+        response = call_lambda_handler(extension_name, handler_name, payload, invocation_type=invocation_type)
     print(f'Response >> {response}')
     return response
+
+
+def run_external_handlers_batch(
+    items,
+    max_workers: int = 32
+    ) -> list:
+    """
+    Run several external handlers concurrently.
+
+    Each invocation is dominated by network RTT (Lambda) or container
+    RPC (Docker), so calling run_external_handler in a loop serializes
+    on waits; fanning out over a thread pool overlaps them instead.
+    Warm Docker containers serialize their own calls internally, so
+    concurrent requests against the same extension are safe.
+
+    Args:
+        items: Iterable of (extension_name, handler_name, payload) tuples
+        max_workers: Upper bound on concurrent invocations
+
+    Returns:
+        list: Response dicts in the same order as items; an invocation
+        that raises is reported as a {'success': False, 'error': ...} dict
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    def _run_one(args):
+        try:
+            return run_external_handler(*args)
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'External handler invocation raised: {e}'
+            }
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(items)),
+        thread_name_prefix='ext-handler',
+    ) as executor:
+        return list(executor.map(_run_one, items))